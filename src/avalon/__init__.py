@@ -1,51 +1,114 @@
-"""Avalon game engine package."""
+"""Avalon game engine package.
 
-from .config import GameConfig, MissionConfig
-from .config_loader import GameSetupConfig, load_config_file
-from .events import (
-    EventLog,
-    EventVisibility,
-    GameEvent,
-    GameEventType,
-    alignment_audience_tag,
-    player_audience_tag,
-)
-from .game_state import (
-    GamePhase,
-    GameState,
-    MissionAction,
-    MissionDecision,
-    MissionRecord,
-    MissionResult,
-    MissionSummary,
-    VoteRecord,
-)
-from .interaction import (
-    BriefingDeliveryMode,
-    BriefingOptions,
-    CLIInteraction,
-    InteractionEventType,
-    InteractionIO,
-    InteractionLogEntry,
-    InteractionResult,
-    run_interactive_game,
-)
-from .knowledge import KnowledgePacket, compute_setup_knowledge
-from .persistence import GameStateSnapshot, restore_game_state, snapshot_game_state
-from .players import AgentHook, Player, PlayerId
-from .roles import (
-    DEFAULT_ROLE_SET_BY_PLAYER_COUNT,
-    ROLE_DEFINITIONS,
-    RoleDefinition,
-    RoleTag,
-    build_role_list,
-    default_roles_for_player_count,
-    is_minion,
-    is_resistance,
-    role_alignment,
-    validate_role_selection,
-)
-from .setup import PlayerBriefing, PlayerRegistration, SetupResult, perform_setup
+Public names are imported lazily on first attribute access (PEP 562), so
+``import avalon`` and scripts that only need one submodule do not pay for
+loading the whole engine up front.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import GameConfig, MissionConfig
+    from .config_loader import GameSetupConfig, load_config_file
+    from .events import (
+        EventLog,
+        EventVisibility,
+        GameEvent,
+        GameEventType,
+        alignment_audience_tag,
+        player_audience_tag,
+    )
+    from .game_state import (
+        GamePhase,
+        GameState,
+        MissionAction,
+        MissionDecision,
+        MissionRecord,
+        MissionResult,
+        MissionSummary,
+        VoteRecord,
+    )
+    from .interaction import (
+        BriefingDeliveryMode,
+        BriefingOptions,
+        CLIInteraction,
+        InteractionEventType,
+        InteractionIO,
+        InteractionLogEntry,
+        InteractionResult,
+        run_interactive_game,
+    )
+    from .knowledge import KnowledgePacket, compute_setup_knowledge
+    from .persistence import GameStateSnapshot, restore_game_state, snapshot_game_state
+    from .players import AgentHook, Player, PlayerId
+    from .roles import (
+        DEFAULT_ROLE_SET_BY_PLAYER_COUNT,
+        ROLE_DEFINITIONS,
+        RoleDefinition,
+        RoleTag,
+        build_role_list,
+        default_roles_for_player_count,
+        is_minion,
+        is_resistance,
+        role_alignment,
+        validate_role_selection,
+    )
+    from .setup import PlayerBriefing, PlayerRegistration, SetupResult, perform_setup
+
+# Public name -> submodule that defines it
+_LAZY: dict[str, str] = {
+    "GameConfig": "config",
+    "MissionConfig": "config",
+    "GameSetupConfig": "config_loader",
+    "load_config_file": "config_loader",
+    "EventLog": "events",
+    "EventVisibility": "events",
+    "GameEvent": "events",
+    "GameEventType": "events",
+    "alignment_audience_tag": "events",
+    "player_audience_tag": "events",
+    "GamePhase": "game_state",
+    "GameState": "game_state",
+    "MissionAction": "game_state",
+    "MissionDecision": "game_state",
+    "MissionRecord": "game_state",
+    "MissionResult": "game_state",
+    "MissionSummary": "game_state",
+    "VoteRecord": "game_state",
+    "BriefingDeliveryMode": "interaction",
+    "BriefingOptions": "interaction",
+    "CLIInteraction": "interaction",
+    "InteractionEventType": "interaction",
+    "InteractionIO": "interaction",
+    "InteractionLogEntry": "interaction",
+    "InteractionResult": "interaction",
+    "run_interactive_game": "interaction",
+    "KnowledgePacket": "knowledge",
+    "compute_setup_knowledge": "knowledge",
+    "GameStateSnapshot": "persistence",
+    "restore_game_state": "persistence",
+    "snapshot_game_state": "persistence",
+    "AgentHook": "players",
+    "Player": "players",
+    "PlayerId": "players",
+    "DEFAULT_ROLE_SET_BY_PLAYER_COUNT": "roles",
+    "ROLE_DEFINITIONS": "roles",
+    "RoleDefinition": "roles",
+    "RoleTag": "roles",
+    "build_role_list": "roles",
+    "default_roles_for_player_count": "roles",
+    "is_minion": "roles",
+    "is_resistance": "roles",
+    "role_alignment": "roles",
+    "validate_role_selection": "roles",
+    "PlayerBriefing": "setup",
+    "PlayerRegistration": "setup",
+    "SetupResult": "setup",
+    "perform_setup": "setup",
+}
 
 __all__ = [
     "AgentHook",
@@ -97,3 +160,16 @@ __all__ = [
     "validate_role_selection",
     "VoteRecord",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
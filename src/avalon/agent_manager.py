@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Generator, Protocol, Sequence, cast, runtime_checkable
 
+from . import fast_agents
 from .agents import (
+    AgentDecisionMaker,
     AgentObservation,
     AssassinationGuess,
     DiscussionResponse,
     MissionAction,
+    SyncToAsyncAdapter,
     TeamProposal,
     VoteDecision,
     build_observation,
 )
+from .config import RateLimitConfig
 from .discussion import DiscussionPhase
+from .enums import Alignment, RoleType
 from .game_state import GameState
 from .players import PlayerId
 
 if TYPE_CHECKING:
     from .setup import PlayerBriefing, SetupResult
 
+# Upper bound on voters marshaled into one prompt (one full mission team)
+MAX_BATCH_VOTERS = 5
+
 
 class LLMClient(Protocol):
     """Protocol for LLM clients."""
@@ -34,6 +44,179 @@ class LLMClient(Protocol):
     ) -> DiscussionResponse: ...
 
 
+@runtime_checkable
+class AsyncLLMClient(LLMClient, Protocol):
+    """Protocol for LLM clients that also expose coroutine decision methods.
+
+    Async variants let independent agent decisions (e.g. every vote in a round)
+    be awaited concurrently instead of blocking on one network round-trip each.
+    """
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal: ...
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision: ...
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction: ...
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess: ...
+    async def amake_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse: ...
+
+
+class _TokenBucket:
+    """Continuously refilling bucket holding up to one minute of capacity.
+
+    ``available`` goes negative when callers reserve ahead of the refill.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+
+    def delay_for(self, amount: float) -> float:
+        """Refill, then return seconds until ``amount`` can be consumed."""
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+
+@dataclass
+class RateLimitedClient:
+    """LLM client wrapper that throttles concurrent async calls.
+
+    At most ``max_concurrent`` requests are in flight at once, and each request
+    draws from two token buckets (requests and estimated prompt tokens per
+    minute) before it is sent, so batched votes and multi-game runs stay under
+    provider limits. Sync calls are passed straight through; retry with
+    backoff on 429 responses remains the wrapped client's responsibility.
+    """
+
+    client: LLMClient
+    max_requests_per_minute: int = 60
+    max_tokens_per_minute: int = 150_000
+    max_concurrent: int = 5
+    estimated_tokens_per_request: int = 4_000
+    _loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _semaphore: asyncio.Semaphore | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._request_bucket = _TokenBucket(self.max_requests_per_minute)
+        self._token_bucket = _TokenBucket(self.max_tokens_per_minute)
+
+    @classmethod
+    def from_config(cls, client: LLMClient, config: RateLimitConfig) -> RateLimitedClient:
+        """Wrap ``client`` using limits loaded from a setup config file."""
+        return cls(
+            client=client,
+            max_requests_per_minute=config.max_requests_per_minute,
+            max_tokens_per_minute=config.max_tokens_per_minute,
+            max_concurrent=config.max_concurrent,
+            estimated_tokens_per_request=config.estimated_tokens_per_request,
+        )
+
+    def propose_team(self, observation: AgentObservation) -> TeamProposal:
+        return self.client.propose_team(observation)
+
+    def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return self.client.vote_on_team(observation)
+
+    def execute_mission(self, observation: AgentObservation) -> MissionAction:
+        return self.client.execute_mission(observation)
+
+    def guess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return self.client.guess_merlin(observation)
+
+    def make_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        return self.client.make_statement(observation, phase)
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal:
+        return cast(TeamProposal, await self._call("propose_team", observation))
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return cast(VoteDecision, await self._call("vote_on_team", observation))
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+        return cast(MissionAction, await self._call("execute_mission", observation))
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return cast(AssassinationGuess, await self._call("guess_merlin", observation))
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        return cast(DiscussionResponse, await self._call("make_statement", observation, phase))
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        async with self._semaphore_for_loop():
+            delay = self._reserve_capacity()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async_method = getattr(self.client, f"a{method}", None)
+            if async_method is not None:
+                return await async_method(*args)
+            return await asyncio.to_thread(getattr(self.client, method), *args)
+
+    def _reserve_capacity(self) -> float:
+        """Claim budget for one request and return how long to wait before sending.
+
+        Capacity is reserved up front (buckets may go negative), so each caller
+        sleeps exactly once until its own slot instead of re-checking in a loop.
+        This runs without awaiting, so concurrent callers cannot interleave here.
+        """
+        tokens = self.estimated_tokens_per_request
+        delay = max(
+            self._request_bucket.delay_for(1),
+            self._token_bucket.delay_for(tokens),
+        )
+        self._request_bucket.consume(1)
+        self._token_bucket.consume(tokens)
+        return delay
+
+    def _semaphore_for_loop(self) -> asyncio.Semaphore:
+        # asyncio primitives are bound to one event loop; the interaction loop
+        # starts a fresh loop for each batch, so rebuild it when that changes.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._semaphore is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+
+class _StatementsBuffer:
+    """Append-only public statement log with a reusable tuple snapshot.
+
+    Every agent decision in a phase sees the same statements, so the snapshot
+    is built once and only rebuilt after the log grows. Appends made directly
+    to the shared list by the interaction loop are detected by length.
+    """
+
+    __slots__ = ("items", "_snapshot")
+
+    def __init__(self, items: list[tuple[PlayerId, str, str]] | None = None) -> None:
+        self.items = items if items is not None else []
+        self._snapshot: tuple[tuple[PlayerId, str, str], ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def append(self, statement: tuple[PlayerId, str, str]) -> None:
+        self.items.append(statement)
+
+    def as_tuple(self) -> tuple[tuple[PlayerId, str, str], ...]:
+        if len(self._snapshot) != len(self.items):
+            self._snapshot = tuple(self.items)
+        return self._snapshot
+
+
 @dataclass
 class AgentManager:
     """Manages agent players and their LLM clients.
@@ -45,29 +228,68 @@ class AgentManager:
     briefings_by_player_id: dict[PlayerId, PlayerBriefing]
     client: LLMClient
     public_statements: list[tuple[PlayerId, str, str]] | None = None
+    # Answer propose/vote/mission/assassination with the rule-based bitmask agents in
+    # fast_agents instead of the client (self-play and evaluation runs)
+    fast_mode: bool = False
+    # Observations memoized per (player, state version); cleared whenever the state
+    # or the public statement log changes
+    _obs_cache: dict[tuple[PlayerId, int], AgentObservation] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _obs_cache_state: GameState | None = field(default=None, init=False, repr=False)
+    _obs_cache_stamp: tuple[int, int] = field(default=(-1, -1), init=False, repr=False)
+    _statements: _StatementsBuffer = field(
+        default_factory=_StatementsBuffer, init=False, repr=False
+    )
+    # Seat bitset of each player's setup knowledge; briefings never change
+    _known_minion_masks: dict[PlayerId, int] = field(default_factory=dict, init=False, repr=False)
 
     @classmethod
-    def from_setup(cls, setup_result: SetupResult, client: LLMClient) -> AgentManager:
+    def from_setup(
+        cls, setup_result: SetupResult, client: LLMClient, *, fast_mode: bool = False
+    ) -> AgentManager:
         """Create an agent manager from setup result.
 
         Args:
             setup_result: SetupResult containing player briefings.
             client: LLM client to use for all agent decisions.
+            fast_mode: Use rule-based bitmask agents for game decisions.
 
         Returns:
             AgentManager configured with briefings and client.
         """
         briefings_map = {briefing.player.player_id: briefing for briefing in setup_result.briefings}
-        return cls(briefings_by_player_id=briefings_map, client=client)
+        return cls(briefings_by_player_id=briefings_map, client=client, fast_mode=fast_mode)
 
     def set_public_statements(self, statements: list[tuple[PlayerId, str, str]]) -> None:
         """Update the public statements list reference."""
         self.public_statements = statements
 
+    @property
+    def supports_async(self) -> bool:
+        """Return True if the client implements the :class:`AsyncLLMClient` methods."""
+        return not self.fast_mode and isinstance(self.client, AsyncLLMClient)
+
+    @property
+    def supports_batch_votes(self) -> bool:
+        """Return True if the client opts in to answering several team votes per request.
+
+        A ``vote_on_team_batch`` method alone is not enough when the client also
+        sets ``batch_votes = False``, as :class:`~avalon.llm_client.BaseLLMClient`
+        does by default; its votes are then sent concurrently instead.
+        """
+        if self.fast_mode or not callable(getattr(self.client, "vote_on_team_batch", None)):
+            return False
+        return bool(getattr(self.client, "batch_votes", True))
+
+    @property
+    def supports_batch_statements(self) -> bool:
+        """Return True if the client can answer several discussion statements at once."""
+        return callable(getattr(self.client, "make_statement_batch", None))
+
     def is_agent(self, player_id: PlayerId, state: GameState) -> bool:
         """Check if a player is an agent."""
-        player = state.players_by_id.get(player_id)
-        return player is not None and player.is_agent
+        return state.is_agent(player_id)
 
     def propose_team(self, player_id: PlayerId, state: GameState) -> TeamProposal:
         """Get team proposal from agent.
@@ -79,9 +301,30 @@ class AgentManager:
         Returns:
             TeamProposal from the LLM client.
         """
+        if self.fast_mode:
+            return self._fast_propose_team(player_id, state)
         observation = self._build_observation(player_id, state)
         return self.client.propose_team(observation)
 
+    def propose_team_stream(
+        self, player_id: PlayerId, state: GameState
+    ) -> Generator[str, None, TeamProposal]:
+        """Get a team proposal, yielding its public reasoning as it is generated.
+
+        Clients with a ``propose_team_stream(observation)`` generator stream the
+        reasoning text; for any other client the whole reasoning is yielded as
+        one chunk once the proposal is made. The generator returns the proposal.
+        """
+        client_stream = getattr(self.client, "propose_team_stream", None)
+        if client_stream is not None and not self.fast_mode:
+            observation = self._build_observation(player_id, state)
+            proposal: TeamProposal = yield from client_stream(observation)
+            return proposal
+        proposal = self.propose_team(player_id, state)
+        if proposal.public_reasoning:
+            yield proposal.public_reasoning
+        return proposal
+
     def vote_on_team(self, player_id: PlayerId, state: GameState) -> VoteDecision:
         """Get vote decision from agent.
 
@@ -92,9 +335,79 @@ class AgentManager:
         Returns:
             VoteDecision from the LLM client.
         """
+        if self.fast_mode:
+            return self._fast_vote_on_team(player_id, state)
         observation = self._build_observation(player_id, state)
         return self.client.vote_on_team(observation)
 
+    async def vote_on_team_batch(
+        self, player_ids: Sequence[PlayerId], state: GameState
+    ) -> list[VoteDecision]:
+        """Get vote decisions from several agents concurrently.
+
+        Votes are simultaneous in Avalon, so every observation is built up front
+        and the client calls are awaited together. Clients without async support
+        are wrapped in :class:`SyncToAsyncAdapter`, so their blocking calls
+        overlap on worker threads.
+
+        Args:
+            player_ids: IDs of the agent voters.
+            state: Current game state.
+
+        Returns:
+            VoteDecisions in the same order as ``player_ids``.
+        """
+        observations = [self._build_observation(player_id, state) for player_id in player_ids]
+        client = self._async_client()
+        decisions = await asyncio.gather(
+            *(client.avote_on_team(observation) for observation in observations)
+        )
+        return list(decisions)
+
+    async def batch_vote_on_team(
+        self, player_ids: Sequence[PlayerId], state: GameState
+    ) -> list[VoteDecision]:
+        """Get vote decisions using as few LLM requests as possible.
+
+        Voters whose private knowledge is shared (non-Oberon minions, who see each
+        other, and resistance players without role knowledge) are sent to the
+        client's ``vote_on_team_batch`` in groups of up to ``MAX_BATCH_VOTERS``.
+        Everyone else, and every voter when the client has no batch method, gets
+        an individual vote. All requests are awaited together, batched groups on
+        worker threads and individual votes as in :meth:`vote_on_team_batch`.
+
+        Args:
+            player_ids: IDs of the agent voters.
+            state: Current game state.
+
+        Returns:
+            VoteDecisions in the same order as ``player_ids``.
+        """
+        groups: dict[str, list[AgentObservation]] = {}
+        for player_id in player_ids:
+            observation = self._build_observation(player_id, state)
+            groups.setdefault(_shared_knowledge_key(observation), []).append(observation)
+
+        batch_vote = getattr(self.client, "vote_on_team_batch", None)
+        client = self._async_client()
+
+        async def vote_chunk(chunk: list[AgentObservation]) -> list[VoteDecision]:
+            if batch_vote is not None and len(chunk) > 1:
+                return list(await asyncio.to_thread(batch_vote, chunk))
+            return list(await asyncio.gather(*(client.avote_on_team(obs) for obs in chunk)))
+
+        chunks = [
+            group[start : start + MAX_BATCH_VOTERS]
+            for group in groups.values()
+            for start in range(0, len(group), MAX_BATCH_VOTERS)
+        ]
+        results = await asyncio.gather(*(vote_chunk(chunk) for chunk in chunks))
+        decisions: dict[PlayerId, VoteDecision] = {}
+        for chunk, chunk_decisions in zip(chunks, results, strict=True):
+            for observation, decision in zip(chunk, chunk_decisions, strict=True):
+                decisions[observation.player_id] = decision
+        return [decisions[player_id] for player_id in player_ids]
+
     def execute_mission(self, player_id: PlayerId, state: GameState) -> MissionAction:
         """Get mission action from agent.
 
@@ -105,9 +418,33 @@ class AgentManager:
         Returns:
             MissionAction from the LLM client.
         """
+        if self.fast_mode:
+            return self._fast_execute_mission(player_id, state)
         observation = self._build_observation(player_id, state)
         return self.client.execute_mission(observation)
 
+    async def execute_mission_batch(
+        self, player_ids: Sequence[PlayerId], state: GameState
+    ) -> list[MissionAction]:
+        """Get mission cards from several agents concurrently.
+
+        Cards are played simultaneously and revealed together, so the client
+        calls are awaited together exactly as in :meth:`vote_on_team_batch`.
+
+        Args:
+            player_ids: IDs of the agents on the mission team.
+            state: Current game state.
+
+        Returns:
+            MissionActions in the same order as ``player_ids``.
+        """
+        observations = [self._build_observation(player_id, state) for player_id in player_ids]
+        client = self._async_client()
+        actions = await asyncio.gather(
+            *(client.aexecute_mission(observation) for observation in observations)
+        )
+        return list(actions)
+
     def guess_merlin(self, player_id: PlayerId, state: GameState) -> AssassinationGuess:
         """Get Merlin guess from agent assassin.
 
@@ -118,6 +455,8 @@ class AgentManager:
         Returns:
             AssassinationGuess from the LLM client.
         """
+        if self.fast_mode:
+            return self._fast_guess_merlin(player_id, state)
         observation = self._build_observation(player_id, state)
         return self.client.guess_merlin(observation)
 
@@ -137,12 +476,153 @@ class AgentManager:
         observation = self._build_observation(player_id, state)
         return self.client.make_statement(observation, phase)
 
-    def _build_observation(self, player_id: PlayerId, state: GameState) -> AgentObservation:
-        """Build an observation for an agent player."""
-        briefing = self.briefings_by_player_id[player_id]
-        # Pass public statements if available
-        statements_tuple = tuple(self.public_statements) if self.public_statements else ()
-        return build_observation(state, player_id, briefing.knowledge, statements_tuple)
+    def batch_make_statement(
+        self, player_ids: Sequence[PlayerId], state: GameState, phase: DiscussionPhase
+    ) -> list[DiscussionResponse]:
+        """Get simultaneous discussion statements from several agents.
+
+        All speakers see the same discussion history. Clients with a
+        ``make_statement_batch`` method answer in one call; others are asked
+        one speaker at a time.
+
+        Args:
+            player_ids: IDs of the agent speakers.
+            state: Current game state.
+            phase: Which discussion phase this is.
+
+        Returns:
+            DiscussionResponses in the same order as ``player_ids``.
+        """
+        observations = [self._build_observation(player_id, state) for player_id in player_ids]
+        batch_statement = getattr(self.client, "make_statement_batch", None)
+        if batch_statement is not None and len(observations) > 1:
+            return list(batch_statement(observations, phase))
+        return [self.client.make_statement(observation, phase) for observation in observations]
 
+    async def make_statements_concurrently(
+        self, player_ids: Sequence[PlayerId], state: GameState, phase: DiscussionPhase
+    ) -> list[DiscussionResponse]:
+        """Get simultaneous discussion statements by awaiting every speaker together.
 
-__all__ = ["AgentManager", "LLMClient"]
+        The async counterpart of :meth:`batch_make_statement` for clients without
+        a batch method: each speaker is still a separate request, but the round
+        waits for the slowest one instead of the sum of all of them.
+
+        Args:
+            player_ids: IDs of the agent speakers.
+            state: Current game state.
+            phase: Which discussion phase this is.
+
+        Returns:
+            DiscussionResponses in the same order as ``player_ids``.
+        """
+        observations = [self._build_observation(player_id, state) for player_id in player_ids]
+        client = self._async_client()
+        responses = await asyncio.gather(
+            *(client.amake_statement(observation, phase) for observation in observations)
+        )
+        return list(responses)
+
+    def observation_for(self, player_id: PlayerId, state: GameState) -> AgentObservation:
+        """Return the agent's observation of ``state``.
+
+        Repeated requests within one state version (a discussion statement and
+        then a vote, or logging a decision) return the same instance.
+        """
+        return self._build_observation(player_id, state)
+
+    def _build_observation(self, player_id: PlayerId, state: GameState) -> AgentObservation:
+        """Build an observation for an agent player.
+
+        Observations are immutable, so one built for the same state version is
+        reused across retries and repeated decisions instead of re-walking history.
+        """
+        statements = self._statements_buffer()
+        stamp = (state.version, len(statements))
+        if state is not self._obs_cache_state or stamp != self._obs_cache_stamp:
+            self._obs_cache.clear()
+            self._obs_cache_state = state
+            self._obs_cache_stamp = stamp
+        key = (player_id, state.version)
+        observation = self._obs_cache.get(key)
+        if observation is None:
+            briefing = self.briefings_by_player_id[player_id]
+            observation = build_observation(
+                state, player_id, briefing.knowledge, statements.as_tuple()
+            )
+            self._obs_cache[key] = observation
+        return observation
+
+    def _known_minion_mask(self, player_id: PlayerId, state: GameState) -> int:
+        # Setup knowledge only ever reveals minions (to Merlin and to fellow minions)
+        mask = self._known_minion_masks.get(player_id)
+        if mask is None:
+            mask = 0
+            for known_id in self.briefings_by_player_id[player_id].knowledge.visible_player_ids:
+                mask |= 1 << state.seat_of(known_id)
+            self._known_minion_masks[player_id] = mask
+        return mask
+
+    def _fast_propose_team(self, player_id: PlayerId, state: GameState) -> TeamProposal:
+        known = self._known_minion_mask(player_id, state)
+        # Minions avoid stacking known minions; resistance avoids failed teams
+        avoid = known if state.is_minion(player_id) else known | state.failed_team_mask
+        team_mask = fast_agents.pick_team(
+            state.seat_of(player_id),
+            state.required_team_size,
+            len(state.players),
+            avoid,
+        )
+        team = tuple(state.players[seat].player_id for seat in fast_agents.iter_seats(team_mask))
+        return TeamProposal(team=team)
+
+    def _fast_vote_on_team(self, player_id: PlayerId, state: GameState) -> VoteDecision:
+        known = self._known_minion_mask(player_id, state)
+        approve = fast_agents.approve_team(
+            state.current_team_mask,
+            state.seat_of(player_id),
+            state.is_minion(player_id),
+            known,
+            known | state.failed_team_mask,
+            state.consecutive_rejections,
+        )
+        return VoteDecision(approve=approve)
+
+    def _fast_execute_mission(self, player_id: PlayerId, state: GameState) -> MissionAction:
+        return MissionAction(success=fast_agents.play_success(state.is_minion(player_id)))
+
+    def _fast_guess_merlin(self, player_id: PlayerId, state: GameState) -> AssassinationGuess:
+        seat = fast_agents.guess_merlin(
+            len(state.players),
+            state.seat_of(player_id),
+            self._known_minion_mask(player_id, state),
+        )
+        return AssassinationGuess(target_id=state.players[seat].player_id)
+
+    def _async_client(self) -> AsyncLLMClient | SyncToAsyncAdapter:
+        """Return the client's coroutine surface, adapting sync clients onto threads."""
+        if isinstance(self.client, AsyncLLMClient):
+            return self.client
+        # make_statement's narrower phase type is fine: DiscussionPhase is a str Enum
+        return SyncToAsyncAdapter(cast(AgentDecisionMaker, self.client))
+
+    def _statements_buffer(self) -> _StatementsBuffer:
+        # Rebind if the public list was replaced since the buffer was made
+        if self.public_statements is None:
+            if self._statements.items:
+                self._statements = _StatementsBuffer()
+        elif self._statements.items is not self.public_statements:
+            self._statements = _StatementsBuffer(self.public_statements)
+        return self._statements
+
+
+def _shared_knowledge_key(observation: AgentObservation) -> str:
+    """Group key for voters whose private information can share one prompt."""
+    if observation.alignment is Alignment.MINION and observation.role is not RoleType.OBERON:
+        return "minion"
+    if observation.alignment is Alignment.RESISTANCE and not observation.knowledge.has_information:
+        return "resistance"
+    return f"player:{observation.player_id}"
+
+
+__all__ = ["AgentManager", "AsyncLLMClient", "LLMClient", "RateLimitedClient"]
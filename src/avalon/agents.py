@@ -2,19 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, Tuple
+from typing import Protocol, Tuple, runtime_checkable
 
 from .discussion import DiscussionStatement
 from .enums import Alignment
-from .game_state import GamePhase, MissionSummary, VoteRecord
+from .game_state import GamePhase, GameState, MissionSummary, VoteRecord
 from .knowledge import KnowledgePacket
 from .players import PlayerId
 from .roles import RoleType
 
-if TYPE_CHECKING:
-    from .game_state import GameState
-
 
 @dataclass(frozen=True, slots=True)
 class AgentObservation:
@@ -178,6 +176,71 @@ class AgentDecisionMaker(Protocol):
         ...
 
 
+@runtime_checkable
+class AsyncAgentDecisionMaker(Protocol):
+    """Coroutine counterpart of :class:`AgentDecisionMaker`.
+
+    Methods carry an ``a`` prefix so one object can offer both surfaces.
+    Independent decisions (every vote in a round) can then be awaited together
+    with ``asyncio.gather`` instead of waiting on one LLM round-trip each.
+    """
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal: ...
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision: ...
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction: ...
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess: ...
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: str
+    ) -> DiscussionResponse: ...
+
+
+@dataclass(frozen=True, slots=True)
+class SyncToAsyncAdapter:
+    """Expose a synchronous decision maker through :class:`AsyncAgentDecisionMaker`.
+
+    Each coroutine runs the wrapped blocking call on a worker thread, so several
+    can be in flight at once; the synchronous methods pass straight through.
+    """
+
+    maker: AgentDecisionMaker
+
+    def propose_team(self, observation: AgentObservation) -> TeamProposal:
+        return self.maker.propose_team(observation)
+
+    def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return self.maker.vote_on_team(observation)
+
+    def execute_mission(self, observation: AgentObservation) -> MissionAction:
+        return self.maker.execute_mission(observation)
+
+    def guess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return self.maker.guess_merlin(observation)
+
+    def make_statement(self, observation: AgentObservation, phase: str) -> DiscussionResponse:
+        return self.maker.make_statement(observation, phase)
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal:
+        return await asyncio.to_thread(self.maker.propose_team, observation)
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return await asyncio.to_thread(self.maker.vote_on_team, observation)
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+        return await asyncio.to_thread(self.maker.execute_mission, observation)
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return await asyncio.to_thread(self.maker.guess_merlin, observation)
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: str
+    ) -> DiscussionResponse:
+        return await asyncio.to_thread(self.maker.make_statement, observation, phase)
+
+
 def build_observation(
     game_state: GameState,
     player_id: PlayerId,
@@ -195,34 +258,27 @@ def build_observation(
     Returns:
         AgentObservation with filtered game context.
     """
-    from .game_state import GameState as GS
-
-    if not isinstance(game_state, GS):
+    # Caller sanity check; ``python -O`` strips it from the hot path
+    if __debug__ and not isinstance(game_state, GameState):
         raise TypeError("game_state must be a GameState instance")
 
     player = game_state.players_by_id[player_id]
-    from .roles import ROLE_DEFINITIONS
-
-    role_def = ROLE_DEFINITIONS[player.role]
-
-    # Extract player lists
-    all_ids = tuple(p.player_id for p in game_state.players)
-    all_names = tuple(p.display_name for p in game_state.players)
+    # Seat bitsets answer alignment without hashing the role enum
+    alignment = Alignment.MINION if game_state.is_minion(player_id) else Alignment.RESISTANCE
 
     # Get mission requirements
-    mission_config = game_state.config.mission_config
-    required_team_size = mission_config.team_sizes[game_state.round_number - 1]
-    required_fail_count = mission_config.required_fail_counts[game_state.round_number - 1]
+    required_team_size = game_state.required_team_size
+    required_fail_count = game_state.required_fail_count
 
     # Build observation
     return AgentObservation(
         player_id=player_id,
         display_name=player.display_name,
         role=player.role,
-        alignment=role_def.alignment,
+        alignment=alignment,
         knowledge=knowledge,
-        all_player_ids=all_ids,
-        all_player_names=all_names,
+        all_player_ids=game_state.all_player_ids,
+        all_player_names=game_state.all_player_names,
         phase=game_state.phase,
         round_number=game_state.round_number,
         attempt_number=game_state.attempt_number,
@@ -231,24 +287,14 @@ def build_observation(
         consecutive_rejections=game_state.consecutive_rejections,
         current_leader_id=game_state.current_leader.player_id,
         current_team=game_state.current_team,
-        vote_history=tuple(game_state.vote_history),
-        mission_history=tuple(record.to_public_summary() for record in game_state.mission_history),
+        vote_history=game_state.votes,
+        mission_history=game_state.public_missions,
         required_team_size=required_team_size,
         required_fail_count=required_fail_count,
         public_statements=public_statements,
         discussion_statements=game_state.all_discussion_statements,
-        # Build list of this player's private mission actions
-        my_mission_actions=tuple(
-            (
-                record.round_number,
-                record.attempt_number,
-                any(
-                    a.player_id == player_id and a.decision.name == "SUCCESS"
-                    for a in record.actions
-                ),
-            )
-            for record in game_state.mission_history
-        ),
+        # This player's private mission actions
+        my_mission_actions=game_state.mission_actions_of(player_id),
     )
 
 
@@ -256,8 +302,10 @@ __all__ = [
     "AgentDecisionMaker",
     "AgentObservation",
     "AssassinationGuess",
+    "AsyncAgentDecisionMaker",
     "DiscussionResponse",
     "MissionAction",
+    "SyncToAsyncAdapter",
     "TeamProposal",
     "VoteDecision",
     "build_observation",
@@ -0,0 +1,149 @@
+"""Shared command-line launcher for agent games."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Callable
+
+from .agent_manager import AgentManager, LLMClient, RateLimitedClient
+from .config_loader import load_config_file
+from .enums import PlayerType
+from .interaction import CLIInteraction, run_interactive_game
+from .llm_cache import DiskCachedClient
+from .logging_manager import LoggingManager
+from .mock_llm_client import MockLLMClient
+from .reporter import CLIReporter, NullReporter, Reporter
+from .setup import perform_setup
+
+NO_LLM_FLAG = "--no-llm"
+QUIET_FLAG = "--quiet"
+
+
+def run(
+    client_factory: Callable[[], LLMClient],
+    *,
+    provider: str,
+    required_env_var: str,
+    key_url: str,
+    argv: list[str] | None = None,
+) -> None:
+    """Load a config file, build agents and play one game on the console.
+
+    Args:
+        client_factory: Builds the provider's LLM client.
+        provider: Provider name shown in messages (e.g. "OpenAI").
+        required_env_var: Environment variable holding the provider API key.
+        key_url: Where users can create an API key.
+        argv: Command-line arguments; defaults to ``sys.argv``. Passing
+            ``--no-llm`` runs every agent with the deterministic rule-based
+            fast mode and skips the provider entirely; ``--quiet`` suppresses
+            status lines and the final summary (errors are still printed).
+    """
+    args = list(sys.argv if argv is None else argv)
+    script = os.path.basename(args[0]) if args else "launcher"
+    no_llm = NO_LLM_FLAG in args
+    reporter: Reporter = NullReporter() if QUIET_FLAG in args else CLIReporter()
+    positional = [arg for arg in args[1:] if arg not in (NO_LLM_FLAG, QUIET_FLAG)]
+
+    if not positional:
+        print(f"Usage: poetry run python {script} <config-file> [{NO_LLM_FLAG}] [{QUIET_FLAG}]")
+        print(f"Example: poetry run python {script} config-all-agents.yaml")
+        print()
+        print(f"Make sure to set {required_env_var} environment variable:")
+        print(f"  export {required_env_var}='your-api-key-here'")
+        print()
+        print(f"Get your API key from: {key_url}")
+        sys.exit(1)
+
+    config_path = positional[0]
+
+    if not no_llm and not os.environ.get(required_env_var):
+        print(f"ERROR: {required_env_var} environment variable not set")
+        print()
+        print(f"Set your {provider} API key:")
+        print(f"  export {required_env_var}='your-api-key-here'")
+        print()
+        print(f"Get your API key from: {key_url}")
+        sys.exit(1)
+
+    # Load configuration
+    try:
+        setup_config = load_config_file(config_path)
+    except Exception as exc:
+        print(f"Error loading config file: {exc}")
+        sys.exit(1)
+
+    # Check if any agents are configured
+    agent_count = sum(
+        1 for reg in setup_config.registrations if reg.player_type is PlayerType.AGENT
+    )
+    human_count = len(setup_config.registrations) - agent_count
+
+    reporter.message(f"\n=== Avalon Agent Game ({'rule-based' if no_llm else provider}) ===")
+    reporter.message(f"Configuration: {config_path}")
+    reporter.message(f"Players: {human_count} human, {agent_count} agent")
+    reporter.message()
+
+    agent_client: LLMClient
+    if no_llm:
+        agent_client = MockLLMClient()
+    else:
+        # Create the provider client for agents
+        try:
+            llm_client = client_factory()
+            reporter.message(f"✓ {provider} client initialized")
+            reporter.message(f"AI Model: {getattr(llm_client, 'model_name', 'unknown')}")
+        except Exception as exc:
+            print(f"Error creating {provider} client: {exc}")
+            sys.exit(1)
+
+        # Throttle concurrent agent requests if the config sets rate limits
+        agent_client = llm_client
+        if setup_config.rate_limits:
+            agent_client = RateLimitedClient.from_config(llm_client, setup_config.rate_limits)
+            reporter.message(
+                f"Rate limits: {setup_config.rate_limits.max_requests_per_minute} RPM, "
+                f"{setup_config.rate_limits.max_concurrent} concurrent"
+            )
+
+        # Record/replay decisions on disk when AVALON_LLM_CACHE=1
+        agent_client = DiskCachedClient.wrap_from_env(agent_client)
+        if isinstance(agent_client, DiskCachedClient):
+            reporter.message(f"LLM decision cache: {agent_client.path}")
+
+    # Create agent manager
+    setup = perform_setup(setup_config.game_config, setup_config.registrations)
+    agent_mgr = AgentManager.from_setup(setup, agent_client, fast_mode=no_llm)
+
+    # Create logging manager if enhanced logging is enabled
+    log_mgr = (
+        LoggingManager(enabled=setup_config.enhanced_logging)
+        if setup_config.enhanced_logging
+        else None
+    )
+    if log_mgr and log_mgr.enabled:
+        reporter.message(f"Enhanced logging enabled: {log_mgr.log_dir}")
+        reporter.message()
+
+    # Run the game
+    try:
+        result = run_interactive_game(
+            setup_config.game_config,
+            io=CLIInteraction(),
+            briefing_options=setup_config.briefing_options,
+            agent_manager=agent_mgr,
+            logging_manager=log_mgr,
+            setup=setup,
+        )
+        reporter.game_end(result)
+
+    except KeyboardInterrupt:
+        print("\n\nGame interrupted by user")
+        sys.exit(0)
+    except Exception as exc:
+        print(f"\nError during game: {exc}")
+        raise
+
+
+__all__ = ["NO_LLM_FLAG", "QUIET_FLAG", "run"]
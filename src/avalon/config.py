@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Optional, Sequence, Tuple
 
 from .discussion import DiscussionConfig
@@ -30,15 +32,43 @@ class MissionConfig:
 
     @classmethod
     def for_player_count(cls, player_count: int) -> "MissionConfig":
-        if player_count not in TEAM_SIZE_TABLE:
-            raise ConfigurationError(f"Unsupported player count: {player_count}")
-        fail_threshold = 2 if player_count >= 7 else 1
-        fail_counts = (1, 1, 1, fail_threshold, 1)
-        return cls(
-            player_count=player_count,
-            team_sizes=TEAM_SIZE_TABLE[player_count],
-            required_fail_counts=fail_counts,
-        )
+        """Return the shared (frozen) mission configuration for ``player_count``."""
+        return _mission_config_for(player_count)
+
+
+@lru_cache(maxsize=None)
+def _mission_config_for(player_count: int) -> MissionConfig:
+    # Only six player counts are valid; errors are raised, never cached
+    if player_count not in TEAM_SIZE_TABLE:
+        raise ConfigurationError(f"Unsupported player count: {player_count}")
+    fail_threshold = 2 if player_count >= 7 else 1
+    fail_counts = (1, 1, 1, fail_threshold, 1)
+    return MissionConfig(
+        player_count=player_count,
+        team_sizes=TEAM_SIZE_TABLE[player_count],
+        required_fail_counts=fail_counts,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitConfig:
+    """Throughput limits applied to concurrent LLM requests."""
+
+    max_requests_per_minute: int = 60
+    max_tokens_per_minute: int = 150_000
+    max_concurrent: int = 5
+    estimated_tokens_per_request: int = 4_000
+
+    def __post_init__(self) -> None:
+        for name in (
+            "max_requests_per_minute",
+            "max_tokens_per_minute",
+            "max_concurrent",
+            "estimated_tokens_per_request",
+        ):
+            value = getattr(self, name)
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise ConfigurationError(f"Rate limit '{name}' must be a positive integer")
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,11 +81,16 @@ class GameConfig:
     random_seed: Optional[int] = None
     discussion_config: DiscussionConfig = field(default_factory=DiscussionConfig)
     _mission_config: MissionConfig = field(init=False, repr=False)
+    _alignment_counts: Tuple[int, int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         validate_role_selection(self.player_count, self.roles)
         mission_config = MissionConfig.for_player_count(self.player_count)
         object.__setattr__(self, "_mission_config", mission_config)
+        counts = Counter(role_alignment(role) for role in self.roles)
+        object.__setattr__(
+            self, "_alignment_counts", (counts[Alignment.RESISTANCE], counts[Alignment.MINION])
+        )
 
     @property
     def mission_config(self) -> MissionConfig:
@@ -67,16 +102,13 @@ class GameConfig:
     def alignment_counts(self) -> Tuple[int, int]:
         """Return a tuple of (resistance_count, minion_count)."""
 
-        counts = self.role_alignment_counts()
-        return (counts[Alignment.RESISTANCE], counts[Alignment.MINION])
+        return self._alignment_counts
 
     def role_alignment_counts(self) -> Dict[Alignment, int]:
-        """Compute the alignment distribution for the configured roles."""
+        """Return the alignment distribution for the configured roles."""
 
-        counts = {Alignment.RESISTANCE: 0, Alignment.MINION: 0}
-        for role in self.roles:
-            counts[role_alignment(role)] += 1
-        return counts
+        resistance, minion = self._alignment_counts
+        return {Alignment.RESISTANCE: resistance, Alignment.MINION: minion}
 
     def with_roles(self, roles: Sequence[RoleType]) -> "GameConfig":
         """Return a new ``GameConfig`` with the provided role selection."""
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 import yaml
 
-from .config import GameConfig
+try:  # libyaml bindings are several times faster when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+from .config import GameConfig, RateLimitConfig
 from .enums import PlayerType, RoleType
 from .exceptions import ConfigurationError
 from .interaction import BriefingDeliveryMode, BriefingOptions
 from .roles import build_role_list
 from .setup import PlayerRegistration
 
+# Simple role names accepted under ``optional_roles``
+_ROLE_NAME_MAP: Mapping[str, RoleType] = MappingProxyType(
+    {
+        "merlin": RoleType.MERLIN,
+        "percival": RoleType.PERCIVAL,
+        "assassin": RoleType.ASSASSIN,
+        "morgana": RoleType.MORGANA,
+        "mordred": RoleType.MORDRED,
+        "oberon": RoleType.OBERON,
+        "loyal_servant": RoleType.LOYAL_SERVANT,
+        "minion": RoleType.MINION_OF_MORDRED,
+    }
+)
+_ROLE_NAMES_SORTED = ", ".join(sorted(_ROLE_NAME_MAP))
+
 
 @dataclass(frozen=True, slots=True)
 class GameSetupConfig:
@@ -24,6 +46,84 @@ class GameSetupConfig:
     registrations: tuple[PlayerRegistration, ...]
     briefing_options: BriefingOptions
     enhanced_logging: bool = False
+    rate_limits: RateLimitConfig | None = None
+
+
+def _cache_path(path: Path) -> Path:
+    return path.with_name(path.name + ".cache.json")
+
+
+def _load_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing a JSON copy written beside it when still fresh.
+
+    The cache records the source mtime and size; any edit to the YAML file makes
+    it stale. Failing to read or write the cache never fails the load.
+    """
+    stat = path.stat()
+    cache_path = _cache_path(path)
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with path.open("r") as f:
+        try:
+            data = yaml.load(f, Loader=SafeLoader)
+        except yaml.YAMLError as exc:
+            raise ConfigurationError(f"Invalid YAML file: {exc}") from exc
+
+    # Only cache documents that survive a JSON round trip unchanged
+    try:
+        payload = json.dumps({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data})
+        if json.loads(payload)["data"] == data:
+            cache_path.write_text(payload, encoding="utf-8")
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+def _parse_player(idx: int, player_entry: Any) -> PlayerRegistration:
+    """Parse one ``players`` entry (a name string or a dict with ``name``)."""
+    if isinstance(player_entry, str):
+        # Simple format: just player name (defaults to human, auto-generated ID)
+        return PlayerRegistration(display_name=player_entry, player_type=PlayerType.HUMAN)
+    if not isinstance(player_entry, dict):
+        raise ConfigurationError(
+            f"Player entry {idx + 1} must be a string or dict with 'name' field"
+        )
+
+    # Structured format: {name: "Alice", id: "alice", type: "agent"}
+    name = player_entry.get("name")
+    if not name:
+        raise ConfigurationError(f"Player entry {idx + 1} missing 'name' field")
+
+    # Extract optional player_id
+    player_id = player_entry.get("id")
+    if player_id is not None and not isinstance(player_id, str):
+        raise ConfigurationError(f"Player {name}: 'id' must be a string")
+
+    # Extract optional player type
+    type_str = player_entry.get("type", "human")
+    if not isinstance(type_str, str):
+        raise ConfigurationError(f"Player {name}: 'type' must be a string")
+
+    type_lower = type_str.lower().strip()
+    if type_lower == "human":
+        player_type = PlayerType.HUMAN
+    elif type_lower == "agent":
+        player_type = PlayerType.AGENT
+    else:
+        raise ConfigurationError(
+            f"Player {name}: invalid type '{type_str}'. Must be 'human' or 'agent'"
+        )
+
+    return PlayerRegistration(
+        display_name=str(name),
+        player_id=str(player_id) if player_id is not None else None,
+        player_type=player_type,
+    )
 
 
 def load_config_file(config_path: str | Path) -> GameSetupConfig:
@@ -43,11 +143,7 @@ def load_config_file(config_path: str | Path) -> GameSetupConfig:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with path.open("r") as f:
-        try:
-            data: dict[str, Any] = yaml.safe_load(f)
-        except yaml.YAMLError as exc:
-            raise ConfigurationError(f"Invalid YAML file: {exc}") from exc
+    data = _load_cached(path)
 
     if not isinstance(data, dict):
         raise ConfigurationError("Config file must contain a YAML mapping")
@@ -60,80 +156,24 @@ def load_config_file(config_path: str | Path) -> GameSetupConfig:
         raise ConfigurationError("'players' must be a list")
 
     # Parse player registrations - support both string format and dict format
-    registrations: list[PlayerRegistration] = []
-    for idx, player_entry in enumerate(player_data):
-        if isinstance(player_entry, str):
-            # Simple format: just player name (defaults to human, auto-generated ID)
-            registrations.append(
-                PlayerRegistration(display_name=player_entry, player_type=PlayerType.HUMAN)
-            )
-        elif isinstance(player_entry, dict):
-            # Structured format: {name: "Alice", id: "alice", type: "agent"}
-            name = player_entry.get("name")
-            if not name:
-                raise ConfigurationError(f"Player entry {idx + 1} missing 'name' field")
-
-            # Extract optional player_id
-            player_id = player_entry.get("id")
-            if player_id is not None and not isinstance(player_id, str):
-                raise ConfigurationError(f"Player {name}: 'id' must be a string")
-
-            # Extract optional player type
-            type_str = player_entry.get("type", "human")
-            if not isinstance(type_str, str):
-                raise ConfigurationError(f"Player {name}: 'type' must be a string")
-
-            type_lower = type_str.lower().strip()
-            if type_lower == "human":
-                player_type = PlayerType.HUMAN
-            elif type_lower == "agent":
-                player_type = PlayerType.AGENT
-            else:
-                raise ConfigurationError(
-                    f"Player {name}: invalid type '{type_str}'. Must be 'human' or 'agent'"
-                )
-
-            registrations.append(
-                PlayerRegistration(
-                    display_name=str(name),
-                    player_id=str(player_id) if player_id is not None else None,
-                    player_type=player_type,
-                )
-            )
-        else:
-            raise ConfigurationError(
-                f"Player entry {idx + 1} must be a string or dict with 'name' field"
-            )
-
-    player_count = len(registrations)
-    registrations_tuple = tuple(registrations)
+    registrations_tuple = tuple(
+        [_parse_player(idx, player_entry) for idx, player_entry in enumerate(player_data)]
+    )
+    player_count = len(registrations_tuple)
 
     # Parse optional special roles
     optional_roles_raw = data.get("optional_roles", [])
     if not isinstance(optional_roles_raw, list):
         raise ConfigurationError("'optional_roles' must be a list")
 
-    # Map simple names to RoleType enum
-    role_name_map = {
-        "merlin": RoleType.MERLIN,
-        "percival": RoleType.PERCIVAL,
-        "assassin": RoleType.ASSASSIN,
-        "morgana": RoleType.MORGANA,
-        "mordred": RoleType.MORDRED,
-        "oberon": RoleType.OBERON,
-        "loyal_servant": RoleType.LOYAL_SERVANT,
-        "minion": RoleType.MINION_OF_MORDRED,
-    }
-
     optional_roles: list[RoleType] = []
     for role_name in optional_roles_raw:
-        role_key = str(role_name).lower().strip()
-        if role_key not in role_name_map:
+        role_type = _ROLE_NAME_MAP.get(str(role_name).strip().lower())
+        if role_type is None:
             raise ConfigurationError(
-                f"Unknown role type: {role_name}. "
-                f"Available: {', '.join(sorted(role_name_map.keys()))}"
+                f"Unknown role type: {role_name}. Available: {_ROLE_NAMES_SORTED}"
             )
-        optional_roles.append(role_name_map[role_key])
+        optional_roles.append(role_type)
 
     # Build role list
     roles = build_role_list(player_count, optional_roles=optional_roles if optional_roles else None)
@@ -179,6 +219,17 @@ def load_config_file(config_path: str | Path) -> GameSetupConfig:
     if not isinstance(enhanced_logging, bool):
         raise ConfigurationError("'enhanced_logging' must be true or false")
 
+    # Parse optional LLM rate limits
+    rate_limits: RateLimitConfig | None = None
+    rate_limit_data = data.get("rate_limits")
+    if rate_limit_data is not None:
+        if not isinstance(rate_limit_data, dict):
+            raise ConfigurationError("'rate_limits' must be a mapping")
+        try:
+            rate_limits = RateLimitConfig(**rate_limit_data)
+        except TypeError as exc:
+            raise ConfigurationError(f"Invalid 'rate_limits' option: {exc}") from exc
+
     game_config = GameConfig(
         player_count=player_count,
         roles=roles,
@@ -191,4 +242,5 @@ def load_config_file(config_path: str | Path) -> GameSetupConfig:
         registrations=registrations_tuple,
         briefing_options=briefing_options,
         enhanced_logging=enhanced_logging,
+        rate_limits=rate_limits,
     )
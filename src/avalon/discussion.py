@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Tuple
+from typing import KeysView, Tuple
 
 from .players import PlayerId
 
@@ -52,9 +52,13 @@ class DiscussionConfig:
     max_statements_per_phase: int | None = 1
     # Allow players to pass/skip their turn
     allow_pass: bool = True
+    # Request every agent's statement for a round up front, from the same history,
+    # so batch-capable clients answer them together. Agents then cannot react to
+    # statements made earlier in the same round.
+    simultaneous_agent_statements: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscussionRound:
     """A complete discussion round within a specific phase.
 
@@ -65,21 +69,30 @@ class DiscussionRound:
     attempt_number: int
     phase: DiscussionPhase
     statements: list[DiscussionStatement] = field(default_factory=list)
-    # Track which players have spoken (for turn management)
-    participants: set[PlayerId] = field(default_factory=set)
+    # Per-speaker index of ``statements`` (also tracks who has spoken)
+    by_speaker: dict[PlayerId, list[DiscussionStatement]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for statement in self.statements:
+            self.by_speaker.setdefault(statement.speaker_id, []).append(statement)
+
+    @property
+    def participants(self) -> KeysView[PlayerId]:
+        """Return the players who have spoken in this round."""
+        return self.by_speaker.keys()
 
     def add_statement(self, statement: DiscussionStatement) -> None:
         """Add a statement to this discussion round."""
         self.statements.append(statement)
-        self.participants.add(statement.speaker_id)
+        self.by_speaker.setdefault(statement.speaker_id, []).append(statement)
 
     def get_statements_by_player(self, player_id: PlayerId) -> list[DiscussionStatement]:
         """Get all statements made by a specific player in this round."""
-        return [s for s in self.statements if s.speaker_id == player_id]
+        return list(self.by_speaker.get(player_id, ()))
 
     def has_spoken(self, player_id: PlayerId) -> bool:
         """Check if a player has made any statements in this round."""
-        return player_id in self.participants
+        return player_id in self.by_speaker
 
     def to_tuple(self) -> Tuple[DiscussionStatement, ...]:
         """Return statements as immutable tuple."""
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence, Tuple, Union, cast
 
+from . import json_codec
+
 if TYPE_CHECKING:  # pragma: no cover - import only for type hints
     from .enums import Alignment
 
@@ -32,6 +35,13 @@ class EventVisibility(str, Enum):
     PRIVATE = "private"
 
 
+# ``Enum.__call__`` and ``.value`` are both Python-level; serialisation reads the
+# plain ``_value_`` attribute and decoding goes through these prebuilt maps.
+_EVENT_TYPE_BY_VALUE: dict[str, GameEventType] = {m._value_: m for m in GameEventType}
+_VISIBILITY_BY_VALUE: dict[str, EventVisibility] = {m._value_: m for m in EventVisibility}
+_parse_timestamp = datetime.fromisoformat
+
+
 @dataclass(frozen=True, slots=True)
 class GameEvent:
     """Immutable event record captured during play."""
@@ -41,38 +51,74 @@ class GameEvent:
     payload: Mapping[str, Any] = field(default_factory=dict)
     visibility: EventVisibility = EventVisibility.PUBLIC
     audience: Tuple[str, ...] = field(default_factory=tuple)
+    # Compact JSON line, encoded on first use; events never change once recorded
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalise once so to_json can encode the stored containers directly
+        if type(self.payload) is not dict:
+            object.__setattr__(self, "payload", dict(self.payload))
+        if type(self.audience) is not tuple:
+            object.__setattr__(self, "audience", tuple(self.audience))
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert the event into a JSON-serialisable dictionary."""
+        """Convert the event into a JSON-serialisable dictionary.
+
+        ``payload`` and ``audience`` are fresh copies, so callers may edit them.
+        """
 
         return {
             "timestamp": self.timestamp.isoformat(),
-            "type": self.type.value,
+            "type": self.type._value_,
             "payload": dict(self.payload),
-            "visibility": self.visibility.value,
+            "visibility": self.visibility._value_,
             "audience": list(self.audience),
         }
 
+    def to_json(self) -> str:
+        """Return the event as one compact JSON line, encoding it only once."""
+
+        encoded = self._json
+        if encoded is None:
+            # Encoded straight from the stored containers; nothing else sees them
+            encoded = json_codec.dumps_compact(
+                {
+                    "timestamp": self.timestamp.isoformat(),
+                    "type": self.type._value_,
+                    "payload": self.payload,
+                    "visibility": self.visibility._value_,
+                    "audience": self.audience,
+                }
+            )
+            object.__setattr__(self, "_json", encoded)
+        return encoded
+
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "GameEvent":
         """Reconstruct an event from a dictionary produced by :meth:`to_dict`."""
 
+        return cls._decode(data, owned=False)
+
+    @classmethod
+    def _decode(cls, data: Mapping[str, Any], *, owned: bool) -> "GameEvent":
+        # ``owned`` marks freshly parsed JSON whose payload dict can be kept as is
         timestamp_str = data.get("timestamp")
         if not isinstance(timestamp_str, str):  # pragma: no cover - defensive
             raise ValueError("Event timestamp must be a string")
         payload = data.get("payload") or {}
         if not isinstance(payload, Mapping):  # pragma: no cover - defensive
             raise ValueError("Event payload must be a mapping")
-        visibility_raw = data.get("visibility", EventVisibility.PUBLIC.value)
-        visibility = EventVisibility(visibility_raw)
+        visibility_raw = data.get("visibility", "public")
+        visibility = _VISIBILITY_BY_VALUE.get(visibility_raw) or EventVisibility(visibility_raw)
         audience_raw = data.get("audience") or []
         if not isinstance(audience_raw, (list, tuple)):
             raise ValueError("Event audience must be a list or tuple")
-        audience = tuple(str(item) for item in audience_raw)
+        audience = tuple([sys.intern(str(item)) for item in audience_raw])
+        type_raw = data["type"]
         return cls(
-            timestamp=datetime.fromisoformat(timestamp_str),
-            type=GameEventType(data["type"]),
-            payload=dict(payload),
+            timestamp=_parse_timestamp(timestamp_str),
+            type=_EVENT_TYPE_BY_VALUE.get(type_raw) or GameEventType(type_raw),
+            payload=payload if owned and type(payload) is dict else dict(payload),
             visibility=visibility,
             audience=audience,
         )
@@ -82,7 +128,23 @@ class EventLog:
     """Append-only in-memory log of :class:`GameEvent` instances."""
 
     def __init__(self, events: Sequence[GameEvent] | None = None) -> None:
-        self._events: list[GameEvent] = list(events) if events else []
+        self._events: list[GameEvent] = []
+        # Positions of public events and of events per audience tag, kept in
+        # append order so queries only touch the events they return.
+        self._public_positions: list[int] = []
+        self._positions_by_tag: dict[str, list[int]] = {}
+        # Shared tuple handed out by ``events``, rebuilt when the log grows
+        self._snapshot: tuple[GameEvent, ...] = ()
+        for event in events or ():
+            self._append(event)
+
+    def _append(self, event: GameEvent) -> None:
+        position = len(self._events)
+        self._events.append(event)
+        if event.visibility is EventVisibility.PUBLIC:
+            self._public_positions.append(position)
+        for tag in event.audience:
+            self._positions_by_tag.setdefault(tag, []).append(position)
 
     def record(
         self,
@@ -103,34 +165,47 @@ class EventLog:
             visibility=visibility or EventVisibility.PUBLIC,
             audience=tuple(audience or ()),
         )
-        self._events.append(event)
+        self._append(event)
         return event
 
     @property
     def events(self) -> tuple[GameEvent, ...]:
         """Return all events recorded so far."""
 
-        return tuple(self._events)
+        if len(self._snapshot) != len(self._events):
+            self._snapshot = tuple(self._events)
+        return self._snapshot
 
     def __len__(self) -> int:  # pragma: no cover - trivial
         return len(self._events)
 
     def clear(self) -> None:  # pragma: no cover - future use
         self._events.clear()
+        self._public_positions.clear()
+        self._positions_by_tag.clear()
+        self._snapshot = ()
 
     def to_jsonl(self) -> str:
         """Serialise the event log to newline-delimited JSON."""
 
-        return "\n".join(
-            json.dumps(event.to_dict(), separators=(",", ":")) for event in self._events
-        )
+        return "\n".join([event.to_json() for event in self._events])
 
     @classmethod
     def from_jsonl(cls, raw: str) -> "EventLog":
         """Create a log from newline-delimited JSON produced by :meth:`to_jsonl`."""
 
-        lines = [line for line in raw.splitlines() if line.strip()]
-        events = [GameEvent.from_dict(json.loads(line)) for line in lines]
+        # Walk newline offsets rather than splitlines(): no list of every line is
+        # held alongside the text, and U+2028 inside a JSON string is not a break.
+        events = []
+        start, size = 0, len(raw)
+        while start < size:
+            end = raw.find("\n", start)
+            if end == -1:
+                end = size
+            line = raw[start:end]
+            if line and not line.isspace():
+                events.append(GameEvent._decode(json_codec.loads(line), owned=True))
+            start = end + 1
         return cls(events)
 
     @classmethod
@@ -148,18 +223,19 @@ class EventLog:
     ) -> tuple[GameEvent, ...]:
         """Return events filtered according to audience visibility."""
 
-        allowed_tags = set(audience_tags or ())
-        matched: list[GameEvent] = []
-        for event in self._events:
-            if include_public and event.visibility is EventVisibility.PUBLIC:
-                matched.append(event)
-                continue
-            if include_private:
-                matched.append(event)
-                continue
-            if allowed_tags and any(tag in allowed_tags for tag in event.audience):
-                matched.append(event)
-        return tuple(matched)
+        if include_private:
+            return self.events
+        buckets = [self._public_positions] if include_public else []
+        for tag in set(audience_tags or ()):
+            bucket = self._positions_by_tag.get(tag)
+            if bucket:
+                buckets.append(bucket)
+        if not buckets:
+            return ()
+        # Buckets are each in append order but may overlap, so merge by position
+        positions = buckets[0] if len(buckets) == 1 else sorted(set().union(*buckets))
+        events = self._events
+        return tuple(events[position] for position in positions)
 
     def public_events(self) -> tuple[GameEvent, ...]:
         """Return only public events."""
@@ -195,19 +271,24 @@ class EventLog:
         )
 
 
+@lru_cache(maxsize=None)
 def player_audience_tag(player_id: str) -> str:
-    """Construct the audience tag for a specific player."""
+    """Construct the audience tag for a specific player.
+
+    Tags are cached and interned, so every event for a player shares one string.
+    """
 
-    return f"player:{player_id}"
+    return sys.intern(f"player:{player_id}")
 
 
+@lru_cache(maxsize=None)
 def alignment_audience_tag(alignment: Union["Alignment", str]) -> str:
     """Construct the audience tag used for alignment-scoped events."""
 
     if hasattr(alignment, "value"):
         enum_alignment = cast("Alignment", alignment)
-        return f"alignment:{enum_alignment.value}"
-    return f"alignment:{alignment}"
+        return sys.intern(f"alignment:{enum_alignment.value}")
+    return sys.intern(f"alignment:{alignment}")
 
 
 __all__ = [
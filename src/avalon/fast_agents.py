@@ -0,0 +1,194 @@
+"""Deterministic rule-based agent decisions over seat bitmasks.
+
+These helpers back ``AgentManager(fast_mode=True)`` for self-play and
+evaluation runs that need no LLM at all. Every argument is a plain ``int``
+bitset (bit ``i`` is seat ``i``), so a decision is a handful of integer
+operations instead of building an :class:`~avalon.agents.AgentObservation`.
+:func:`simulate_setups` is the only entry point that takes game objects.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+from .enums import Alignment
+from .roles import ROLE_DEFINITIONS, RoleTag
+
+if TYPE_CHECKING:
+    from .setup import SetupResult
+
+
+def iter_seats(mask: int) -> Iterator[int]:
+    """Yield the seat indexes set in ``mask`` in ascending order."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+def pick_team(self_seat: int, team_size: int, player_count: int, avoid_mask: int) -> int:
+    """Return a team mask containing the leader and the lowest seats not avoided.
+
+    Seats in ``avoid_mask`` are only used when there are not enough others.
+    """
+    team = 1 << self_seat
+    remaining = team_size - 1
+    everyone = (1 << player_count) - 1
+    for candidates in (everyone & ~avoid_mask & ~team, everyone & avoid_mask & ~team):
+        for seat in iter_seats(candidates):
+            if remaining == 0:
+                return team
+            team |= 1 << seat
+            remaining -= 1
+    return team
+
+
+def approve_team(
+    team_mask: int,
+    self_seat: int,
+    is_minion: bool,
+    known_minion_mask: int,
+    suspect_mask: int,
+    consecutive_rejections: int,
+) -> bool:
+    """Decide a team vote.
+
+    Everyone approves the fifth proposal. Minions approve teams carrying at
+    least one minion they know of (themselves included); resistance players
+    reject teams containing anyone from a failed mission other than themselves.
+    """
+    if consecutive_rejections >= 4:
+        return True
+    if is_minion:
+        return bool(team_mask & (known_minion_mask | (1 << self_seat)))
+    return not team_mask & suspect_mask & ~(1 << self_seat)
+
+
+def vote_passes(approval_mask: int, player_count: int) -> bool:
+    """Return True when a strict majority of the table is in ``approval_mask``."""
+    return approval_mask.bit_count() * 2 > player_count
+
+
+def play_success(is_minion: bool) -> bool:
+    """Return the mission card: resistance always succeeds, minions always fail."""
+    return not is_minion
+
+
+def guess_merlin(player_count: int, self_seat: int, known_minion_mask: int) -> int:
+    """Return the lowest seat that is neither the assassin nor a known minion."""
+    everyone = (1 << player_count) - 1
+    candidates = everyone & ~known_minion_mask & ~(1 << self_seat)
+    return next(iter_seats(candidates), self_seat)
+
+
+def simulate_game(
+    team_sizes: Sequence[int],
+    required_fail_counts: Sequence[int],
+    minion_mask: int,
+    known_minion_masks: Sequence[int],
+    *,
+    leader_seat: int = 0,
+    merlin_seat: int | None = None,
+    assassin_seat: int | None = None,
+) -> bool:
+    """Play a whole game with the rules above and return True if resistance wins.
+
+    This is the rollout loop for Monte-Carlo evaluation: it follows the same
+    transitions as :class:`~avalon.game_state.GameState` (leader rotation,
+    fail thresholds, five rejections, assassination) but keeps only integer
+    masks and counters, so no records, events or observations are built.
+    ``known_minion_masks[seat]`` is what that seat learnt during setup.
+    """
+    player_count = len(known_minion_masks)
+    leader = leader_seat
+    successes = failures = rejections = failed_team_mask = 0
+    round_index = 0
+    while successes < 3 and failures < 3 and round_index < len(team_sizes):
+        known = known_minion_masks[leader]
+        leader_is_minion = bool(minion_mask >> leader & 1)
+        avoid = known if leader_is_minion else known | failed_team_mask
+        team = pick_team(leader, team_sizes[round_index], player_count, avoid)
+        approval_mask = 0
+        for seat in range(player_count):
+            seat_known = known_minion_masks[seat]
+            if approve_team(
+                team,
+                seat,
+                bool(minion_mask >> seat & 1),
+                seat_known,
+                seat_known | failed_team_mask,
+                rejections,
+            ):
+                approval_mask |= 1 << seat
+        leader = (leader + 1) % player_count
+        if not vote_passes(approval_mask, player_count):
+            rejections += 1
+            if rejections >= 5:
+                return False
+            continue
+        # Every minion on the team fails the mission (see play_success)
+        if (team & minion_mask).bit_count() >= required_fail_counts[round_index]:
+            failures += 1
+            failed_team_mask |= team
+        else:
+            successes += 1
+        rejections = 0
+        round_index += 1
+    if successes < 3:
+        return False
+    if assassin_seat is None or merlin_seat is None:
+        return True
+    target = guess_merlin(player_count, assassin_seat, known_minion_masks[assassin_seat])
+    return target != merlin_seat
+
+
+def simulate_setups(setups: Iterable[SetupResult]) -> list[bool]:
+    """Roll out one rule-based game per setup; True where resistance wins.
+
+    Each setup is converted to seat masks once at the boundary and then played
+    by :func:`simulate_game` with seat 0 leading, as in a fresh ``GameState``.
+    """
+    outcomes = []
+    for setup in setups:
+        seat_of = {player.player_id: seat for seat, player in enumerate(setup.players)}
+        known = [0] * len(setup.players)
+        for briefing in setup.briefings:
+            mask = 0
+            for known_id in briefing.knowledge.visible_player_ids:
+                mask |= 1 << seat_of[known_id]
+            known[seat_of[briefing.player.player_id]] = mask
+        minion_mask = 0
+        merlin_seat: int | None = None
+        assassin_seat: int | None = None
+        for seat, player in enumerate(setup.players):
+            if player.alignment is Alignment.MINION:
+                minion_mask |= 1 << seat
+            tags = ROLE_DEFINITIONS[player.role].tags
+            if RoleTag.MERLIN in tags:
+                merlin_seat = seat
+            if RoleTag.ASSASSIN in tags:
+                assassin_seat = seat
+        mission_config = setup.config.mission_config
+        outcomes.append(
+            simulate_game(
+                mission_config.team_sizes,
+                mission_config.required_fail_counts,
+                minion_mask,
+                known,
+                merlin_seat=merlin_seat,
+                assassin_seat=assassin_seat,
+            )
+        )
+    return outcomes
+
+
+__all__ = [
+    "approve_team",
+    "guess_merlin",
+    "iter_seats",
+    "pick_team",
+    "play_success",
+    "simulate_game",
+    "simulate_setups",
+    "vote_passes",
+]
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Sequence, Tuple
 
 from .config import GameConfig
 from .discussion import DiscussionPhase, DiscussionRound, DiscussionStatement
@@ -16,6 +16,22 @@ from .players import Player, PlayerId
 from .roles import ROLE_DEFINITIONS, RoleTag
 from .setup import SetupResult
 
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _splitmix64(state: int) -> int:
+    """Advance a SplitMix64 state and return the next 64-bit output.
+
+    The output doubles as the next state, which is plenty for shuffling a
+    mission team of at most five cards.
+    """
+
+    z = (state + _GOLDEN_GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
 
 class GamePhase(str, Enum):
     """High-level phase of the game loop."""
@@ -27,6 +43,25 @@ class GamePhase(str, Enum):
     GAME_OVER = "game_over"
 
 
+# Module aliases for the phase members: on 3.10/3.11 ``GamePhase.X`` goes through
+# the enum metaclass and costs several times a plain global lookup
+_TEAM_PROPOSAL = GamePhase.TEAM_PROPOSAL
+_TEAM_VOTE = GamePhase.TEAM_VOTE
+_MISSION = GamePhase.MISSION
+_ASSASSINATION_PENDING = GamePhase.ASSASSINATION_PENDING
+_GAME_OVER = GamePhase.GAME_OVER
+
+# Read-only PHASE_CHANGED payloads, built once; EventLog.record copies them per event
+_PHASE_PAYLOADS: Mapping[GamePhase, Mapping[str, Any]] = {
+    phase: MappingProxyType({"phase": phase.value}) for phase in GamePhase
+}
+
+
+def _is_stale(key: Tuple[int, Any], version: int, history: Sequence[Any]) -> bool:
+    # Every mutation bumps the version; the identity check catches reassigned lists
+    return key[0] != version or key[1] is not history
+
+
 class MissionResult(str, Enum):
     """Outcome of a mission."""
 
@@ -41,7 +76,15 @@ class MissionDecision(str, Enum):
     FAIL = "fail"
 
 
-@dataclass(frozen=True, slots=True)
+# Mission card aliases for the per-card loop in submit_mission (see _TEAM_PROPOSAL)
+_CARD_SUCCESS = MissionDecision.SUCCESS
+_CARD_FAIL = MissionDecision.FAIL
+
+
+# Per-turn records are not frozen: a frozen dataclass assigns every field via
+# object.__setattr__, which makes construction several times slower. Treat them
+# as immutable; unsafe_hash keeps them hashable like their frozen siblings.
+@dataclass(slots=True, unsafe_hash=True)
 class VoteRecord:
     """Record of a team vote."""
 
@@ -54,7 +97,7 @@ class VoteRecord:
     approved: bool
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, unsafe_hash=True)
 class MissionAction:
     """Private record tying a mission card to the submitting player."""
 
@@ -62,7 +105,7 @@ class MissionAction:
     decision: MissionDecision
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, unsafe_hash=True)
 class MissionSummary:
     """Public mission data safe to expose to players and observers."""
 
@@ -75,7 +118,7 @@ class MissionSummary:
     auto_fail: bool
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True, unsafe_hash=True)
 class MissionRecord:
     """Aggregated record for a completed mission attempt."""
 
@@ -87,19 +130,44 @@ class MissionRecord:
     result: MissionResult
     auto_fail: bool = False
     actions: Tuple[MissionAction, ...] = ()
+    _successful_actors: Optional[FrozenSet[PlayerId]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _summary: Optional[MissionSummary] = field(default=None, init=False, repr=False, compare=False)
 
-    def to_public_summary(self) -> MissionSummary:
-        """Return an aggregated mission view without private card data."""
+    @property
+    def successful_actors(self) -> FrozenSet[PlayerId]:
+        """Players who played SUCCESS, derived from ``actions`` on first use."""
+
+        actors = self._successful_actors
+        if actors is None:
+            actors = frozenset(
+                action.player_id
+                for action in self.actions
+                if action.decision is MissionDecision.SUCCESS
+            )
+            self._successful_actors = actors
+        return actors
 
-        return MissionSummary(
-            round_number=self.round_number,
-            attempt_number=self.attempt_number,
-            team=self.team,
-            fail_count=self.fail_count,
-            required_fail_count=self.required_fail_count,
-            result=self.result,
-            auto_fail=self.auto_fail,
-        )
+    def to_public_summary(self) -> MissionSummary:
+        """Return an aggregated mission view without private card data.
+
+        Records are never modified once made, so the summary is built once and shared.
+        """
+
+        summary = self._summary
+        if summary is None:
+            summary = MissionSummary(
+                round_number=self.round_number,
+                attempt_number=self.attempt_number,
+                team=self.team,
+                fail_count=self.fail_count,
+                required_fail_count=self.required_fail_count,
+                result=self.result,
+                auto_fail=self.auto_fail,
+            )
+            self._summary = summary
+        return summary
 
 
 @dataclass(frozen=True, slots=True)
@@ -134,9 +202,53 @@ class GameState:
     seed: Optional[int] = None
     event_log: Optional[EventLog] = field(default=None, repr=False)
     _players_by_id: Dict[PlayerId, Player] = field(init=False, repr=False, default_factory=dict)
+    _players_by_id_view: Mapping[PlayerId, Player] = field(
+        init=False, repr=False, compare=False, default_factory=lambda: MappingProxyType({})
+    )
     _assassin_present: bool = field(init=False, repr=False, default=False)
     _assassin_ids: Tuple[PlayerId, ...] = field(init=False, repr=False, default=())
+    _seat_by_id: Dict[PlayerId, int] = field(init=False, repr=False, default_factory=dict)
+    _all_player_ids: Tuple[PlayerId, ...] = field(init=False, repr=False, default=())
+    _all_player_names: Tuple[str, ...] = field(init=False, repr=False, default=())
+    _team_sizes: Tuple[int, ...] = field(init=False, repr=False, default=())
+    _required_fail_counts: Tuple[int, ...] = field(init=False, repr=False, default=())
+    # Shared public-history tuples, keyed on ``(version, source list)``
+    _votes_snapshot: Tuple[VoteRecord, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _votes_key: Tuple[int, Any] = field(init=False, repr=False, compare=False, default=(-1, None))
+    _missions_snapshot: Tuple[MissionRecord, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _missions_key: Tuple[int, Any] = field(
+        init=False, repr=False, compare=False, default=(-1, None)
+    )
+    _public_missions_snapshot: Tuple[MissionSummary, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _public_missions_key: Tuple[int, Any] = field(
+        init=False, repr=False, compare=False, default=(-1, None)
+    )
+    _mission_actions_by_player: Dict[PlayerId, Tuple[Tuple[int, int, bool], ...]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _discussion_snapshot: Tuple[DiscussionStatement, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+    _discussion_stamp: Tuple[int, int, int] = field(
+        init=False, repr=False, compare=False, default=(0, 0, 0)
+    )
+    # Seat bitset of ``current_team``, valid while that exact tuple is current
+    _team_mask: int = field(init=False, repr=False, compare=False, default=0)
+    _team_mask_for: Optional[Tuple[PlayerId, ...]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    # Seat-indexed bitsets: bit ``i`` is set when ``players[i]`` has the property
+    agent_mask: int = field(init=False, repr=False, compare=False, default=0)
+    minion_mask: int = field(init=False, repr=False, compare=False, default=0)
+    resistance_mask: int = field(init=False, repr=False, compare=False, default=0)
     assassination_record: Optional[AssassinationRecord] = None
+    version: int = field(default=0, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         player_map = {player.player_id: player for player in self.players}
@@ -145,6 +257,7 @@ class GameState:
         if self.config.player_count != len(self.players):
             raise ConfigurationError("Player roster does not match configuration count")
         object.__setattr__(self, "_players_by_id", player_map)
+        self._players_by_id_view = MappingProxyType(player_map)
         assassin_ids = tuple(
             player.player_id
             for player in self.players
@@ -153,6 +266,20 @@ class GameState:
         has_assassin = bool(assassin_ids)
         object.__setattr__(self, "_assassin_present", has_assassin)
         object.__setattr__(self, "_assassin_ids", assassin_ids)
+        self._seat_by_id = {player.player_id: seat for seat, player in enumerate(self.players)}
+        self._all_player_ids = tuple(player.player_id for player in self.players)
+        self._all_player_names = tuple(player.display_name for player in self.players)
+        self._team_sizes = self.config.mission_config.team_sizes
+        self._required_fail_counts = self.config.mission_config.required_fail_counts
+        agent_mask = minion_mask = 0
+        for seat, player in enumerate(self.players):
+            if player.is_agent:
+                agent_mask |= 1 << seat
+            if player.alignment is Alignment.MINION:
+                minion_mask |= 1 << seat
+        self.agent_mask = agent_mask
+        self.minion_mask = minion_mask
+        self.resistance_mask = ((1 << len(self.players)) - 1) & ~minion_mask
 
     @classmethod
     def from_setup(cls, setup: SetupResult) -> "GameState":
@@ -160,11 +287,118 @@ class GameState:
 
         return cls(config=setup.config, players=setup.players, seed=setup.seed)
 
+    def reset(self) -> None:
+        """Return to the opening position for another game with the same table.
+
+        Tournament loops can reuse one state instead of re-running the roster
+        validation and seat tables per game. History lists are replaced, not
+        cleared, so records kept from the previous game stay intact; the event
+        log is detached and ``version`` keeps counting so cached observations
+        of the old game are never served for the new one.
+        """
+
+        self.phase = _TEAM_PROPOSAL
+        self.round_number = 1
+        self.attempt_number = 1
+        self.leader_index = 0
+        self.resistance_score = 0
+        self.minion_score = 0
+        self.current_team = None
+        self.consecutive_rejections = 0
+        self.provisional_winner = None
+        self.final_winner = None
+        self.vote_history = []
+        self.mission_history = []
+        self.discussion_history = []
+        self.current_discussion = None
+        self.assassination_record = None
+        self.event_log = None
+        self._votes_snapshot = ()
+        self._votes_key = (-1, None)
+        self._missions_snapshot = ()
+        self._missions_key = (-1, None)
+        self._public_missions_snapshot = ()
+        self._public_missions_key = (-1, None)
+        self._mission_actions_by_player = {}
+        self._discussion_snapshot = ()
+        self._discussion_stamp = (0, 0, 0)
+        self._team_mask = 0
+        self._team_mask_for = None
+        self.version += 1
+
     @property
     def players_by_id(self) -> Mapping[PlayerId, Player]:
-        """Return mapping from player identifier to player object."""
+        """Return a read-only mapping from player identifier to player object."""
+
+        return self._players_by_id_view
+
+    @property
+    def all_player_ids(self) -> Tuple[PlayerId, ...]:
+        """Return player identifiers in seat order."""
+
+        return self._all_player_ids
+
+    @property
+    def all_player_names(self) -> Tuple[str, ...]:
+        """Return player display names in seat order."""
 
-        return dict(self._players_by_id)
+        return self._all_player_names
+
+    @property
+    def required_team_size(self) -> int:
+        """Return the team size for the current round."""
+
+        return self._team_sizes[self.round_number - 1]
+
+    @property
+    def required_fail_count(self) -> int:
+        """Return how many FAIL cards sink the current round's mission."""
+
+        return self._required_fail_counts[self.round_number - 1]
+
+    @property
+    def current_team_mask(self) -> int:
+        """Return the seat bitset of the proposed team (0 when there is none)."""
+
+        team = self.current_team
+        if team is not self._team_mask_for:
+            mask = 0
+            for player_id in team or ():
+                mask |= 1 << self._seat_by_id[player_id]
+            self._team_mask = mask
+            self._team_mask_for = team
+        return self._team_mask
+
+    @property
+    def failed_team_mask(self) -> int:
+        """Return the seat bitset of everyone who sat on a failed mission."""
+
+        mask = 0
+        for record in self.mission_history:
+            if record.result is MissionResult.FAILURE and not record.auto_fail:
+                for player_id in record.team:
+                    mask |= 1 << self._seat_by_id[player_id]
+        return mask
+
+    def seat_of(self, player_id: PlayerId) -> int:
+        """Return the seat index of a player (their position in ``players``)."""
+
+        try:
+            return self._seat_by_id[player_id]
+        except KeyError as exc:
+            raise InvalidActionError(f"Unknown player {player_id}") from exc
+
+    def is_agent(self, player_id: PlayerId) -> bool:
+        """Return ``True`` when the player is controlled by an agent."""
+
+        seat = self._seat_by_id.get(player_id)
+        return seat is not None and bool((self.agent_mask >> seat) & 1)
+
+    def is_minion(self, player_id: PlayerId) -> bool:
+        """Return ``True`` when the player is aligned with the minions."""
+
+        seat = self._seat_by_id.get(player_id)
+        return seat is not None and bool((self.minion_mask >> seat) & 1)
 
     @property
     def current_leader(self) -> Player:
@@ -174,21 +408,56 @@ class GameState:
 
     @property
     def votes(self) -> Tuple[VoteRecord, ...]:
-        """Return an immutable snapshot of all recorded votes."""
+        """Return an immutable snapshot of all recorded votes.
+
+        The snapshot is rebuilt only after ``version`` moves or the list is
+        replaced, and is otherwise shared by every observation of the turn.
+        """
 
-        return tuple(self.vote_history)
+        if _is_stale(self._votes_key, self.version, self.vote_history):
+            self._votes_snapshot = tuple(self.vote_history)
+            self._votes_key = (self.version, self.vote_history)
+        return self._votes_snapshot
 
     @property
     def missions(self) -> Tuple[MissionRecord, ...]:
         """Return an immutable snapshot of completed missions."""
 
-        return tuple(self.mission_history)
+        if _is_stale(self._missions_key, self.version, self.mission_history):
+            self._missions_snapshot = tuple(self.mission_history)
+            self._missions_key = (self.version, self.mission_history)
+        return self._missions_snapshot
 
     @property
     def public_missions(self) -> Tuple[MissionSummary, ...]:
         """Return sanitized mission summaries for public consumption."""
 
-        return tuple(record.to_public_summary() for record in self.mission_history)
+        history = self.mission_history
+        if _is_stale(self._public_missions_key, self.version, history):
+            # Summaries are cached per record, so a rebuild only re-wraps them
+            self._public_missions_snapshot = tuple(
+                [record.to_public_summary() for record in history]
+            )
+            self._public_missions_key = (self.version, history)
+        return self._public_missions_snapshot
+
+    def mission_actions_of(self, player_id: PlayerId) -> Tuple[Tuple[int, int, bool], ...]:
+        """Return ``(round, attempt, played_success)`` for every mission so far.
+
+        Each player's tuple is extended with new missions only, so repeated
+        observations do not rescan the whole mission history.
+        """
+
+        cached = self._mission_actions_by_player.get(player_id, ())
+        if len(cached) > len(self.mission_history):
+            cached = ()  # History was replaced; rebuild
+        if len(cached) != len(self.mission_history):
+            cached += tuple(
+                (record.round_number, record.attempt_number, player_id in record.successful_actors)
+                for record in self.mission_history[len(cached) :]
+            )
+            self._mission_actions_by_player[player_id] = cached
+        return cached
 
     @property
     def assassin_ids(self) -> Tuple[PlayerId, ...]:
@@ -209,13 +478,31 @@ class GameState:
 
     @property
     def all_discussion_statements(self) -> Tuple[DiscussionStatement, ...]:
-        """Return all discussion statements from all rounds."""
-        statements: list[DiscussionStatement] = []
-        for discussion_round in self.discussion_history:
-            statements.extend(discussion_round.statements)
-        if self.current_discussion:
-            statements.extend(self.current_discussion.statements)
-        return tuple(statements)
+        """Return all discussion statements from all rounds.
+
+        The tuple is shared until a round is archived or a statement is added;
+        statements appended to the open round only extend it.
+        """
+        current = self.current_discussion
+        stamp = (
+            len(self.discussion_history),
+            id(current),
+            len(current.statements) if current else 0,
+        )
+        previous = self._discussion_stamp
+        if stamp == previous:
+            return self._discussion_snapshot
+        if current and stamp[:2] == previous[:2] and stamp[2] > previous[2]:
+            self._discussion_snapshot += tuple(current.statements[previous[2] :])
+        else:
+            statements: list[DiscussionStatement] = []
+            for discussion_round in self.discussion_history:
+                statements.extend(discussion_round.statements)
+            if current:
+                statements.extend(current.statements)
+            self._discussion_snapshot = tuple(statements)
+        self._discussion_stamp = stamp
+        return self._discussion_snapshot
 
     def start_discussion(self, phase: DiscussionPhase) -> None:
         """Start a new discussion round for the current game state."""
@@ -227,6 +514,7 @@ class GameState:
             attempt_number=self.attempt_number,
             phase=phase,
         )
+        self.version += 1
 
     def add_discussion_statement(self, statement: DiscussionStatement) -> None:
         """Add a statement to the current discussion round."""
@@ -244,7 +532,7 @@ class GameState:
                 f"Statement attempt {statement.attempt_number} doesn't match "
                 f"current discussion attempt {self.current_discussion.attempt_number}"
             )
-        if statement.phase != self.current_discussion.phase:
+        if statement.phase is not self.current_discussion.phase:
             raise InvalidActionError(
                 f"Statement phase {statement.phase} doesn't match "
                 f"current discussion phase {self.current_discussion.phase}"
@@ -259,7 +547,9 @@ class GameState:
                 "round_number": statement.round_number,
                 "attempt_number": statement.attempt_number,
                 "phase": statement.phase.value,
-            },
+            }
+            if self.event_log is not None
+            else None,
         )
 
     def end_discussion(self) -> None:
@@ -269,41 +559,52 @@ class GameState:
 
         self.discussion_history.append(self.current_discussion)
         self.current_discussion = None
+        self.version += 1
 
     def _record_event(
         self,
         event_type: GameEventType,
         payload: Mapping[str, Any] | None = None,
     ) -> None:
+        # Every recorded mutation invalidates cached per-player observations.
+        # Per-turn call sites only build ``payload`` while a log is attached.
+        self.version += 1
         if self.event_log is None:
             return
         self.event_log.record(event_type, payload or {})
 
     def _set_phase(self, phase: GamePhase) -> None:
         self.phase = phase
-        self._record_event(GameEventType.PHASE_CHANGED, {"phase": phase.value})
+        self._record_event(GameEventType.PHASE_CHANGED, _PHASE_PAYLOADS[phase])
 
     def propose_team(self, leader_id: PlayerId, team: Sequence[PlayerId]) -> Tuple[PlayerId, ...]:
         """Propose a mission team for the current round."""
 
-        self._ensure_phase(GamePhase.TEAM_PROPOSAL)
+        if self.phase is not _TEAM_PROPOSAL:
+            raise self._phase_error(_TEAM_PROPOSAL)
         if leader_id != self.current_leader.player_id:
             raise InvalidActionError("Only the current leader may propose a team")
 
-        team_tuple = tuple(team)
-        required_size = self._required_team_size()
+        team_tuple = team if type(team) is tuple else tuple(team)
+        required_size = self.required_team_size
         if len(team_tuple) != required_size:
             raise InvalidActionError(
                 f"Team size must be {required_size} for round {self.round_number}"
             )
-        if len(set(team_tuple)) != len(team_tuple):
-            raise InvalidActionError("Team proposals may not contain duplicate players")
+        # Seat bits catch unknown and repeated players in a single pass
+        team_mask = 0
         for player_id in team_tuple:
-            if player_id not in self._players_by_id:
+            seat = self._seat_by_id.get(player_id)
+            if seat is None:
                 raise InvalidActionError(f"Unknown player id in team proposal: {player_id}")
+            if team_mask >> seat & 1:
+                raise InvalidActionError("Team proposals may not contain duplicate players")
+            team_mask |= 1 << seat
 
         self.current_team = team_tuple
-        self._set_phase(GamePhase.TEAM_VOTE)
+        self._team_mask = team_mask
+        self._team_mask_for = team_tuple
+        self._set_phase(_TEAM_VOTE)
         self._record_event(
             GameEventType.TEAM_PROPOSED,
             {
@@ -311,36 +612,74 @@ class GameState:
                 "attempt": self.attempt_number,
                 "leader_id": leader_id,
                 "team": list(team_tuple),
-            },
+            }
+            if self.event_log is not None
+            else None,
         )
         return team_tuple
 
     def vote_on_team(self, votes: Mapping[PlayerId, bool]) -> VoteRecord:
         """Record the simultaneous vote for the currently proposed team."""
 
-        self._ensure_phase(GamePhase.TEAM_VOTE)
+        if self.phase is not _TEAM_VOTE:
+            raise self._phase_error(_TEAM_VOTE)
         if self.current_team is None:
             raise InvalidActionError("No team has been proposed for voting")
-        if set(votes.keys()) != set(self._players_by_id.keys()):
+        if len(votes) != len(self._players_by_id) or not (
+            votes.keys() >= self._players_by_id.keys()
+        ):
             raise InvalidActionError("Votes must be provided for every registered player")
 
-        approvals = []
-        rejections = []
-        for player in self.players:
-            vote = votes.get(player.player_id)
-            if vote not in (True, False):
-                raise InvalidActionError("Votes must be boolean values")
-            if vote:
-                approvals.append(player.player_id)
+        # One pass over seats into two lists, frozen once at the end
+        approvals: list[PlayerId] = []
+        rejections: list[PlayerId] = []
+        # Values are read as plain objects so a compiled (mypyc) build reports
+        # bad votes as InvalidActionError rather than a boundary TypeError
+        cast_votes: Mapping[PlayerId, object] = votes
+        for player_id in self._all_player_ids:
+            vote = cast_votes[player_id]
+            if vote is True:
+                approvals.append(player_id)
+            elif vote is False:
+                rejections.append(player_id)
             else:
-                rejections.append(player.player_id)
+                raise InvalidActionError("Votes must be boolean values")
+        return self._resolve_vote(self.current_team, approvals, rejections)
+
+    def vote_on_team_mask(self, approval_mask: int) -> VoteRecord:
+        """Record the vote from a seat bitset of approvals (bit ``i`` is seat ``i``).
+
+        Every seat not in the mask rejects. Bitmask agents and simulation
+        harnesses can use this instead of building a per-player mapping.
+        """
+
+        if self.phase is not _TEAM_VOTE:
+            raise self._phase_error(_TEAM_VOTE)
+        if self.current_team is None:
+            raise InvalidActionError("No team has been proposed for voting")
+        if approval_mask < 0 or approval_mask >> len(self.players):
+            raise InvalidActionError("Approval mask names seats outside the table")
+
+        approvals: list[PlayerId] = []
+        rejections: list[PlayerId] = []
+        for seat, player_id in enumerate(self._all_player_ids):
+            (approvals if approval_mask >> seat & 1 else rejections).append(player_id)
+        return self._resolve_vote(self.current_team, approvals, rejections)
 
+    def _resolve_vote(
+        self,
+        team: Tuple[PlayerId, ...],
+        approvals: list[PlayerId],
+        rejections: list[PlayerId],
+    ) -> VoteRecord:
+        # The lists are freshly built by the caller: the record freezes copies
+        # and the event payload takes ownership of the lists themselves
         approved = len(approvals) > len(rejections)
         record = VoteRecord(
             round_number=self.round_number,
             attempt_number=self.attempt_number,
             leader_id=self.current_leader.player_id,
-            team=self.current_team,
+            team=team,
             approvals=tuple(approvals),
             rejections=tuple(rejections),
             approved=approved,
@@ -352,50 +691,65 @@ class GameState:
                 "round": record.round_number,
                 "attempt": record.attempt_number,
                 "team": list(record.team),
-                "approvals": list(record.approvals),
-                "rejections": list(record.rejections),
+                "approvals": approvals,
+                "rejections": rejections,
                 "approved": record.approved,
-            },
+            }
+            if self.event_log is not None
+            else None,
         )
 
         if approved:
-            self._set_phase(GamePhase.MISSION)
+            self._set_phase(_MISSION)
             self.consecutive_rejections = 0
         else:
             self.consecutive_rejections += 1
-            self._advance_leader()
+            self.leader_index = (self.leader_index + 1) % len(self.players)
             if self.consecutive_rejections >= 5:
                 self._handle_auto_fail()
             else:
                 self.attempt_number += 1
                 self.current_team = None
-                self._set_phase(GamePhase.TEAM_PROPOSAL)
+                self._set_phase(_TEAM_PROPOSAL)
 
         return record
 
     def submit_mission(self, decisions: Mapping[PlayerId, MissionDecision]) -> MissionRecord:
         """Submit mission cards for the currently approved team."""
 
-        self._ensure_phase(GamePhase.MISSION)
+        if self.phase is not _MISSION:
+            raise self._phase_error(_MISSION)
         if self.current_team is None:
             raise InvalidActionError("No team has been approved for the mission")
-        if set(decisions.keys()) != set(self.current_team):
-            raise InvalidActionError("Mission decisions must be submitted by the mission team only")
-
-        fail_count = 0
+        team = self.current_team
+        # propose_team rejects duplicates, so equal sizes plus every member
+        # being found while building the actions means the key sets are equal
+        wrong_submitters = "Mission decisions must be submitted by the mission team only"
+        if len(decisions) != len(team):
+            raise InvalidActionError(wrong_submitters)
+        try:
+            # Read as plain objects, as in vote_on_team
+            cards_by_id: Mapping[PlayerId, object] = decisions
+            cards = [cards_by_id[pid] for pid in team]
+        except KeyError:
+            raise InvalidActionError(wrong_submitters) from None
+        # Collect FAIL cards as seat bits: one mask test vets alignments, one
+        # popcount tallies them
+        fail_mask = 0
         actions = []
-        for player_id in self.current_team:
-            decision = decisions[player_id]
-            player = self._players_by_id[player_id]
-            if decision not in (MissionDecision.SUCCESS, MissionDecision.FAIL):
+        for pid, card in zip(team, cards, strict=True):
+            if card is _CARD_SUCCESS:
+                actions.append(MissionAction(player_id=pid, decision=_CARD_SUCCESS))
+            elif card is _CARD_FAIL:
+                fail_mask |= 1 << self._seat_by_id[pid]
+                actions.append(MissionAction(player_id=pid, decision=_CARD_FAIL))
+            else:
                 raise InvalidActionError("Mission decisions must be SUCCESS or FAIL")
-            if player.alignment is Alignment.RESISTANCE and decision is MissionDecision.FAIL:
-                raise InvalidActionError("Resistance players may not fail missions")
-            if decision is MissionDecision.FAIL:
-                fail_count += 1
-            actions.append(MissionAction(player_id=player_id, decision=decision))
+        if fail_mask & self.resistance_mask:
+            raise InvalidActionError("Resistance players may not fail missions")
+        fail_count = fail_mask.bit_count()
 
-        required_fails = self._required_fail_count()
+        required_fails = self.required_fail_count
         mission_success = fail_count < required_fails
         result = MissionResult.SUCCESS if mission_success else MissionResult.FAILURE
         obfuscated_actions = self._obfuscate_actions(
@@ -424,7 +778,9 @@ class GameState:
                 "required_fail_count": record.required_fail_count,
                 "result": record.result.value,
                 "auto_fail": record.auto_fail,
-            },
+            }
+            if self.event_log is not None
+            else None,
         )
 
         if mission_success:
@@ -441,20 +797,20 @@ class GameState:
     ) -> AssassinationRecord:
         """Resolve the Merlin assassination attempt."""
 
-        if self.phase is not GamePhase.ASSASSINATION_PENDING:
+        if self.phase is not _ASSASSINATION_PENDING:
             raise InvalidActionError("Assassination is not currently available")
         if self.assassination_record is not None or self.final_winner is not None:
             raise InvalidActionError("Assassination has already been resolved")
         if assassin_id not in self._assassin_ids:
             raise InvalidActionError("Only the assassin may perform the assassination")
-        if target_id not in self._players_by_id:
+        target = self._players_by_id.get(target_id)
+        if target is None:
             raise InvalidActionError("Unknown assassination target")
 
-        target = self._players_by_id[target_id]
         success = RoleTag.MERLIN in ROLE_DEFINITIONS[target.role].tags
         self.final_winner = Alignment.MINION if success else Alignment.RESISTANCE
         self.provisional_winner = self.final_winner
-        self._set_phase(GamePhase.GAME_OVER)
+        self._set_phase(_GAME_OVER)
         record = AssassinationRecord(assassin_id=assassin_id, target_id=target_id, success=success)
         self.assassination_record = record
         self._record_event(
@@ -479,36 +835,24 @@ class GameState:
         if self.resistance_score >= 3:
             self.provisional_winner = Alignment.RESISTANCE
             if self._assassin_present:
-                self._set_phase(GamePhase.ASSASSINATION_PENDING)
+                self._set_phase(_ASSASSINATION_PENDING)
             else:
-                self.final_winner = Alignment.RESISTANCE
-                self._set_phase(GamePhase.GAME_OVER)
-                self._record_event(
-                    GameEventType.GAME_COMPLETED,
-                    {"winner": Alignment.RESISTANCE.value, "reason": "three_successful_missions"},
-                )
+                self._end_game(Alignment.RESISTANCE, "three_successful_missions")
             return
 
-        self._advance_leader()
-        self._prepare_next_round()
+        self._start_next_round()
 
     def _handle_minion_success(self) -> None:
         self.minion_score += 1
         if self.minion_score >= 3:
-            self.final_winner = Alignment.MINION
-            self._set_phase(GamePhase.GAME_OVER)
-            self._record_event(
-                GameEventType.GAME_COMPLETED,
-                {"winner": Alignment.MINION.value, "reason": "three_failed_missions"},
-            )
+            self._end_game(Alignment.MINION, "three_failed_missions")
             return
 
-        self._advance_leader()
-        self._prepare_next_round()
+        self._start_next_round()
 
     def _handle_auto_fail(self) -> None:
         """Handle 5 consecutive rejections - this ends the game immediately with evil victory."""
-        required_fails = self._required_fail_count()
+        required_fails = self.required_fail_count
         record = MissionRecord(
             round_number=self.round_number,
             attempt_number=self.attempt_number,
@@ -521,59 +865,68 @@ class GameState:
         )
         self.mission_history.append(record)
         self.current_team = None
-
         # 5 consecutive rejections = immediate game over, evil wins
-        self.final_winner = Alignment.MINION
-        self._set_phase(GamePhase.GAME_OVER)
-        self._record_event(
-            GameEventType.MISSION_AUTO_FAILED,
-            {
-                "round": record.round_number,
-                "attempt": record.attempt_number,
-                "required_fail_count": record.required_fail_count,
-            },
-        )
-        self._record_event(
-            GameEventType.GAME_COMPLETED,
-            {"winner": Alignment.MINION.value, "reason": "five_consecutive_rejections"},
+        auto_failed = {
+            "round": record.round_number,
+            "attempt": record.attempt_number,
+            "required_fail_count": record.required_fail_count,
+        }
+        self._end_game(
+            Alignment.MINION,
+            "five_consecutive_rejections",
+            outcome=(GameEventType.MISSION_AUTO_FAILED, auto_failed),
         )
 
-    def _prepare_next_round(self) -> None:
-        if self.round_number >= len(self.config.mission_config.team_sizes):
-            self._set_phase(GamePhase.GAME_OVER)
+    def _end_game(
+        self,
+        winner: Alignment,
+        reason: str,
+        *,
+        outcome: tuple[GameEventType, dict[str, Any]] | None = None,
+    ) -> None:
+        # ``outcome`` is logged after the phase change and before completion
+        self.final_winner = winner
+        self._set_phase(_GAME_OVER)
+        if outcome is not None:
+            self._record_event(*outcome)
+        self._record_event(GameEventType.GAME_COMPLETED, {"winner": winner.value, "reason": reason})
+
+    def _start_next_round(self) -> None:
+        # Leader rotation and round advance are fused; this runs after every
+        # mission that does not end the game.
+        self.leader_index = (self.leader_index + 1) % len(self.players)
+        if self.round_number >= len(self._team_sizes):
+            self._set_phase(_GAME_OVER)
             return
 
         self.round_number += 1
         self.attempt_number = 1
-        self._set_phase(GamePhase.TEAM_PROPOSAL)
+        self._set_phase(_TEAM_PROPOSAL)
         self.consecutive_rejections = 0
 
-    def _advance_leader(self) -> None:
-        self.leader_index = (self.leader_index + 1) % len(self.players)
-
-    def _required_team_size(self) -> int:
-        return self.config.mission_config.team_sizes[self.round_number - 1]
-
-    def _required_fail_count(self) -> int:
-        return self.config.mission_config.required_fail_counts[self.round_number - 1]
-
-    def _ensure_phase(self, expected: GamePhase) -> None:
-        if self.phase is GamePhase.GAME_OVER:
-            raise InvalidActionError("Game is already over")
-        if self.phase is not expected:
-            raise InvalidActionError(
-                f"Action requires phase {expected.value}, current phase is {self.phase.value}"
-            )
+    def _phase_error(self, expected: GamePhase) -> InvalidActionError:
+        # Callers test ``self.phase is not expected`` inline (GAME_OVER is never
+        # expected), so the happy path is one comparison and no call.
+        if self.phase is _GAME_OVER:
+            return InvalidActionError("Game is already over")
+        return InvalidActionError(
+            f"Action requires phase {expected.value}, current phase is {self.phase.value}"
+        )
 
     def _obfuscate_actions(
         self,
-        actions: Sequence[MissionAction],
+        actions: list[MissionAction],
         *,
         round_number: int,
         attempt_number: int,
     ) -> Tuple[MissionAction, ...]:
-        obfuscated = list(actions)
+        # Keyed Fisher-Yates, in place: seeding a Mersenne Twister per mission
+        # costs far more than shuffling a handful of cards
+        obfuscated = actions
         base_seed = self.seed if self.seed is not None else 0
-        combined_seed = (base_seed << 32) ^ (round_number << 8) ^ attempt_number
-        random.Random(combined_seed).shuffle(obfuscated)
+        state = ((base_seed * _GOLDEN_GAMMA) ^ (round_number << 32) ^ attempt_number) & _MASK64
+        for index in range(len(obfuscated) - 1, 0, -1):
+            state = _splitmix64(state)
+            swap = state % (index + 1)
+            obfuscated[index], obfuscated[swap] = obfuscated[swap], obfuscated[index]
         return tuple(obfuscated)
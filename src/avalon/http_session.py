@@ -0,0 +1,92 @@
+"""Per-thread HTTP connection pools for the REST-based LLM clients."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Any, Mapping
+
+import requests
+
+from . import json_codec
+
+# requests.Session is not documented as thread-safe: adapters, cookies and the
+# connection pools are shared mutable state. Clients are called concurrently
+# from asyncio.to_thread and thread-pool workers, so every thread keeps its own
+# session; all of them are tracked so close_sessions can reach them.
+_local = threading.local()
+_sessions: list[requests.Session] = []
+_sessions_lock = threading.Lock()
+# Bumped by close_sessions so threads drop their closed session on next use
+_generation = 0
+
+
+def thread_session() -> requests.Session:
+    """Return the calling thread's session, creating it on first use.
+
+    Reusing a session keeps TCP/TLS connections alive between requests, so
+    consecutive agent decisions on a worker thread (and back-to-back games in
+    one process) skip the handshake instead of reconnecting for every call.
+    """
+    session: requests.Session | None = getattr(_local, "session", None)
+    if session is None or getattr(_local, "generation", None) != _generation:
+        session = requests.Session()
+        with _sessions_lock:
+            _sessions.append(session)
+            _local.generation = _generation
+        _local.session = session
+    return session
+
+
+def close_sessions() -> None:
+    """Close every thread's pooled connections; later calls open fresh sessions."""
+    global _generation
+    with _sessions_lock:
+        for session in _sessions:
+            session.close()
+        _sessions.clear()
+        _generation += 1
+
+
+def stream_chat_completion(
+    url: str, headers: Mapping[str, str], payload: Mapping[str, Any], *, timeout: float = 30
+) -> str:
+    """POST an OpenAI-compatible chat completion with ``stream`` on and collect the text.
+
+    Content deltas are accumulated from the server-sent events, and the stream
+    is closed as soon as the first JSON object in the reply is complete, so
+    trailing prose or padding tokens are never waited for. HTTP errors raise
+    ``requests.exceptions.HTTPError`` exactly like a non-streaming request.
+    """
+    scanner = json_codec.JsonObjectScanner()
+    parts: list[str] = []
+    response = thread_session().post(
+        url=url,
+        headers=dict(headers),
+        json={**payload, "stream": True},
+        timeout=timeout,
+        stream=True,
+    )
+    try:
+        response.raise_for_status()
+        for raw_line in response.iter_lines(decode_unicode=True):
+            if not raw_line or not raw_line.startswith("data:"):
+                continue  # Keep-alive comments and blank separators
+            data = raw_line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            choices = json_codec.loads(data).get("choices") or [{}]
+            delta = choices[0].get("delta", {}).get("content") or ""
+            parts.append(delta)
+            if scanner.feed(delta):
+                break
+    finally:
+        # Closing mid-stream drops the connection instead of reading the remainder
+        response.close()
+    return "".join(parts)
+
+
+atexit.register(close_sessions)
+
+
+__all__ = ["close_sessions", "stream_chat_completion", "thread_session"]
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import difflib
-from dataclasses import dataclass
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from getpass import getpass
-from typing import Any, Protocol, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from .config import GameConfig
 from .discussion import DiscussionPhase, DiscussionStatement
@@ -19,6 +32,8 @@ from .players import Player
 from .roles import ROLE_DEFINITIONS, build_role_list
 from .setup import PlayerRegistration, SetupResult, perform_setup
 
+_T = TypeVar("_T")
+
 
 class InteractionIO(Protocol):
     """Minimal IO surface for interactive play backends."""
@@ -47,7 +62,17 @@ class CLIInteraction:
         return getpass(prompt)
 
     def write(self, message: str) -> None:
-        print(message)
+        sys.stdout.write(message + "\n")
+
+    def write_lines(self, messages: Sequence[str]) -> None:
+        """Display several messages with a single write to the console."""
+        sys.stdout.write("".join(message + "\n" for message in messages))
+
+    def write_stream(self, chunks: Iterable[str]) -> None:
+        """Display one message piece by piece as its chunks arrive."""
+        for chunk in chunks:
+            print(chunk, end="", flush=True)
+        print()
 
 
 class InteractionEventType(str, Enum):
@@ -74,7 +99,10 @@ class BriefingOptions:
     pause_after_each: bool = False
 
 
-@dataclass(frozen=True, slots=True)
+# Not frozen, like the per-turn records in game_state: a transcript gets an entry
+# per line of output and frozen construction is about twice as slow. Treat
+# entries as immutable.
+@dataclass(slots=True, unsafe_hash=True)
 class InteractionLogEntry:
     """Single prompt/response or output emitted during play."""
 
@@ -91,13 +119,15 @@ class InteractionResult:
 
     state: GameState
     transcript: tuple[InteractionLogEntry, ...]
+    # Positions of public entries and of entries per audience tag, built on first query
+    _index: tuple[tuple[int, ...], dict[str, tuple[int, ...]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def public_transcript(self) -> tuple[InteractionLogEntry, ...]:
         """Return only publicly visible transcript entries."""
 
-        return tuple(
-            entry for entry in self.transcript if entry.visibility is EventVisibility.PUBLIC
-        )
+        return self._select([], include_private=False)
 
     def transcript_for_player(
         self,
@@ -111,7 +141,7 @@ class InteractionResult:
         tags = [player_audience_tag(player_id)]
         if extra_tags:
             tags.extend(extra_tags)
-        return _filter_transcript(self.transcript, tags, include_private)
+        return self._select(tags, include_private=include_private)
 
     def transcript_for_alignment(
         self,
@@ -125,13 +155,43 @@ class InteractionResult:
         tags = [alignment_audience_tag(alignment)]
         if extra_tags:
             tags.extend(extra_tags)
-        return _filter_transcript(self.transcript, tags, include_private)
-
+        return self._select(tags, include_private=include_private)
 
-YES_VALUES = {"y", "yes", "approve", "a"}
-NO_VALUES = {"n", "no", "reject", "r"}
-SUCCESS_VALUES = {"s", "success"}
-FAIL_VALUES = {"f", "fail"}
+    def _select(
+        self, audience_tags: Sequence[str], *, include_private: bool
+    ) -> tuple[InteractionLogEntry, ...]:
+        # Same merge as EventLog.query: public positions plus each tag's positions
+        if include_private:
+            return self.transcript
+        index = self._index
+        if index is None:
+            public: list[int] = []
+            by_tag: dict[str, list[int]] = {}
+            for position, entry in enumerate(self.transcript):
+                if entry.visibility is EventVisibility.PUBLIC:
+                    public.append(position)
+                for tag in entry.audience:
+                    by_tag.setdefault(tag, []).append(position)
+            index = (tuple(public), {tag: tuple(found) for tag, found in by_tag.items()})
+            object.__setattr__(self, "_index", index)
+        public_positions, positions_by_tag = index
+        buckets = [public_positions]
+        for tag in set(audience_tags):
+            bucket = positions_by_tag.get(tag)
+            if bucket:
+                buckets.append(bucket)
+        positions = buckets[0] if len(buckets) == 1 else sorted(set().union(*buckets))
+        transcript = self.transcript
+        return tuple([transcript[position] for position in positions])
+
+
+# Module-level aliases for the enum members used on every transcript write
+_OUTPUT = InteractionEventType.OUTPUT
+_PUBLIC = EventVisibility.PUBLIC
+
+# Display names for roles and alignments, e.g. "Loyal Servant" and "Minion"
+_ROLE_TITLES = {role: role.value.replace("_", " ").title() for role in RoleType}
+_ALIGNMENT_TITLES = {alignment: alignment.value.title() for alignment in Alignment}
 
 
 def run_interactive_game(
@@ -187,34 +247,22 @@ def run_interactive_game(
 
     while state.phase is not GamePhase.GAME_OVER:
         _announce_round(state, backend, log)
-        if state.phase is GamePhase.TEAM_PROPOSAL:
-            # Pre-proposal discussion
-            _handle_discussion(state, DiscussionPhase.PRE_PROPOSAL, backend, log, agent_manager)
-            _handle_team_proposal(state, backend, log, agent_manager, public_statements, log_mgr)
-        elif state.phase is GamePhase.TEAM_VOTE:
-            # Pre-vote discussion
-            _handle_discussion(state, DiscussionPhase.PRE_VOTE, backend, log, agent_manager)
-            _handle_team_vote(state, backend, log, agent_manager, public_statements, log_mgr)
-        elif state.phase is GamePhase.MISSION:
-            _handle_mission(state, backend, log, agent_manager, public_statements, log_mgr)
-            # Post-mission discussion (after results shown, before next phase)
-            # Phase may have changed to TEAM_PROPOSAL, ASSASSINATION_PENDING, or GAME_OVER
-            if state.phase is GamePhase.TEAM_PROPOSAL:  # type: ignore[comparison-overlap]
-                _handle_discussion(
-                    state, DiscussionPhase.POST_MISSION_RESULT, backend, log, agent_manager
-                )
-        elif state.phase is GamePhase.ASSASSINATION_PENDING:
-            # Pre-assassination discussion
+        phase = state.phase
+        step = _PHASE_STEPS.get(phase)
+        if step is None:  # pragma: no cover - defensive guard
+            raise RuntimeError(f"Unhandled phase: {phase}")
+        discussion_phase, handler = step
+        if discussion_phase is not None:
+            _handle_discussion(state, discussion_phase, backend, log, agent_manager)
+        handler(state, backend, log, agent_manager, public_statements, log_mgr)
+        # Post-mission discussion (after results shown) only when another round follows
+        if phase is GamePhase.MISSION and state.phase is GamePhase.TEAM_PROPOSAL:
             _handle_discussion(
-                state, DiscussionPhase.PRE_ASSASSINATION, backend, log, agent_manager
+                state, DiscussionPhase.POST_MISSION_RESULT, backend, log, agent_manager
             )
-            _handle_assassination(state, backend, log, agent_manager, public_statements, log_mgr)
-        else:  # pragma: no cover - defensive guard
-            raise RuntimeError(f"Unhandled phase: {state.phase}")
 
-    _write(backend, log, "")
     winner = state.final_winner.name.title() if state.final_winner else "Unknown"
-    _write(backend, log, f"Game over: {winner} victory")
+    _write_lines(backend, log, ["", f"Game over: {winner} victory"])
     return InteractionResult(state=state, transcript=tuple(log))
 
 
@@ -263,65 +311,65 @@ def _collect_registrations(
                 .strip()
                 .lower()
             )
-            if not type_input or type_input == "h" or type_input == "human":
-                player_type = PlayerType.HUMAN
-                break
-            elif type_input == "a" or type_input == "agent":
-                player_type = PlayerType.AGENT
-                break
-            else:
-                _write(backend, log, "Please enter 'h' for human or 'a' for agent.")
+            match type_input:
+                case "" | "h" | "human":
+                    player_type = PlayerType.HUMAN
+                    break
+                case "a" | "agent":
+                    player_type = PlayerType.AGENT
+                    break
+            _write(backend, log, "Please enter 'h' for human or 'a' for agent.")
 
         registrations.append(PlayerRegistration(display_name=name, player_type=player_type))
 
     return registrations
 
 
+_OPTIONAL_ROLE_MENU = (
+    "\nOptional special characters (Merlin and Assassin are always included):",
+    "  1. Percival",
+    "  2. Morgana",
+    "  3. Mordred",
+    "  4. Oberon",
+    "\nEnter numbers separated by spaces (e.g., '2 3' for Morgana and Mordred), "
+    "or press Enter to skip:",
+)
+
+
 def _prompt_optional_roles(
     backend: InteractionIO,
     log: list[InteractionLogEntry],
 ) -> list[RoleType]:
     """Prompt user to select optional special characters to include."""
-    _write(
-        backend,
-        log,
-        "\nOptional special characters (Merlin and Assassin are always included):",
-    )
-    _write(backend, log, "  1. Percival")
-    _write(backend, log, "  2. Morgana")
-    _write(backend, log, "  3. Mordred")
-    _write(backend, log, "  4. Oberon")
-    _write(
-        backend,
-        log,
-        "\nEnter numbers separated by spaces (e.g., '2 3' for Morgana and Mordred), "
-        "or press Enter to skip:",
-    )
+    _write_lines(backend, log, _OPTIONAL_ROLE_MENU)
 
     response = _read(backend, log, "> ").strip()
     if not response:
         return []
 
-    role_map = {
-        "1": RoleType.PERCIVAL,
-        "2": RoleType.MORGANA,
-        "3": RoleType.MORDRED,
-        "4": RoleType.OBERON,
-    }
-
-    tokens = response.replace(",", " ").split()
+    tokens = response.translate(_COMMA_TO_SPACE).split()
     selected_roles: list[RoleType] = []
+    seen: set[RoleType] = set()
 
     for token in tokens:
-        if token in role_map:
-            role = role_map[token]
-            if role not in selected_roles:
-                selected_roles.append(role)
-        else:
-            _write(backend, log, f"  Warning: ignoring invalid selection '{token}'")
+        match token:
+            case "1":
+                role = RoleType.PERCIVAL
+            case "2":
+                role = RoleType.MORGANA
+            case "3":
+                role = RoleType.MORDRED
+            case "4":
+                role = RoleType.OBERON
+            case _:
+                _write(backend, log, f"  Warning: ignoring invalid selection '{token}'")
+                continue
+        if role not in seen:
+            seen.add(role)
+            selected_roles.append(role)
 
     if selected_roles:
-        names = [role.value.replace("_", " ").title() for role in selected_roles]
+        names = [_ROLE_TITLES[role] for role in selected_roles]
         _write(backend, log, f"Selected: {', '.join(names)}")
     else:
         _write(backend, log, "No optional roles selected.")
@@ -332,9 +380,8 @@ def _prompt_optional_roles(
 def _announce_roster(
     players: tuple[Player, ...], backend: InteractionIO, log: list[InteractionLogEntry]
 ) -> None:
-    _write(backend, log, "\nRoster:")
-    for player in players:
-        _write(backend, log, f"  {player.player_id}: {player.display_name}")
+    roster = [f"  {player.player_id}: {player.display_name}" for player in players]
+    _write_lines(backend, log, ["\nRoster:", *roster])
 
 
 def _announce_round(
@@ -358,22 +405,32 @@ def _handle_team_proposal(
     public_statements: list[Tuple[str, str, str]] | None = None,
     logging_manager: LoggingManager | None = None,
 ) -> None:
-    required_size = state.config.mission_config.team_sizes[state.round_number - 1]
+    required_size = state.required_team_size
     leader = state.current_leader
     _write(backend, log, f"Leader: {leader.display_name} ({leader.player_id})")
 
     # Check if leader is an agent
     if agent_manager and agent_manager.is_agent(leader.player_id, state):
         _write(backend, log, f"  [Agent {leader.display_name} is selecting team...]")
-        observation = agent_manager._build_observation(leader.player_id, state)
-        proposal = agent_manager.propose_team(leader.player_id, state)
+        observation = agent_manager.observation_for(leader.player_id, state)
+        # Display public reasoning (not private!), as it arrives when streamed
+        propose_stream = getattr(agent_manager, "propose_team_stream", None)
+        if propose_stream is not None:
+            proposal = _write_quoted_stream(
+                backend,
+                log,
+                f"  {leader.display_name} says: ",
+                propose_stream(leader.player_id, state),
+            )
+        else:
+            proposal = agent_manager.propose_team(leader.player_id, state)
+            if proposal.public_reasoning:
+                _write(backend, log, f'  {leader.display_name} says: "{proposal.public_reasoning}"')
         # Log the decision if logging is enabled
         if logging_manager:
             logging_manager.log_team_proposal(leader.player_id, observation, proposal)
         team = proposal.team
-        # Display public reasoning (not private!)
         if proposal.public_reasoning:
-            _write(backend, log, f'  {leader.display_name} says: "{proposal.public_reasoning}"')
             # Track public statement for other agents
             if public_statements is not None:
                 public_statements.append(
@@ -422,26 +479,27 @@ def _handle_team_vote(
     logging_manager: LoggingManager | None = None,
 ) -> None:
     votes: dict[str, bool] = {}
+    agent_ids: list[str] = []
+    if agent_manager:
+        agent_ids = [
+            player.player_id
+            for player in state.players
+            if agent_manager.is_agent(player.player_id, state)
+        ]
+    prefetched: dict[str, Any] = {}
+    pending: Future[dict[str, Any]] | None = None
+    if agent_ids and len(agent_ids) < len(state.players):
+        # Votes are simultaneous and hidden, so agents decide on a worker thread
+        # while the humans are prompted; their votes are reported afterwards
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = executor.submit(_prefetch_agent_votes, agent_manager, agent_ids, state)
+        executor.shutdown(wait=False)
+    elif agent_ids:
+        prefetched = _prefetch_agent_votes(agent_manager, agent_ids, state)
+
     for player in state.players:
-        # Check if player is an agent
-        if agent_manager and agent_manager.is_agent(player.player_id, state):
-            _write(backend, log, f"  [Agent {player.display_name} is voting...]")
-            observation = agent_manager._build_observation(player.player_id, state)
-            decision = agent_manager.vote_on_team(player.player_id, state)
-            # Log the decision if logging is enabled
-            if logging_manager:
-                logging_manager.log_team_vote(player.player_id, observation, decision)
-            votes[player.player_id] = decision.approve
-            vote_str = "APPROVE" if decision.approve else "REJECT"
-            _write(backend, log, f"  {player.display_name}: {vote_str}")
-            # Display public reasoning (not private!)
-            if decision.public_reasoning:
-                _write(backend, log, f'    Says: "{decision.public_reasoning}"')
-                # Track public statement for other agents
-                if public_statements is not None:
-                    public_statements.append((player.player_id, "vote", decision.public_reasoning))
+        if player.player_id in agent_ids:
             continue
-
         while True:
             response = (
                 _read_hidden(
@@ -453,12 +511,13 @@ def _handle_team_vote(
                 .strip()
                 .lower()
             )
-            if response in YES_VALUES:
-                votes[player.player_id] = True
-                break
-            if response in NO_VALUES:
-                votes[player.player_id] = False
-                break
+            match response:
+                case "y" | "yes" | "approve" | "a":
+                    votes[player.player_id] = True
+                    break
+                case "n" | "no" | "reject" | "r":
+                    votes[player.player_id] = False
+                    break
             _write(
                 backend,
                 log,
@@ -467,6 +526,27 @@ def _handle_team_vote(
                 audience=[player_audience_tag(player.player_id)],
             )
 
+    if pending is not None:
+        prefetched = pending.result()
+    for player_id in agent_ids:
+        assert agent_manager is not None  # agent_ids is only filled with a manager
+        player = state.players_by_id[player_id]
+        _write(backend, log, f"  [Agent {player.display_name} is voting...]")
+        observation = agent_manager.observation_for(player_id, state)
+        decision = prefetched.get(player_id) or agent_manager.vote_on_team(player_id, state)
+        # Log the decision if logging is enabled
+        if logging_manager:
+            logging_manager.log_team_vote(player_id, observation, decision)
+        votes[player_id] = decision.approve
+        vote_str = "APPROVE" if decision.approve else "REJECT"
+        _write(backend, log, f"  {player.display_name}: {vote_str}")
+        # Display public reasoning (not private!)
+        if decision.public_reasoning:
+            _write(backend, log, f'    Says: "{decision.public_reasoning}"')
+            # Track public statement for other agents
+            if public_statements is not None:
+                public_statements.append((player_id, "vote", decision.public_reasoning))
+
     record = state.vote_on_team(votes)
     outcome = "approved" if record.approved else "rejected"
     summary = (
@@ -476,6 +556,24 @@ def _handle_team_vote(
     _write(backend, log, summary)
 
 
+def _prefetch_agent_votes(
+    agent_manager: Any, agent_ids: list[str], state: GameState
+) -> dict[str, Any]:
+    """Collect agent votes up front when the client can answer several at once.
+
+    Batch-capable clients share prompts across concurrent requests and
+    async-capable clients vote concurrently; others return nothing and are
+    asked one by one afterwards.
+    """
+    if getattr(agent_manager, "supports_batch_votes", False):
+        batch = asyncio.run(agent_manager.batch_vote_on_team(agent_ids, state))
+    elif getattr(agent_manager, "supports_async", False):
+        batch = asyncio.run(agent_manager.vote_on_team_batch(agent_ids, state))
+    else:
+        return {}
+    return dict(zip(agent_ids, batch, strict=True))
+
+
 def _handle_mission(
     state: GameState,
     backend: InteractionIO,
@@ -487,8 +585,20 @@ def _handle_mission(
     decisions: dict[str, MissionDecision] = {}
     assert state.current_team is not None  # defensive
 
-    # Track current mission statements separately for display
-    current_mission_statements: list[Tuple[str, str, str]] = []
+    # Explanation lines for this mission only, shown once the result is known
+    explanations: list[str] = []
+
+    # Async-capable clients play every agent card concurrently, as for votes
+    prefetched: dict[str, Any] = {}
+    if agent_manager and getattr(agent_manager, "supports_async", False):
+        agent_ids = [
+            player_id
+            for player_id in state.current_team
+            if agent_manager.is_agent(player_id, state)
+        ]
+        if agent_ids:
+            batch = asyncio.run(agent_manager.execute_mission_batch(agent_ids, state))
+            prefetched = dict(zip(agent_ids, batch, strict=True))
 
     for player_id in state.current_team:
         player = state.players_by_id[player_id]
@@ -496,8 +606,8 @@ def _handle_mission(
         # Check if player is an agent
         if agent_manager and agent_manager.is_agent(player_id, state):
             _write(backend, log, f"  [Agent {player.display_name} is submitting card...]")
-            observation = agent_manager._build_observation(player_id, state)
-            action = agent_manager.execute_mission(player_id, state)
+            observation = agent_manager.observation_for(player_id, state)
+            action = prefetched.get(player_id) or agent_manager.execute_mission(player_id, state)
             # Log the decision if logging is enabled
             if logging_manager:
                 logging_manager.log_mission_action(player_id, observation, action)
@@ -510,8 +620,8 @@ def _handle_mission(
                 # Store in global list for agent observations (full history)
                 if public_statements is not None:
                     public_statements.append((player_id, "mission", action.public_reasoning))
-                # Also track locally for current mission display only
-                current_mission_statements.append((player_id, "mission", action.public_reasoning))
+                # Also format it now for the current mission's display
+                explanations.append(f'  {player.display_name}: "{action.public_reasoning}"')
             continue
 
         while True:
@@ -525,12 +635,13 @@ def _handle_mission(
                 .strip()
                 .lower()
             )
-            if response in SUCCESS_VALUES:
-                decisions[player_id] = MissionDecision.SUCCESS
-                break
-            if response in FAIL_VALUES:
-                decisions[player_id] = MissionDecision.FAIL
-                break
+            match response:
+                case "s" | "success":
+                    decisions[player_id] = MissionDecision.SUCCESS
+                    break
+                case "f" | "fail":
+                    decisions[player_id] = MissionDecision.FAIL
+                    break
             _write(
                 backend,
                 log,
@@ -548,11 +659,8 @@ def _handle_mission(
     )
 
     # Now display agent public reasoning about their mission actions (current mission only)
-    if current_mission_statements:
-        _write(backend, log, "\nPlayers explain their actions:")
-        for player_id, _, statement in current_mission_statements:
-            player_name = state.players_by_id[player_id].display_name
-            _write(backend, log, f'  {player_name}: "{statement}"')
+    if explanations:
+        _write_lines(backend, log, ["\nPlayers explain their actions:", *explanations])
 
 
 def _handle_assassination(
@@ -581,7 +689,7 @@ def _handle_assassination(
     # Check if assassin is an agent
     if agent_manager and agent_manager.is_agent(assassin_id, state):
         _write(backend, log, f"  [Agent {assassin.display_name} is guessing Merlin...]")
-        observation = agent_manager._build_observation(assassin_id, state)
+        observation = agent_manager.observation_for(assassin_id, state)
         guess = agent_manager.guess_merlin(assassin_id, state)
         # Log the decision if logging is enabled
         if logging_manager:
@@ -633,6 +741,23 @@ def _handle_assassination(
             )
 
 
+def _statement_limit_reached(state: GameState, player_id: str) -> bool:
+    """Return True if the player has used all statements allowed this phase."""
+    limit = state.config.discussion_config.max_statements_per_phase
+    if not limit or not state.current_discussion:
+        return False
+    return len(state.current_discussion.get_statements_by_player(player_id)) >= limit
+
+
+# Discussion held before each phase's handler runs, keyed by the phase being played
+_PHASE_STEPS: dict[GamePhase, tuple[DiscussionPhase | None, Callable[..., None]]] = {
+    GamePhase.TEAM_PROPOSAL: (DiscussionPhase.PRE_PROPOSAL, _handle_team_proposal),
+    GamePhase.TEAM_VOTE: (DiscussionPhase.PRE_VOTE, _handle_team_vote),
+    GamePhase.MISSION: (None, _handle_mission),
+    GamePhase.ASSASSINATION_PENDING: (DiscussionPhase.PRE_ASSASSINATION, _handle_assassination),
+}
+
+
 def _handle_discussion(
     state: GameState,
     phase: DiscussionPhase,
@@ -672,8 +797,14 @@ def _handle_discussion(
         DiscussionPhase.POST_MISSION_RESULT: "Post-Mission Discussion",
         DiscussionPhase.PRE_ASSASSINATION: "Pre-Assassination Discussion",
     }
-    _write(backend, log, f"\n--- {phase_names[phase]} ---")
-    _write(backend, log, "Players may now discuss. Type 'pass' to skip your turn.\n")
+    _write_lines(
+        backend,
+        log,
+        [
+            f"\n--- {phase_names[phase]} ---",
+            "Players may now discuss. Type 'pass' to skip your turn.\n",
+        ],
+    )
 
     # Start discussion in game state
     state.start_discussion(phase)
@@ -685,20 +816,42 @@ def _handle_discussion(
         _write(backend, log, f"Discussion round {round_num + 1}:")
         any_statements = False
 
+        # Simultaneous mode asks every eligible agent up front so batch-capable
+        # clients answer the whole round together and async clients concurrently
+        prefetched: dict[str, Any] = {}
+        if config.simultaneous_agent_statements and agent_manager:
+            speaker_ids = [
+                player.player_id
+                for player in state.players
+                if agent_manager.is_agent(player.player_id, state)
+                and not _statement_limit_reached(state, player.player_id)
+            ]
+            if len(speaker_ids) > 1:
+                batched = getattr(agent_manager, "supports_batch_statements", False)
+                concurrent = getattr(agent_manager, "supports_async", False)
+                try:
+                    if concurrent and not batched:
+                        batch = asyncio.run(
+                            agent_manager.make_statements_concurrently(speaker_ids, state, phase)
+                        )
+                    else:
+                        batch = agent_manager.batch_make_statement(speaker_ids, state, phase)
+                    prefetched = dict(zip(speaker_ids, batch, strict=True))
+                except Exception:
+                    prefetched = {}  # Fall back to asking each agent in turn
+
         for player in state.players:
             # Check if player has already made max statements
-            if config.max_statements_per_phase and state.current_discussion:
-                player_statements = state.current_discussion.get_statements_by_player(
-                    player.player_id
-                )
-                if len(player_statements) >= config.max_statements_per_phase:
-                    continue
+            if _statement_limit_reached(state, player.player_id):
+                continue
 
             # Check if this is an agent player
             if agent_manager and agent_manager.is_agent(player.player_id, state):
                 # Get agent to make a statement
                 try:
-                    response = agent_manager.make_statement(player.player_id, state, phase)
+                    response = prefetched.get(player.player_id) or agent_manager.make_statement(
+                        player.player_id, state, phase
+                    )
 
                     # Agent chooses to pass if message is empty
                     if not response.message or response.message.strip() == "":
@@ -778,8 +931,12 @@ def _handle_discussion(
     _write(backend, log, "")
 
 
+# Commas and whitespace both separate ids in typed lists
+_COMMA_TO_SPACE = str.maketrans(",", " ")
+
+
 def _parse_team(entry: str) -> tuple[str, ...] | None:
-    tokens = [token for token in entry.replace(",", " ").split(" ") if token]
+    tokens = entry.translate(_COMMA_TO_SPACE).split()
     return tuple(tokens) if tokens else None
 
 
@@ -804,7 +961,17 @@ def _deliver_private_briefings(
             "Moderators should share each briefing with the appropriate player only.",
         )
 
-    players_by_id = {player.player_id: player for player in setup.players}
+    # Each player's label and full identity card are formatted once per game
+    role_titles: dict[str, str] = {}
+    labels: dict[str, str] = {}
+    cards: dict[str, str] = {}
+    for known_player in setup.players:
+        player_id = known_player.player_id
+        role_titles[player_id] = _ROLE_TITLES[known_player.role]
+        labels[player_id] = f"{known_player.display_name} ({player_id})"
+        alignment = _ALIGNMENT_TITLES[ROLE_DEFINITIONS[known_player.role].alignment]
+        cards[player_id] = f"{labels[player_id]} - {role_titles[player_id]} [{alignment}]"
+
     for briefing in setup.briefings:
         player = briefing.player
 
@@ -814,37 +981,20 @@ def _deliver_private_briefings(
 
         definition = ROLE_DEFINITIONS[player.role]
         lines = [
-            f"Private briefing for {player.display_name} ({player.player_id})",
-            f"Role: {player.role.value.replace('_', ' ').title()}",
-            f"Alignment: {definition.alignment.value.title()}",
+            f"Private briefing for {labels[player.player_id]}",
+            f"Role: {role_titles[player.player_id]}",
+            f"Alignment: {_ALIGNMENT_TITLES[definition.alignment]}",
         ]
         knowledge = briefing.knowledge
         if knowledge.visible_player_ids:
-            visible_names = []
-            for player_id in knowledge.visible_player_ids:
-                known_player = players_by_id[player_id]
-                known_role = known_player.role
-                known_def = ROLE_DEFINITIONS[known_role]
-                # Show detailed info about what we know
-                visible_names.append(
-                    f"{known_player.display_name} ({player_id}) - "
-                    f"{known_role.value.replace('_', ' ').title()} "
-                    f"[{known_def.alignment.value.title()}]"
-                )
+            visible_names = [cards[player_id] for player_id in knowledge.visible_player_ids]
             lines.append("You learn the identities of: " + ", ".join(visible_names))
         if knowledge.ambiguous_player_id_groups:
             group_descriptions = []
             for group in knowledge.ambiguous_player_id_groups:
-                group_names = []
+                group_names = [labels[player_id] for player_id in group]
                 # Determine what roles are possible for this ambiguous group
-                possible_roles = set()
-                for player_id in group:
-                    known_player = players_by_id[player_id]
-                    possible_roles.add(known_player.role.value.replace("_", " ").title())
-
-                for player_id in group:
-                    known_player = players_by_id[player_id]
-                    group_names.append(f"{known_player.display_name} ({player_id})")
+                possible_roles = {role_titles[player_id] for player_id in group}
 
                 # Add explanation of what each could be
                 roles_desc = " or ".join(sorted(possible_roles))
@@ -944,37 +1094,86 @@ def _write(
     audience: Sequence[str] | None = None,
 ) -> None:
     backend.write(message)
+    if audience is None and visibility is _PUBLIC:
+        # Most output is a plain public line; skip the audience interning
+        log.append(InteractionLogEntry(_OUTPUT, message))
+        return
+    log.append(InteractionLogEntry(_OUTPUT, message, None, visibility, _audience_tuple(audience)))
+
+
+def _write_lines(
+    backend: InteractionIO, log: list[InteractionLogEntry], messages: Sequence[str]
+) -> None:
+    """Write public messages as one block; the transcript keeps an entry per message.
+
+    Backends with a ``write_lines`` method receive the block in one call.
+    """
+    write_lines = getattr(backend, "write_lines", None)
+    if write_lines is not None:
+        write_lines(messages)
+    else:
+        for message in messages:
+            backend.write(message)
+    log.extend(InteractionLogEntry(_OUTPUT, message) for message in messages)
+
+
+def _write_quoted_stream(
+    backend: InteractionIO,
+    log: list[InteractionLogEntry],
+    prefix: str,
+    stream: Generator[str, None, _T],
+) -> _T:
+    """Write ``prefix`` and the streamed words in quotes, returning the stream's result.
+
+    Backends with a ``write_stream`` method show chunks as they arrive; others
+    get one ``write`` at the end. Nothing is written when the stream yields no
+    text, and the transcript records a single entry either way.
+    """
+    try:
+        first = next(stream)
+    except StopIteration as stop:
+        return stop.value
+    parts = [first]
+    result: list[_T] = []
+
+    def quoted() -> Iterator[str]:
+        yield f'{prefix}"{first}'
+        while True:
+            try:
+                chunk = next(stream)
+            except StopIteration as stop:
+                result.append(stop.value)
+                break
+            parts.append(chunk)
+            yield chunk
+        yield '"'
+
+    write_stream = getattr(backend, "write_stream", None)
+    if write_stream is not None:
+        write_stream(quoted())
+    else:
+        backend.write("".join(quoted()))
     log.append(
         InteractionLogEntry(
             event=InteractionEventType.OUTPUT,
-            message=message,
-            visibility=visibility,
-            audience=_audience_tuple(audience),
+            message=f'{prefix}"{"".join(parts)}"',
+            visibility=EventVisibility.PUBLIC,
+            audience=_audience_tuple(None),
         )
     )
+    return result[0]
 
 
-def _filter_transcript(
-    entries: Sequence[InteractionLogEntry],
-    audience_tags: Sequence[str],
-    include_private: bool,
-) -> tuple[InteractionLogEntry, ...]:
-    allowed = set(audience_tags)
-    matched: list[InteractionLogEntry] = []
-    for entry in entries:
-        if entry.visibility is EventVisibility.PUBLIC:
-            matched.append(entry)
-            continue
-        if include_private:
-            matched.append(entry)
-            continue
-        if any(tag in allowed for tag in entry.audience):
-            matched.append(entry)
-    return tuple(matched)
+# A game only ever addresses a handful of audiences, so transcript entries share
+# one tuple per distinct audience instead of each holding its own copy
+_AUDIENCES: dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
 
 def _audience_tuple(audience: Sequence[str] | None) -> Tuple[str, ...]:
-    return tuple(audience or ())
+    if not audience:
+        return ()
+    key = tuple(audience)
+    return _AUDIENCES.setdefault(key, key)
 
 
 def main() -> None:  # pragma: no cover - CLI entry point
@@ -0,0 +1,95 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson parses and serialises several times faster than the standard library;
+the standard library is used transparently when it is absent.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Sequence
+
+_orjson: Any
+try:
+    import orjson
+
+    _orjson = orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    _orjson = None
+
+
+# json.dumps builds a new encoder whenever options are passed; reuse one instead
+_compact_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid (orjson's error type
+            subclasses it, so callers can catch one exception either way).
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_compact(obj: Any) -> str:
+    """Serialise ``obj`` without insignificant whitespace."""
+    if _orjson is not None:
+        try:
+            return str(_orjson.dumps(obj).decode("utf-8"))
+        except TypeError:
+            pass  # e.g. non-string keys; the standard library coerces them
+    return _compact_encode(obj)
+
+
+def dumps_lines(objs: Sequence[Any]) -> str:
+    """Serialise each object compactly and join them as newline-delimited JSON."""
+    if _orjson is not None:
+        try:
+            return b"\n".join([_orjson.dumps(obj) for obj in objs]).decode("utf-8")
+        except TypeError:
+            pass  # Fall back line by line below
+    return "\n".join([dumps_compact(obj) for obj in objs])
+
+
+class JsonObjectScanner:
+    """Detect when the first top-level JSON object in streamed text has closed.
+
+    Text is fed in arbitrary chunks (e.g. streamed LLM tokens). Braces inside
+    strings and escaped quotes are ignored; anything before the first ``{`` is
+    skipped, matching how LLM responses are parsed.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "complete")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.complete = False
+
+    def feed(self, text: str) -> bool:
+        """Consume ``text`` and return ``True`` once the object is complete."""
+        for char in text:
+            if self.complete:
+                break
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"' and self.depth:
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+            elif char == "}" and self.depth:
+                self.depth -= 1
+                self.complete = self.depth == 0
+        return self.complete
+
+
+__all__ = ["JsonObjectScanner", "dumps_compact", "dumps_lines", "loads"]
@@ -0,0 +1,233 @@
+"""Persistent caching of LLM decisions keyed on agent observations."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+from . import json_codec
+from .agents import (
+    AgentObservation,
+    AssassinationGuess,
+    DiscussionResponse,
+    MissionAction,
+    TeamProposal,
+    VoteDecision,
+)
+from .discussion import DiscussionPhase
+
+if TYPE_CHECKING:
+    from .agent_manager import LLMClient
+
+DEFAULT_DB_PATH = Path.home() / ".cache" / "avalon" / "cache.db"
+
+# Environment variable that turns on DiskCachedClient in the run scripts
+CACHE_ENV_VAR = "AVALON_LLM_CACHE"
+
+
+def decision_key(method: str, observation: AgentObservation, model: str, *extra: str) -> str:
+    """Return a model-scoped digest of one decision request as canonical JSON."""
+    payload = {
+        "method": method,
+        "observation": asdict(observation),
+        "model": model,
+        "extra": list(extra),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _decode_team_proposal(data: dict[str, Any]) -> TeamProposal:
+    return TeamProposal(
+        team=tuple(data["team"]),
+        true_reasoning=data.get("true_reasoning", ""),
+        public_reasoning=data.get("public_reasoning", ""),
+    )
+
+
+_DECODERS: dict[str, Any] = {
+    "propose_team": _decode_team_proposal,
+    "vote_on_team": lambda data: VoteDecision(**data),
+    "execute_mission": lambda data: MissionAction(**data),
+    "guess_merlin": lambda data: AssassinationGuess(**data),
+    "make_statement": lambda data: DiscussionResponse(**data),
+}
+
+
+class _CachedDecisions(ABC):
+    """Shared LLMClient surface for caches; subclasses supply key and storage."""
+
+    client: LLMClient
+    hits: int
+    misses: int
+
+    @abstractmethod
+    def _key(self, method: str, observation: AgentObservation, *extra: str) -> str:
+        """Return the storage key for one decision request."""
+
+    @abstractmethod
+    def _load(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response for ``key``, or None on a miss."""
+
+    @abstractmethod
+    def _store(self, key: str, encoded: dict[str, Any]) -> None:
+        """Persist an encoded response under ``key``."""
+
+    def propose_team(self, observation: AgentObservation) -> TeamProposal:
+        return self._cached("propose_team", observation)
+
+    def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return self._cached("vote_on_team", observation)
+
+    def execute_mission(self, observation: AgentObservation) -> MissionAction:
+        return self._cached("execute_mission", observation)
+
+    def guess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return self._cached("guess_merlin", observation)
+
+    def make_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        return self._cached("make_statement", observation, phase)
+
+    def _lookup(self, method: str, observation: AgentObservation, *args: Any) -> tuple[str, Any]:
+        key = self._key(method, observation, *(str(arg) for arg in args))
+        stored = self._load(key)
+        if stored is None:
+            self.misses += 1
+            return key, None
+        self.hits += 1
+        return key, _DECODERS[method](stored)
+
+    def _cached(self, method: str, observation: AgentObservation, *args: Any) -> Any:
+        key, response = self._lookup(method, observation, *args)
+        if response is None:
+            response = getattr(self.client, method)(observation, *args)
+            self._store(key, asdict(response))
+        return response
+
+
+@dataclass
+class DiskCachedClient(_CachedDecisions):
+    """LLM client wrapper that records every decision in SQLite for replay.
+
+    Keys cover the method, the full observation and the wrapped client's
+    model, so a cache recorded against one model is never served to another.
+    Batched votes are stored per voter, so any subset of a recorded batch is
+    answered from disk and only the missing voters reach the client. Coroutine
+    variants are provided so wrapping keeps concurrent voting available.
+    """
+
+    client: LLMClient
+    path: Path = DEFAULT_DB_PATH
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model = str(getattr(self.client, "model_name", type(self.client).__name__))
+        # Async callers touch the cache from the event loop while sync calls may
+        # come from worker threads, so share one connection behind a lock.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS decisions (key TEXT PRIMARY KEY, response BLOB)"
+            )
+
+    @classmethod
+    def wrap_from_env(cls, client: LLMClient, path: Path = DEFAULT_DB_PATH) -> LLMClient:
+        """Wrap ``client`` when ``AVALON_LLM_CACHE=1`` is set, else return it unchanged."""
+        if os.environ.get(CACHE_ENV_VAR) == "1":
+            return cls(client, path=path)
+        return client
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _key(self, method: str, observation: AgentObservation, *extra: str) -> str:
+        return decision_key(method, observation, self.model, *extra)
+
+    def _load(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM decisions WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else dict(json_codec.loads(row[0]))
+
+    def _store(self, key: str, encoded: dict[str, Any]) -> None:
+        blob = json_codec.dumps_compact(encoded).encode("utf-8")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO decisions (key, response) VALUES (?, ?)", (key, blob)
+            )
+
+    @property
+    def batch_votes(self) -> bool:
+        """Batch votes only when the wrapped client would."""
+        if not callable(getattr(self.client, "vote_on_team_batch", None)):
+            return False
+        return bool(getattr(self.client, "batch_votes", True))
+
+    def vote_on_team_batch(self, observations: Sequence[AgentObservation]) -> list[VoteDecision]:
+        """Answer cached voters from disk and forward only the rest as one batch."""
+        lookups = [self._lookup("vote_on_team", observation) for observation in observations]
+        missing = [index for index, (_, decision) in enumerate(lookups) if decision is None]
+        decisions: list[VoteDecision | None] = [decision for _, decision in lookups]
+        if missing:
+            pending = [observations[index] for index in missing]
+            batch_vote = getattr(self.client, "vote_on_team_batch", None)
+            if batch_vote is not None:
+                fresh = list(batch_vote(pending))
+            else:
+                fresh = [self.client.vote_on_team(observation) for observation in pending]
+            for index, decision in zip(missing, fresh, strict=True):
+                self._store(lookups[index][0], asdict(decision))
+                decisions[index] = decision
+        return [decision for decision in decisions if decision is not None]
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal:
+        return await self._acached("propose_team", observation)
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        return await self._acached("vote_on_team", observation)
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+        return await self._acached("execute_mission", observation)
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return await self._acached("guess_merlin", observation)
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        return await self._acached("make_statement", observation, phase)
+
+    async def _acached(self, method: str, observation: AgentObservation, *args: Any) -> Any:
+        key, response = self._lookup(method, observation, *args)
+        if response is None:
+            async_method = getattr(self.client, f"a{method}", None)
+            if async_method is not None:
+                response = await async_method(observation, *args)
+            else:
+                response = await asyncio.to_thread(getattr(self.client, method), observation, *args)
+            self._store(key, asdict(response))
+        return response
+
+
+__all__ = [
+    "CACHE_ENV_VAR",
+    "DEFAULT_DB_PATH",
+    "DiskCachedClient",
+    "decision_key",
+]
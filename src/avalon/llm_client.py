@@ -7,16 +7,21 @@ for cost optimization.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Sequence
 
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 
+from . import json_codec
+from .agent_manager import LLMClient
 from .agents import (
     AgentObservation,
     AssassinationGuess,
@@ -28,30 +33,10 @@ from .agents import (
 from .discussion import DiscussionPhase
 from .enums import Alignment, RoleType
 from .exceptions import ConfigurationError
+from .game_state import MissionResult
 
-
-class LLMClient(Protocol):
-    """Protocol for LLM clients that generate agent decisions."""
-
-    def propose_team(self, observation: AgentObservation) -> TeamProposal:
-        """Generate a team proposal based on game observation."""
-        ...
-
-    def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
-        """Generate a vote decision based on game observation."""
-        ...
-
-    def execute_mission(self, observation: AgentObservation) -> MissionAction:
-        """Generate a mission action based on game observation."""
-        ...
-
-    def guess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
-        """Generate an assassination guess based on game observation."""
-        ...
-
-    def make_statement(self, observation: AgentObservation, phase: str) -> DiscussionResponse:
-        """Generate a discussion statement based on game observation."""
-        ...
+# Upper bound on concurrent requests issued by BaseLLMClient.generate_batch
+MAX_BATCH_WORKERS = 8
 
 
 class BaseLLMClient(ABC):
@@ -59,19 +44,50 @@ class BaseLLMClient(ABC):
 
     Subclasses must implement:
     - __post_init__(): Initialize the API client
-    - _generate_text(prompt: str) -> str: Generate text from prompt
+    - _generate_text(prompt: str, system_prompt: str | None) -> str: Generate text from prompt
 
     Subclasses should define these attributes:
     - temperature: float
     - max_retries: int
     - base_retry_delay: float
+    - _system_prompt_cache: dict[RoleType, str], an empty per-instance dict
     """
 
+    # Opt in to shared-knowledge vote prompts (vote_on_team_batch); by default
+    # AgentManager sends every vote as its own concurrent request.
+    batch_votes: bool = False
+    _system_prompt_cache: dict[RoleType, str]
+
     @abstractmethod
-    def _generate_text(self, prompt: str) -> str:
-        """Generate text from prompt. Must be implemented by subclasses."""
+    def _generate_text(self, prompt: str, system_prompt: str | None = None) -> str:
+        """Generate text from prompt. Must be implemented by subclasses.
+
+        ``system_prompt`` is the static prefix from :meth:`_build_system_prompt`.
+        Providers that support it should send it as a separate system message so
+        their prompt caching can reuse it; others can use :meth:`_join_prompt`.
+        """
         ...
 
+    @staticmethod
+    def _join_prompt(prompt: str, system_prompt: str | None) -> str:
+        """Combine a system prompt and a prompt into a single text prompt."""
+        return f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+
+    def _build_system_prompt(self, observation: AgentObservation) -> str:
+        """Return the static game and role guidance that starts every prompt.
+
+        It depends only on the player's role, so it is built once per role and
+        reused; keeping it byte-identical across calls lets provider-side prefix
+        caching skip re-encoding it.
+        """
+        system_prompt = self._system_prompt_cache.get(observation.role)
+        if system_prompt is None:
+            system_prompt = (
+                f"{self._build_game_context()}\n{self._build_role_guidance(observation)}"
+            )
+            self._system_prompt_cache[observation.role] = system_prompt
+        return system_prompt
+
     def _build_game_context(self) -> str:
         """Build general game context and strategic guidance."""
         return """You are playing The Resistance: Avalon, a social deduction game of \
@@ -414,7 +430,7 @@ AVOID THESE COMMON MISTAKES:
             # Track players on failed missions
             failed_mission_players: dict[str, int] = {}
             for mission in observation.mission_history:
-                if mission.result.value == "failure":
+                if mission.result is MissionResult.FAILURE:
                     for pid in mission.team:
                         failed_mission_players[pid] = failed_mission_players.get(pid, 0) + 1
 
@@ -461,8 +477,7 @@ AVOID THESE COMMON MISTAKES:
 
     def propose_team(self, observation: AgentObservation) -> TeamProposal:
         """Generate a team proposal using Gemini."""
-        game_context = self._build_game_context()
-        role_guidance = self._build_role_guidance(observation)
+        system_prompt = self._build_system_prompt(observation)
         observation_context = self._build_observation_context(observation)
 
         # Build previously rejected teams warning
@@ -488,10 +503,7 @@ AVOID THESE COMMON MISTAKES:
                     "Don't repeat what was rejected!\n"
                 )
 
-        prompt = f"""{game_context}
-{role_guidance}
-
-{observation_context}
+        prompt = f"""{observation_context}
 {rejected_teams_warning}
 DECISION: TEAM PROPOSAL
 You are the mission leader. You must propose a team of exactly \
@@ -569,7 +581,7 @@ Respond with a JSON object with BOTH true and public reasoning:
 
 Your response:"""
 
-        response_text = self._generate_text(prompt)
+        response_text = self._generate_text(prompt, system_prompt)
         parsed = self._parse_json_response(response_text)
 
         team = tuple(parsed.get("team", []))
@@ -611,47 +623,12 @@ Your response:"""
 
     def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
         """Generate a vote decision using Gemini."""
-        from .enums import Alignment
-
-        game_context = self._build_game_context()
-        role_guidance = self._build_role_guidance(observation)
+        system_prompt = self._build_system_prompt(observation)
         observation_context = self._build_observation_context(observation)
 
-        # Build urgency warning for 5th attempt
-        urgency_warning = ""
-        if observation.consecutive_rejections >= 4:
-            if observation.alignment == Alignment.RESISTANCE:
-                urgency_warning = """
-!!!!! CRITICAL GAME-ENDING DECISION !!!!!
-This is the 5th consecutive team proposal. If this team is rejected, THE GAME ENDS
-IMMEDIATELY and EVIL WINS. This is not just a failed mission - it's the END OF THE
-ENTIRE GAME. As a RESISTANCE player, you MUST APPROVE this team or you lose everything.
-Any team is better than losing the entire game.
-APPROVE OR YOU LOSE EVERYTHING.
-"""
-            else:
-                urgency_warning = """
-!!!!! CRITICAL 5TH ATTEMPT - STRATEGIC TRAP !!!!!
-This is the 5th consecutive team proposal. You might think: "Reject and evil wins!"
-BUT WAIT - Think about the math:
-- ALL resistance players will approve (or lose the game)
-- Resistance has the MAJORITY
-- This team WILL PASS no matter how you vote
-- If you reject, you reveal you're evil for NO BENEFIT
-
-CORRECT EVIL STRATEGY:
-- APPROVE this team (like resistance would)
-- Your rejections gained NOTHING except exposing your identity
-- The only win was getting evil players ON this team (did you succeed?)
-- Blend in now, fail the mission later if you're on it
-
-DO NOT REVEAL YOURSELF BY REJECTING - THE TEAM WILL PASS ANYWAY.
-"""
+        urgency_warning = self._build_vote_urgency_warning(observation)
 
-        prompt = f"""{game_context}
-{role_guidance}
-
-{observation_context}
+        prompt = f"""{observation_context}
 {urgency_warning}
 DECISION: TEAM VOTE
 You must vote to APPROVE or REJECT the proposed team.
@@ -780,9 +757,116 @@ Respond with a JSON object with BOTH true and public reasoning:
 
 Your response:"""
 
-        response_text = self._generate_text(prompt)
+        response_text = self._generate_text(prompt, system_prompt)
+        parsed = self._parse_json_response(response_text)
+
+        return self._vote_from_parsed(observation, parsed)
+
+    def vote_on_team_batch(self, observations: Sequence[AgentObservation]) -> list[VoteDecision]:
+        """Generate votes for several players with one prompt.
+
+        Intended for voters that share an alignment and private knowledge, so no
+        one's hidden information leaks into another player's decision. Voters
+        missing from the response (or an unparseable response) fall back to
+        individual :meth:`vote_on_team` calls.
+        """
+        if len(observations) <= 1:
+            return [self.vote_on_team(observation) for observation in observations]
+
+        sections = []
+        for index, observation in enumerate(observations, start=1):
+            sections.append(
+                f"═══ VOTER {index} OF {len(observations)}: {observation.player_id} ═══\n"
+                f"{self._build_role_guidance(observation)}\n\n"
+                f"{self._build_observation_context(observation)}\n"
+                f"{self._build_vote_urgency_warning(observation)}"
+            )
+        voter_sections = "\n\n".join(sections)
+        example_id = observations[0].player_id
+
+        prompt = f"""You are deciding the TEAM VOTE for {len(observations)} players on the same side
+who share the same private knowledge. Decide for each player independently, in that player's
+own voice.
+
+{voter_sections}
+
+DECISION: TEAM VOTE FOR EACH VOTER ABOVE
+- Approve or reject the proposed team for every voter listed
+- Use each voter's own history and discussion statements; their votes need not match
+- At 4 consecutive rejections (5th attempt), every voter should APPROVE
+- Public reasoning is VISIBLE TO ALL PLAYERS: keep it to 1-2 sentences, make each
+  voter sound different, and never reveal alignment
+
+Respond with a JSON object containing one entry per voter:
+{{
+  "votes": [
+    {{
+      "player_id": "{example_id}",
+      "approve": true,
+      "true_reasoning": "this voter's actual strategic thinking",
+      "public_reasoning": "what this voter tells other players"
+    }}
+  ]
+}}
+
+Your response:"""
+
+        response_text = self._generate_text(prompt, self._build_game_context())
         parsed = self._parse_json_response(response_text)
+        entries = parsed.get("votes")
+        by_player: dict[str, dict[str, Any]] = {}
+        if isinstance(entries, list):
+            for entry in entries:
+                if isinstance(entry, dict) and isinstance(entry.get("player_id"), str):
+                    by_player[entry["player_id"]] = entry
+
+        decisions = []
+        for observation in observations:
+            entry = by_player.get(observation.player_id)
+            if entry is None:
+                decisions.append(self.vote_on_team(observation))
+            else:
+                decisions.append(self._vote_from_parsed(observation, entry))
+        return decisions
+
+    def _build_vote_urgency_warning(self, observation: AgentObservation) -> str:
+        """Build the 5th-attempt warning for a team vote, if it applies."""
+        urgency_warning = ""
+        if observation.consecutive_rejections >= 4:
+            if observation.alignment == Alignment.RESISTANCE:
+                urgency_warning = """
+!!!!! CRITICAL GAME-ENDING DECISION !!!!!
+This is the 5th consecutive team proposal. If this team is rejected, THE GAME ENDS
+IMMEDIATELY and EVIL WINS. This is not just a failed mission - it's the END OF THE
+ENTIRE GAME. As a RESISTANCE player, you MUST APPROVE this team or you lose everything.
+Any team is better than losing the entire game.
+APPROVE OR YOU LOSE EVERYTHING.
+"""
+            else:
+                urgency_warning = """
+!!!!! CRITICAL 5TH ATTEMPT - STRATEGIC TRAP !!!!!
+This is the 5th consecutive team proposal. You might think: "Reject and evil wins!"
+BUT WAIT - Think about the math:
+- ALL resistance players will approve (or lose the game)
+- Resistance has the MAJORITY
+- This team WILL PASS no matter how you vote
+- If you reject, you reveal you're evil for NO BENEFIT
+
+CORRECT EVIL STRATEGY:
+- APPROVE this team (like resistance would)
+- Your rejections gained NOTHING except exposing your identity
+- The only win was getting evil players ON this team (did you succeed?)
+- Blend in now, fail the mission later if you're on it
+
+DO NOT REVEAL YOURSELF BY REJECTING - THE TEAM WILL PASS ANYWAY.
+"""
 
+        return urgency_warning
+
+    def _vote_from_parsed(
+        self, observation: AgentObservation, parsed: dict[str, Any]
+    ) -> VoteDecision:
+        """Convert a parsed vote response into a sanitized VoteDecision."""
         approve = bool(parsed.get("approve", False))
         true_reasoning = parsed.get("true_reasoning", "")
         public_reasoning = parsed.get("public_reasoning", "")
@@ -814,13 +898,9 @@ Your response:"""
 
     def execute_mission(self, observation: AgentObservation) -> MissionAction:
         """Generate a mission action using Gemini."""
-        game_context = self._build_game_context()
-        role_guidance = self._build_role_guidance(observation)
+        system_prompt = self._build_system_prompt(observation)
         observation_context = self._build_observation_context(observation)
-        prompt = f"""{game_context}
-{role_guidance}
-
-{observation_context}
+        prompt = f"""{observation_context}
 
 DECISION: MISSION EXECUTION
 You are on the mission team. You must play a SUCCESS or FAIL card.
@@ -889,7 +969,7 @@ Examples:
 
 Your response:"""
 
-        response_text = self._generate_text(prompt)
+        response_text = self._generate_text(prompt, system_prompt)
         parsed = self._parse_json_response(response_text)
 
         success = bool(parsed.get("success", False))
@@ -936,13 +1016,9 @@ Your response:"""
 
     def guess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
         """Generate an assassination guess using Gemini."""
-        game_context = self._build_game_context()
-        role_guidance = self._build_role_guidance(observation)
+        system_prompt = self._build_system_prompt(observation)
         observation_context = self._build_observation_context(observation)
-        prompt = f"""{game_context}
-{role_guidance}
-
-{observation_context}
+        prompt = f"""{observation_context}
 
 DECISION: ASSASSINATE MERLIN
 As the Assassin, you must identify and kill Merlin to steal victory from the Resistance.
@@ -987,7 +1063,7 @@ Respond with a JSON object with BOTH true and public reasoning:
 
 Your response:"""
 
-        response_text = self._generate_text(prompt)
+        response_text = self._generate_text(prompt, system_prompt)
         parsed = self._parse_json_response(response_text)
 
         target_id = parsed.get("target_id", observation.all_player_ids[0])
@@ -1009,8 +1085,47 @@ Your response:"""
         self, observation: AgentObservation, phase: DiscussionPhase
     ) -> DiscussionResponse:
         """Generate a discussion statement using the LLM."""
-        game_context = self._build_game_context()
-        role_guidance = self._build_role_guidance(observation)
+        prompt, system_prompt = self._build_statement_prompt(observation, phase)
+        response_text = self._generate_text(prompt, system_prompt)
+        return self._statement_from_parsed(self._parse_json_response(response_text))
+
+    def make_statement_batch(
+        self, observations: Sequence[AgentObservation], phase: DiscussionPhase
+    ) -> list[DiscussionResponse]:
+        """Generate statements for several speakers with one :meth:`generate_batch` call.
+
+        Every speaker sees the same discussion history, so use this only when the
+        statements are meant to be simultaneous.
+        """
+        prompts = self.gather_statement_prompts(observations, phase)
+        return [
+            self._statement_from_parsed(self._parse_json_response(text))
+            for text in self.generate_batch(prompts)
+        ]
+
+    def gather_statement_prompts(
+        self, observations: Sequence[AgentObservation], phase: DiscussionPhase
+    ) -> list[tuple[str, str]]:
+        """Return the ``(prompt, system_prompt)`` pair for each speaker's statement."""
+        return [self._build_statement_prompt(observation, phase) for observation in observations]
+
+    def generate_batch(self, requests: Sequence[tuple[str, str | None]]) -> list[str]:
+        """Generate one completion per ``(prompt, system_prompt)`` pair, in order.
+
+        The default sends the requests concurrently from a small thread pool;
+        providers with a native batch endpoint can override it.
+        """
+        if len(requests) <= 1:
+            return [self._generate_text(prompt, system) for prompt, system in requests]
+        with ThreadPoolExecutor(max_workers=min(len(requests), MAX_BATCH_WORKERS)) as pool:
+            return list(pool.map(lambda request: self._generate_text(*request), requests))
+
+    def _build_statement_prompt(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> tuple[str, str]:
+        """Build the prompt and system prompt for a discussion statement."""
+        phase = DiscussionPhase(phase)  # Plain strings map to the member, so ``is`` is safe
+        system_prompt = self._build_system_prompt(observation)
         observation_context = self._build_observation_context(observation)
 
         # Build discussion context
@@ -1018,9 +1133,9 @@ Your response:"""
 
         # Phase-specific prompts
         mission_result = "UNKNOWN"
-        if phase == DiscussionPhase.POST_MISSION_RESULT and observation.mission_history:
+        if phase is DiscussionPhase.POST_MISSION_RESULT and observation.mission_history:
             last_mission = observation.mission_history[-1]
-            mission_result = "SUCCESS" if last_mission.result.name == "SUCCESS" else "FAILED"
+            mission_result = "SUCCESS" if last_mission.result is MissionResult.SUCCESS else "FAILED"
 
         # Get leader name for clarity
         leader_name = observation.all_player_names[
@@ -1028,14 +1143,14 @@ Your response:"""
         ]
 
         # Build phase-specific guidance with proper team context
-        if phase == DiscussionPhase.PRE_PROPOSAL:
+        if phase is DiscussionPhase.PRE_PROPOSAL:
             phase_guidance_text = (
                 f"This is BEFORE the team proposal. NO TEAM HAS BEEN PROPOSED YET. "
                 f"The leader ({leader_name}) will propose after this discussion. "
                 f"You can suggest who you think would be good team members, but "
                 f"DO NOT say 'I propose' unless you ARE {leader_name}."
             )
-        elif phase == DiscussionPhase.PRE_VOTE:
+        elif phase is DiscussionPhase.PRE_VOTE:
             team_names = (
                 [
                     observation.all_player_names[observation.all_player_ids.index(pid)]
@@ -1050,12 +1165,12 @@ Your response:"""
                 f"This is the ACTUAL team on the table. Discuss whether you trust "
                 f"THIS SPECIFIC team or have concerns about these specific members."
             )
-        elif phase == DiscussionPhase.POST_MISSION_RESULT:
+        elif phase is DiscussionPhase.POST_MISSION_RESULT:
             phase_guidance_text = (
                 f"Mission result: {mission_result}. Discuss what this reveals "
                 f"about team members or who might be evil."
             )
-        elif phase == DiscussionPhase.PRE_ASSASSINATION:
+        elif phase is DiscussionPhase.PRE_ASSASSINATION:
             phase_guidance_text = (
                 "Evil has lost, but the Assassin can win by killing Merlin. "
                 "Discuss who you think Merlin might be (or deflect if you ARE Merlin)."
@@ -1063,10 +1178,7 @@ Your response:"""
         else:
             phase_guidance_text = "Discuss the current game state."
 
-        prompt = f"""{game_context}
-{role_guidance}
-
-{observation_context}
+        prompt = f"""{observation_context}
 
 {discussion_context}
 
@@ -1216,15 +1328,36 @@ Respond with a JSON object:
 }}
 
 Your response:"""
+        return prompt, system_prompt
 
-        response_text = self._generate_text(prompt)
-        parsed = self._parse_json_response(response_text)
-
+    @staticmethod
+    def _statement_from_parsed(parsed: dict[str, Any]) -> DiscussionResponse:
         message = parsed.get("message", "I'll pass for now.")
         true_reasoning = parsed.get("true_reasoning", "")
-
         return DiscussionResponse(message=message, true_reasoning=true_reasoning)
 
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal:
+        """Async variant of :meth:`propose_team` run on a worker thread."""
+        return await asyncio.to_thread(self.propose_team, observation)
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        """Async variant of :meth:`vote_on_team` run on a worker thread."""
+        return await asyncio.to_thread(self.vote_on_team, observation)
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+        """Async variant of :meth:`execute_mission` run on a worker thread."""
+        return await asyncio.to_thread(self.execute_mission, observation)
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        """Async variant of :meth:`guess_merlin` run on a worker thread."""
+        return await asyncio.to_thread(self.guess_merlin, observation)
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        """Async variant of :meth:`make_statement` run on a worker thread."""
+        return await asyncio.to_thread(self.make_statement, observation, phase)
+
     def _build_discussion_context(
         self, observation: AgentObservation, phase: DiscussionPhase
     ) -> str:
@@ -1262,7 +1395,7 @@ ask questions, or change the topic."""
             # Extract just the JSON part
             json_text = text[first_brace : last_brace + 1]
             try:
-                return json.loads(json_text)
+                return json_codec.loads(json_text)
             except json.JSONDecodeError:
                 pass  # Fall through to other parsing attempts
 
@@ -1280,7 +1413,7 @@ ask questions, or change the topic."""
                 text = "\n".join(code_lines)
 
         try:
-            return json.loads(text)
+            return json_codec.loads(text)
         except json.JSONDecodeError as e:
             # Log the parsing failure for debugging
             print(f"Warning: Failed to parse JSON response: {e}")
@@ -1311,6 +1444,7 @@ class GeminiClient(BaseLLMClient):
     max_retries: int = 3
     base_retry_delay: float = 1.0
     request_delay: float = 2.1  # Delay between requests to stay under 30 RPM
+    _system_prompt_cache: dict[RoleType, str] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Configure API client and warn about deprecation."""
@@ -1333,17 +1467,22 @@ class GeminiClient(BaseLLMClient):
         genai.configure(api_key=self.api_key)
         self._model = genai.GenerativeModel(self.model_name)
         self._last_request_time: float = 0.0
+        # Serialises the proactive delay when async callers run on worker threads
+        self._request_lock = threading.Lock()
 
-    def _generate_text(self, prompt: str) -> str:
+    def _generate_text(self, prompt: str, system_prompt: str | None = None) -> str:
         """Generate text completion from prompt with retry logic for rate limits."""
+        # The system prompt leads the text so Gemini's implicit prefix caching applies
+        prompt = self._join_prompt(prompt, system_prompt)
         # Proactive rate limiting: ensure minimum delay between requests
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            time.sleep(sleep_time)
-
-        self._last_request_time = time.time()
+        with self._request_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self._last_request_time
+            if time_since_last_request < self.request_delay:
+                sleep_time = self.request_delay - time_since_last_request
+                time.sleep(sleep_time)
+
+            self._last_request_time = time.time()
         last_exception = None
 
         for attempt in range(self.max_retries):
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import requests  # type: ignore[import-untyped]
 
+from .enums import RoleType
 from .exceptions import ConfigurationError
+from .http_session import stream_chat_completion, thread_session
 from .llm_client import BaseLLMClient
 
 
@@ -24,6 +26,8 @@ class OpenAIClient(BaseLLMClient):
     The API caches the longest prefix of a prompt that has been previously seen,
     offering a 50% discount on cached tokens. Cache is valid for 5-10 minutes of
     inactivity and always cleared within 1 hour. No code changes needed - it's automatic!
+    The static game and role guidance is sent as a leading system message so that
+    prefix stays identical between calls.
 
     Inherits all prompt building and decision logic from BaseLLMClient,
     only implementing the API-specific __post_init__ and _generate_text methods.
@@ -35,6 +39,8 @@ class OpenAIClient(BaseLLMClient):
     max_retries: int = 3
     base_retry_delay: float = 1.0
     enable_cache_logging: bool = False  # Set to True to log cache hit statistics
+    stream_responses: bool = False  # Stream replies and stop as soon as the JSON closes
+    _system_prompt_cache: dict[RoleType, str] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Configure API client."""
@@ -46,27 +52,35 @@ class OpenAIClient(BaseLLMClient):
                 "Get your API key from https://platform.openai.com/api-keys"
             )
 
-    def _generate_text(self, prompt: str) -> str:
+    def _generate_text(self, prompt: str, system_prompt: str | None = None) -> str:
         """Generate text completion from prompt using OpenAI API."""
         last_exception = None
+        # A stable leading system message is what provider prompt caching keys on
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        url = "https://api.openai.com/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_completion_tokens": 1000,
+            "reasoning_effort": "minimal",  # Minimize reasoning tokens to reduce cost
+        }
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
-                    url="https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model_name,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": self.temperature,
-                        "max_completion_tokens": 1000,
-                        "reasoning_effort": "minimal",  # Minimize reasoning tokens to reduce cost
-                    },
-                    timeout=30,
-                )
+                # Streaming ends the request once the JSON reply closes; usage stats
+                # only arrive at the end of a stream, so cache logging needs a full reply
+                if self.stream_responses and not self.enable_cache_logging:
+                    return stream_chat_completion(url, headers, payload)
+
+                response = thread_session().post(url=url, headers=headers, json=payload, timeout=30)
                 response.raise_for_status()
                 result = response.json()
 
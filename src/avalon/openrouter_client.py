@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import requests  # type: ignore[import-untyped]
 
+from .enums import RoleType
 from .exceptions import ConfigurationError
+from .http_session import stream_chat_completion, thread_session
 from .llm_client import BaseLLMClient
 
 
@@ -39,6 +41,8 @@ class OpenRouterClient(BaseLLMClient):
     base_retry_delay: float = 1.0
     site_url: str = "https://github.com/matthewgroves/avalon"
     site_name: str = "Avalon Game"
+    stream_responses: bool = False  # Stream replies and stop as soon as the JSON closes
+    _system_prompt_cache: dict[RoleType, str] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Configure API client and warn about deprecation."""
@@ -63,28 +67,34 @@ class OpenRouterClient(BaseLLMClient):
             )
         # Don't call parent __post_init__ since we're not using Gemini
 
-    def _generate_text(self, prompt: str) -> str:
+    def _generate_text(self, prompt: str, system_prompt: str | None = None) -> str:
         """Generate text completion from prompt using OpenRouter API."""
         last_exception = None
+        # A stable leading system message is what provider prompt caching keys on
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+
+        url = "https://openrouter.ai/api/v1/chat/completions"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": self.site_url,
+            "X-Title": self.site_name,
+        }
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": 1000,
+        }
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
-                    url="https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                        "HTTP-Referer": self.site_url,
-                        "X-Title": self.site_name,
-                    },
-                    json={
-                        "model": self.model_name,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": self.temperature,
-                        "max_tokens": 1000,
-                    },
-                    timeout=30,
-                )
+                if self.stream_responses:
+                    return stream_chat_completion(url, headers, payload)
+
+                response = thread_session().post(url=url, headers=headers, json=payload, timeout=30)
                 response.raise_for_status()
                 result = response.json()
                 return result["choices"][0]["message"]["content"]
@@ -0,0 +1,51 @@
+"""User-facing status and result reporting for game launchers."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol, TextIO
+
+if TYPE_CHECKING:
+    from .interaction import InteractionResult
+
+
+class Reporter(Protocol):
+    """Destination for launcher status lines and the end-of-game summary."""
+
+    def message(self, text: str = "") -> None: ...
+
+    def game_end(self, result: InteractionResult) -> None: ...
+
+
+class NullReporter:
+    """Reporter that discards everything (headless and self-play runs)."""
+
+    def message(self, text: str = "") -> None:
+        pass
+
+    def game_end(self, result: InteractionResult) -> None:
+        pass
+
+
+@dataclass
+class CLIReporter:
+    """Reporter writing to a text stream, one write per summary."""
+
+    stream: TextIO = field(default_factory=lambda: sys.stdout)
+
+    def message(self, text: str = "") -> None:
+        self.stream.write(text + "\n")
+
+    def game_end(self, result: InteractionResult) -> None:
+        state = result.state
+        winner = state.final_winner.value.title() if state.final_winner else "Unknown"
+        self.stream.write(
+            "\n=== Game Complete ===\n"
+            f"Winner: {winner}\n"
+            f"Final Score: Resistance {state.resistance_score} - {state.minion_score} Minions\n"
+            f"Rounds played: {state.round_number}\n"
+        )
+
+
+__all__ = ["CLIReporter", "NullReporter", "Reporter"]
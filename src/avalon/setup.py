@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Tuple
 
 from .config import GameConfig
 from .enums import PlayerType
@@ -38,6 +39,23 @@ class SetupResult:
     players: Tuple[Player, ...]
     briefings: Tuple[PlayerBriefing, ...]
     seed: Optional[int]
+    # Read-only lookups built once; the properties hand out the same views
+    _players_by_id: Mapping[PlayerId, Player] = field(init=False, repr=False, compare=False)
+    _knowledge_by_player: Mapping[PlayerId, KnowledgePacket] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        players = {player.player_id: player for player in self.players}
+        knowledge = {briefing.player.player_id: briefing.knowledge for briefing in self.briefings}
+        object.__setattr__(self, "_players_by_id", MappingProxyType(players))
+        object.__setattr__(self, "_knowledge_by_player", MappingProxyType(knowledge))
+
+    @property
+    def players_by_id(self) -> Mapping[PlayerId, Player]:
+        """Return a read-only mapping from player id to player."""
+
+        return self._players_by_id
 
     @property
     def public_lobby(self) -> Tuple[str, ...]:
@@ -46,18 +64,18 @@ class SetupResult:
         return tuple(player.display_name for player in self.players)
 
     @property
-    def knowledge_by_player(self) -> dict[PlayerId, KnowledgePacket]:
-        """Return a mapping from player id to knowledge packet."""
+    def knowledge_by_player(self) -> Mapping[PlayerId, KnowledgePacket]:
+        """Return a read-only mapping from player id to knowledge packet."""
 
-        return {briefing.player.player_id: briefing.knowledge for briefing in self.briefings}
+        return self._knowledge_by_player
 
     def knowledge_for(self, player_id: str) -> KnowledgePacket:
         """Retrieve the knowledge packet associated with ``player_id``."""
 
-        for briefing in self.briefings:
-            if briefing.player.player_id == player_id:
-                return briefing.knowledge
-        raise KeyError(f"Unknown player id: {player_id}")
+        try:
+            return self._knowledge_by_player[player_id]
+        except KeyError:
+            raise KeyError(f"Unknown player id: {player_id}") from None
 
 
 def perform_setup(
@@ -133,7 +151,7 @@ def _normalize_registrations(
 
         lowered = display_name.casefold()
         if lowered in seen_names:
-            raise ConfigurationError("Duplicate player name detected: " f"{display_name}")
+            raise ConfigurationError(f"Duplicate player name detected: {display_name}")
         seen_names.add(lowered)
 
         player_id = registration.player_id
@@ -142,7 +160,7 @@ def _normalize_registrations(
             if not cleaned_id:
                 raise ConfigurationError("Player identifiers must be non-empty when provided")
             if cleaned_id in seen_ids:
-                raise ConfigurationError("Duplicate player identifier detected: " f"{cleaned_id}")
+                raise ConfigurationError(f"Duplicate player identifier detected: {cleaned_id}")
             seen_ids.add(cleaned_id)
             normalized.append(
                 PlayerRegistration(
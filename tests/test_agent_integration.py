@@ -2,16 +2,51 @@
 
 from __future__ import annotations
 
-from avalon.agent_manager import AgentManager
+import asyncio
+import threading
+from typing import Generator, Iterable
+
+from avalon.agent_manager import AgentManager, RateLimitedClient
+from avalon.agents import (
+    AgentObservation,
+    AssassinationGuess,
+    DiscussionResponse,
+    MissionAction,
+    TeamProposal,
+    VoteDecision,
+)
 from avalon.config import GameConfig
+from avalon.discussion import DiscussionConfig, DiscussionPhase
 from avalon.enums import PlayerType
 from avalon.game_state import GamePhase
-from avalon.interaction import run_interactive_game
-from avalon.mock_llm_client import create_simple_agent_strategy
-from avalon.roles import build_role_list
+from avalon.interaction import InteractionLogEntry, run_interactive_game
+from avalon.mock_llm_client import MockLLMClient, create_simple_agent_strategy
+from avalon.roles import RoleType, build_role_list
 from avalon.setup import PlayerRegistration, perform_setup
 
 
+class AsyncMockClient(MockLLMClient):
+    """Mock client exposing coroutine variants that record call order."""
+
+    async def apropose_team(self, observation: AgentObservation) -> TeamProposal:
+        return self.propose_team(observation)
+
+    async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+        await asyncio.sleep(0)
+        return VoteDecision(approve=observation.player_id != "player_2")
+
+    async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+        return self.execute_mission(observation)
+
+    async def aguess_merlin(self, observation: AgentObservation) -> AssassinationGuess:
+        return self.guess_merlin(observation)
+
+    async def amake_statement(
+        self, observation: AgentObservation, phase: DiscussionPhase
+    ) -> DiscussionResponse:
+        return self.make_statement(observation, phase)
+
+
 def test_all_agent_game_completes() -> None:
     """A game with all agent players completes successfully."""
     # Create 5 agent players
@@ -35,6 +70,69 @@ def test_all_agent_game_completes() -> None:
     assert result.state.final_winner is not None
 
 
+def test_discussions_follow_the_phase_being_played() -> None:
+    """Each phase opens with its discussion; post-mission talk only precedes a new round."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5), random_seed=42)
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, MockLLMClient())
+
+    result = run_interactive_game(config, registrations=registrations, agent_manager=agent_mgr)
+
+    headers = [
+        entry.message.split("---")[1].strip()
+        for entry in result.transcript
+        if entry.message.startswith("\n--- ")
+    ]
+    state = result.state
+    assert headers.count("Pre-Proposal Discussion") == len(state.vote_history)
+    assert headers.count("Pre-Vote Discussion") == len(state.vote_history)
+    assert headers.count("Post-Mission Discussion") == len(state.mission_history) - 1
+    assert headers.count("Pre-Assassination Discussion") == (state.assassination is not None)
+
+
+def test_mission_explanations_cover_only_the_current_team() -> None:
+    """Each post-mission block quotes that mission's team, not earlier missions."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+    ]
+    config = GameConfig(
+        player_count=5,
+        roles=build_role_list(5),
+        random_seed=42,
+        discussion_config=DiscussionConfig(enabled=False),
+    )
+    setup = perform_setup(config, registrations)
+    client = MockLLMClient(
+        execute_mission_fn=lambda obs: MissionAction(
+            success=True, public_reasoning=f"{obs.player_id} on mission {obs.round_number}"
+        )
+    )
+    agent_mgr = AgentManager.from_setup(setup, client)
+
+    result = run_interactive_game(config, registrations=registrations, agent_manager=agent_mgr)
+
+    blocks: list[list[str]] = []
+    for entry in result.transcript:
+        if entry.message == "\nPlayers explain their actions:":
+            blocks.append([])
+        elif blocks and entry.message.startswith("  ") and "on mission" in entry.message:
+            blocks[-1].append(entry.message)
+    missions = result.state.mission_history
+    assert len(blocks) == len(missions)
+    for block, mission in zip(blocks, missions, strict=True):
+        names = {
+            player_id: result.state.players_by_id[player_id].display_name
+            for player_id in mission.team
+        }
+        assert block == [
+            f'  {names[player_id]}: "{player_id} on mission {mission.round_number}"'
+            for player_id in mission.team
+        ]
+
+
 def test_mixed_human_agent_game() -> None:
     """A game with mix of human and agent players works correctly."""
     # 2 humans, 3 agents
@@ -122,3 +220,453 @@ def test_agent_manager_generates_decisions() -> None:
     # Test assassination guess
     guess = agent_mgr.guess_merlin("player_1", state)
     assert guess.target_id in [p.player_id for p in state.players]
+
+
+def test_vote_on_team_batch_preserves_voter_order() -> None:
+    """Batched votes from an async client are returned in the requested order."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, AsyncMockClient())
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    player_ids = [p.player_id for p in state.players]
+
+    assert agent_mgr.supports_async
+    decisions = asyncio.run(agent_mgr.vote_on_team_batch(player_ids, state))
+
+    assert [d.approve for d in decisions] == [pid != "player_2" for pid in player_ids]
+
+
+def test_execute_mission_batch_plays_cards_concurrently() -> None:
+    """Agent mission cards are requested together and returned in team order."""
+    in_flight = 0
+    peak = 0
+
+    class SlowClient(AsyncMockClient):
+        async def aexecute_mission(self, observation: AgentObservation) -> MissionAction:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MissionAction(success=observation.player_id != "player_3")
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, SlowClient())
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    team = ["player_3", "player_1", "player_4"]
+    actions = asyncio.run(agent_mgr.execute_mission_batch(team, state))
+
+    assert [action.success for action in actions] == [False, True, True]
+    assert peak == 3
+
+
+def test_make_statements_concurrently_overlaps_speakers() -> None:
+    """Simultaneous statements from an async client are awaited together."""
+    in_flight = 0
+    peak = 0
+
+    class SlowClient(AsyncMockClient):
+        async def amake_statement(
+            self, observation: AgentObservation, phase: DiscussionPhase
+        ) -> DiscussionResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return DiscussionResponse(message=f"hello from {observation.player_id}")
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, SlowClient())
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    speakers = ["player_2", "player_5"]
+    responses = asyncio.run(
+        agent_mgr.make_statements_concurrently(speakers, state, DiscussionPhase.PRE_VOTE)
+    )
+
+    assert [response.message for response in responses] == [
+        "hello from player_2",
+        "hello from player_5",
+    ]
+    assert peak == 2
+
+
+def test_all_agent_game_completes_with_async_client() -> None:
+    """Concurrent vote collection drives a full game to completion."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5), random_seed=42)
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, AsyncMockClient())
+
+    result = run_interactive_game(config, registrations=registrations, agent_manager=agent_mgr)
+
+    assert result.state.phase == GamePhase.GAME_OVER
+    assert result.state.votes
+    assert all(record.rejections in ((), ("player_2",)) for record in result.state.votes)
+
+
+def test_streamed_proposal_reasoning_is_written_in_chunks() -> None:
+    """Streaming clients reach write_stream piecewise; the transcript keeps one entry."""
+
+    class StreamingClient(MockLLMClient):
+        def propose_team_stream(
+            self, observation: AgentObservation
+        ) -> Generator[str, None, TeamProposal]:
+            proposal = self.propose_team(observation)
+            yield "Trust "
+            yield "this team."
+            return proposal
+
+    class StreamingIO:
+        def __init__(self) -> None:
+            self.streams: list[list[str]] = []
+
+        def read(self, prompt: str) -> str:
+            raise AssertionError("all players are agents")
+
+        read_hidden = read
+
+        def write(self, message: str) -> None:
+            pass
+
+        def write_stream(self, chunks: Iterable[str]) -> None:
+            self.streams.append(list(chunks))
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+    ]
+    config = GameConfig(
+        player_count=5,
+        roles=build_role_list(5),
+        random_seed=42,
+        discussion_config=DiscussionConfig(enabled=False),
+    )
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, StreamingClient())
+    io = StreamingIO()
+
+    result = run_interactive_game(
+        config, io=io, registrations=registrations, agent_manager=agent_mgr, setup=setup
+    )
+
+    assert io.streams
+    assert io.streams[0][1:] == ["this team.", '"']
+    assert io.streams[0][0].endswith(' says: "Trust ')
+    said = [entry.message for entry in result.transcript if ' says: "Trust' in entry.message]
+    assert len(said) == len(io.streams)
+    assert all(message.endswith(' says: "Trust this team."') for message in said)
+
+
+def test_agents_vote_while_humans_are_prompted() -> None:
+    """Agent votes are in flight while the human's hidden vote is being read."""
+    human_voted = threading.Event()
+
+    class WaitingClient(AsyncMockClient):
+        async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+            # Only approves if the human answered while this call was pending
+            answered = await asyncio.to_thread(human_voted.wait, 5)
+            return VoteDecision(approve=answered)
+
+    class HumanIO:
+        def read(self, prompt: str) -> str:
+            raise AssertionError("only a hidden vote is expected")
+
+        def read_hidden(self, prompt: str) -> str:
+            human_voted.set()
+            return "y"
+
+        def write(self, message: str) -> None:
+            pass
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(4)
+    ] + [PlayerRegistration("Human")]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, WaitingClient())
+
+    from avalon.game_state import GameState
+    from avalon.interaction import _handle_team_vote
+
+    state = GameState.from_setup(setup)
+    state.propose_team(state.current_leader.player_id, state.all_player_ids[:2])
+    log: list[InteractionLogEntry] = []
+    _handle_team_vote(state, HumanIO(), log, agent_manager=agent_mgr)
+
+    assert state.votes[-1].approvals == state.all_player_ids
+
+
+def test_rate_limited_client_bounds_concurrency() -> None:
+    """RateLimitedClient never lets more than max_concurrent calls run at once."""
+    in_flight = 0
+    peak = 0
+
+    class SlowClient(AsyncMockClient):
+        async def avote_on_team(self, observation: AgentObservation) -> VoteDecision:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return VoteDecision(approve=True)
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations)
+    client = RateLimitedClient(SlowClient(), max_requests_per_minute=600, max_concurrent=2)
+    agent_mgr = AgentManager.from_setup(setup, client)
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    player_ids = [p.player_id for p in state.players]
+    decisions = asyncio.run(agent_mgr.vote_on_team_batch(player_ids, state))
+
+    assert len(decisions) == 5
+    assert peak == 2
+
+
+def test_rate_limited_client_reserves_staggered_slots() -> None:
+    """Once the bucket is empty, each caller is given its own later slot."""
+    client = RateLimitedClient(MockLLMClient(), max_requests_per_minute=60)
+    client._request_bucket.available = 0.0
+
+    delays = [client._reserve_capacity() for _ in range(3)]
+
+    assert delays[0] > 0
+    assert delays[1] - delays[0] > 0.9
+    assert delays[2] - delays[1] > 0.9
+
+
+def test_batch_vote_on_team_groups_voters_with_shared_knowledge() -> None:
+    """Only voters with shared private knowledge are marshaled into one request."""
+    batches: list[tuple[str, ...]] = []
+
+    class BatchingClient(MockLLMClient):
+        def vote_on_team_batch(self, observations: list[AgentObservation]) -> list[VoteDecision]:
+            batches.append(tuple(obs.player_id for obs in observations))
+            return [VoteDecision(approve=True) for _ in observations]
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(7)
+    ]
+    config = GameConfig(player_count=7, roles=build_role_list(7))
+    setup = perform_setup(config, registrations, seed=3)
+    agent_mgr = AgentManager.from_setup(setup, BatchingClient())
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    player_ids = [p.player_id for p in state.players]
+    decisions = asyncio.run(agent_mgr.batch_vote_on_team(player_ids, state))
+
+    assert len(decisions) == 7
+    merlin_id = next(p.player_id for p in state.players if p.role is RoleType.MERLIN)
+    assert all(merlin_id not in batch for batch in batches)
+    for batch in batches:
+        alignments = {state.players_by_id[pid].alignment for pid in batch}
+        assert len(alignments) == 1
+
+
+def test_batch_vote_on_team_sends_groups_and_individual_voters_together() -> None:
+    """Shared-prompt groups and individual voters are all in flight at once."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(7)
+    ]
+    config = GameConfig(player_count=7, roles=build_role_list(7))
+    setup = perform_setup(config, registrations, seed=3)
+    requests = 0
+    lock = threading.Lock()
+    # Every request blocks until all of them have started, so a serial run deadlocks
+    started = threading.Event()
+
+    class BatchingClient(MockLLMClient):
+        def vote_on_team_batch(self, observations: list[AgentObservation]) -> list[VoteDecision]:
+            self._wait_for_others()
+            return [VoteDecision(approve=True) for _ in observations]
+
+        def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
+            self._wait_for_others()
+            return VoteDecision(approve=False)
+
+        def _wait_for_others(self) -> None:
+            nonlocal requests
+            with lock:
+                requests += 1
+                if requests == expected:
+                    started.set()
+            assert started.wait(timeout=2), "requests were not sent concurrently"
+
+    agent_mgr = AgentManager.from_setup(setup, BatchingClient())
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    player_ids = [p.player_id for p in state.players]
+    # Minions share one prompt, as do resistance players without role knowledge
+    expected = 2 + sum(
+        1
+        for briefing in setup.briefings
+        if briefing.player.alignment.value == "resistance" and briefing.knowledge.has_information
+    )
+
+    decisions = asyncio.run(agent_mgr.batch_vote_on_team(player_ids, state))
+
+    assert len(decisions) == 7
+    assert requests == expected
+
+
+def test_clients_can_decline_vote_batching() -> None:
+    """A client with ``batch_votes = False`` votes concurrently instead of batching."""
+
+    class DecliningClient(AsyncMockClient):
+        batch_votes = False
+
+        def vote_on_team_batch(self, observations: list[AgentObservation]) -> list[VoteDecision]:
+            raise AssertionError("batching was not requested")
+
+    class BatchingClient(DecliningClient):
+        batch_votes = True
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5), random_seed=42)
+    setup = perform_setup(config, registrations)
+
+    assert AgentManager.from_setup(setup, BatchingClient()).supports_batch_votes
+    declining = AgentManager.from_setup(setup, DecliningClient())
+    assert not declining.supports_batch_votes
+    assert declining.supports_async
+
+    result = run_interactive_game(config, registrations=registrations, agent_manager=declining)
+    assert result.state.phase is GamePhase.GAME_OVER
+
+
+def test_observation_reused_until_state_changes() -> None:
+    """Observations are memoized per state version and rebuilt after mutations."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations, seed=11)
+    agent_mgr = AgentManager.from_setup(setup, MockLLMClient())
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    leader_id = state.current_leader.player_id
+    first = agent_mgr.observation_for(leader_id, state)
+    assert agent_mgr.observation_for(leader_id, state) is first
+
+    team = [p.player_id for p in state.players[: state.config.mission_config.team_sizes[0]]]
+    state.propose_team(leader_id, team)
+    refreshed = agent_mgr.observation_for(leader_id, state)
+    assert refreshed is not first
+    assert refreshed.current_team == tuple(team)
+
+
+def test_observations_share_public_statement_snapshot() -> None:
+    """Players observing the same statements share one tuple until the log grows."""
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    config = GameConfig(player_count=5, roles=build_role_list(5))
+    setup = perform_setup(config, registrations, seed=2)
+    agent_mgr = AgentManager.from_setup(setup, MockLLMClient())
+    statements: list[tuple[str, str, str]] = [("player_1", "vote", "Looks fine")]
+    agent_mgr.set_public_statements(statements)
+
+    from avalon.game_state import GameState
+
+    state = GameState.from_setup(setup)
+    first = agent_mgr.observation_for("player_1", state)
+    second = agent_mgr.observation_for("player_2", state)
+    assert first.public_statements is second.public_statements
+
+    statements.append(("player_2", "vote", "Agreed"))
+    refreshed = agent_mgr.observation_for("player_1", state)
+    assert len(refreshed.public_statements) == 2
+
+
+def test_fast_mode_plays_deterministic_game_without_client_calls() -> None:
+    """Rule-based fast mode finishes a seeded game identically on every run."""
+
+    def fail(_: AgentObservation) -> VoteDecision:
+        raise AssertionError("fast mode must not call the client")
+
+    def play() -> tuple[object, int, int]:
+        registrations = [
+            PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+        ]
+        config = GameConfig(player_count=5, roles=build_role_list(5), random_seed=7)
+        setup = perform_setup(config, registrations)
+        client = MockLLMClient(vote_on_team_fn=fail)
+        agent_mgr = AgentManager.from_setup(setup, client, fast_mode=True)
+        result = run_interactive_game(
+            config, registrations=registrations, agent_manager=agent_mgr, setup=setup
+        )
+        assert result.state.phase == GamePhase.GAME_OVER
+        return (
+            result.state.final_winner,
+            result.state.resistance_score,
+            result.state.minion_score,
+        )
+
+    assert play() == play()
+
+
+def test_simultaneous_statements_use_one_batch_per_round() -> None:
+    """Simultaneous discussion asks every agent together and records each statement."""
+    batch_sizes: list[int] = []
+
+    class BatchStatementClient(MockLLMClient):
+        def make_statement_batch(
+            self, observations: list[AgentObservation], phase: DiscussionPhase
+        ) -> list[DiscussionResponse]:
+            batch_sizes.append(len(observations))
+            # Everyone in the batch sees the same history
+            assert len({len(obs.discussion_statements) for obs in observations}) == 1
+            return [DiscussionResponse(message=f"{obs.player_id} speaks") for obs in observations]
+
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(1, 6)
+    ]
+    config = GameConfig(
+        player_count=5,
+        roles=build_role_list(5),
+        random_seed=42,
+        discussion_config=DiscussionConfig(simultaneous_agent_statements=True),
+    )
+    setup = perform_setup(config, registrations)
+    agent_mgr = AgentManager.from_setup(setup, BatchStatementClient())
+
+    result = run_interactive_game(config, registrations=registrations, agent_manager=agent_mgr)
+
+    assert agent_mgr.supports_batch_statements
+    assert batch_sizes and set(batch_sizes) == {5}
+    statements = result.state.all_discussion_statements
+    assert len(statements) == 5 * len(batch_sizes)
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
+import pytest
+
 from avalon.agents import (
     AgentObservation,
     AssassinationGuess,
+    AsyncAgentDecisionMaker,
+    DiscussionResponse,
     MissionAction,
+    SyncToAsyncAdapter,
     TeamProposal,
     VoteDecision,
     build_observation,
 )
 from avalon.config import GameConfig
+from avalon.discussion import DiscussionPhase
 from avalon.enums import Alignment
 from avalon.game_state import GamePhase, GameState
 from avalon.mock_llm_client import MockLLMClient, create_simple_agent_strategy
@@ -62,6 +71,62 @@ def test_build_observation_basic() -> None:
     assert observation.required_fail_count == 1
 
 
+def test_observation_is_hashable_and_slotted() -> None:
+    """Observations hash by value and carry no per-instance __dict__."""
+    registrations = [PlayerRegistration(name) for name in ("A", "B", "C", "D", "E")]
+    setup = perform_setup(GameConfig(player_count=5, roles=build_role_list(5)), registrations)
+    state = GameState.from_setup(setup)
+    briefing = setup.briefings[0]
+
+    first = build_observation(state, briefing.player.player_id, briefing.knowledge)
+    second = build_observation(state, briefing.player.player_id, briefing.knowledge)
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert not hasattr(first, "__dict__")
+
+
+def test_observations_of_one_turn_share_public_fields() -> None:
+    """Every agent's view of the same turn references the same public tuples."""
+    registrations = [PlayerRegistration(name) for name in ("A", "B", "C", "D", "E")]
+    setup = perform_setup(GameConfig(player_count=5, roles=build_role_list(5)), registrations)
+    state = GameState.from_setup(setup)
+
+    first, second = (
+        build_observation(state, briefing.player.player_id, briefing.knowledge)
+        for briefing in setup.briefings[:2]
+    )
+
+    for name in (
+        "all_player_ids",
+        "all_player_names",
+        "vote_history",
+        "mission_history",
+        "discussion_statements",
+    ):
+        assert getattr(first, name) is getattr(second, name), name
+
+
+def test_build_observation_alignment_matches_role() -> None:
+    """Observation alignment agrees with each player's role alignment."""
+    registrations = [PlayerRegistration(f"Player{i}") for i in range(7)]
+    setup = perform_setup(GameConfig.default(7), registrations, seed=5)
+    state = GameState.from_setup(setup)
+
+    for briefing in setup.briefings:
+        observation = build_observation(state, briefing.player.player_id, briefing.knowledge)
+        assert observation.alignment is briefing.player.alignment
+
+
+def test_build_observation_rejects_non_game_state() -> None:
+    """build_observation validates its state argument in debug runs."""
+    registrations = [PlayerRegistration(f"Player{i}") for i in range(5)]
+    setup = perform_setup(GameConfig.default(5), registrations)
+
+    with pytest.raises(TypeError, match="GameState"):
+        build_observation(object(), "player_1", setup.briefings[0].knowledge)  # type: ignore[arg-type]
+
+
 def test_build_observation_includes_knowledge() -> None:
     """build_observation preserves role-based knowledge."""
     registrations = [PlayerRegistration(f"Player{i}") for i in range(5)]
@@ -381,3 +446,34 @@ def test_mock_llm_client_fallback_behavior() -> None:
 
     guess = mock_client.guess_merlin(observation)
     assert guess.target_id in observation.all_player_ids
+
+
+def test_sync_to_async_adapter_overlaps_blocking_calls() -> None:
+    """Adapted sync votes run on worker threads, so gathered calls overlap."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class BlockingClient(MockLLMClient):
+        def vote_on_team(self, observation: AgentObservation) -> VoteDecision:
+            barrier.wait()  # Deadlocks (and times out) unless all three run at once
+            return VoteDecision(approve=observation.player_id != "player_2")
+
+        # AgentDecisionMaker passes the phase as a plain string
+        def make_statement(self, observation: AgentObservation, phase: str) -> DiscussionResponse:
+            return super().make_statement(observation, DiscussionPhase(phase))
+
+    registrations = [PlayerRegistration(f"Player{i}") for i in range(5)]
+    setup = perform_setup(GameConfig(player_count=5, roles=build_role_list(5)), registrations)
+    state = GameState.from_setup(setup)
+    observations = [
+        build_observation(state, briefing.player.player_id, briefing.knowledge)
+        for briefing in setup.briefings[:3]
+    ]
+    adapter = SyncToAsyncAdapter(BlockingClient())
+
+    async def collect() -> list[VoteDecision]:
+        return list(await asyncio.gather(*(adapter.avote_on_team(obs) for obs in observations)))
+
+    decisions = asyncio.run(collect())
+
+    assert isinstance(adapter, AsyncAgentDecisionMaker)
+    assert [d.approve for d in decisions] == [obs.player_id != "player_2" for obs in observations]
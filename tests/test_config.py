@@ -4,7 +4,7 @@ import pytest
 
 from avalon.config import TEAM_SIZE_TABLE, GameConfig, MissionConfig
 from avalon.discussion import DiscussionConfig
-from avalon.enums import RoleType
+from avalon.enums import Alignment, RoleType
 from avalon.exceptions import ConfigurationError
 
 
@@ -16,12 +16,21 @@ def test_mission_config_matches_reference_table(player_count: int) -> None:
     assert mission_config.required_fail_counts == (1, 1, 1, expected_fail, 1)
 
 
+def test_mission_config_is_shared_between_game_configs() -> None:
+    config = GameConfig.default(7)
+    assert MissionConfig.for_player_count(7) is config.mission_config
+    assert config.with_roles(config.roles).mission_config is config.mission_config
+    with pytest.raises(ConfigurationError):
+        MissionConfig.for_player_count(11)
+
+
 def test_game_config_default_roles_validate() -> None:
     config = GameConfig.default(7)
     assert config.player_count == 7
     assert len(config.roles) == 7
     assert config.mission_config.team_sizes == TEAM_SIZE_TABLE[7]
     assert config.alignment_counts == (4, 3)
+    assert config.role_alignment_counts() == {Alignment.RESISTANCE: 4, Alignment.MINION: 3}
 
 
 def test_game_config_rejects_invalid_role_counts() -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+import os
 import tempfile
 from pathlib import Path
 
@@ -54,6 +56,7 @@ briefing:
         assert not setup.briefing_options.pause_after_each
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_with_multiple_optional_roles() -> None:
@@ -102,6 +105,7 @@ random_seed: 42
         assert setup.briefing_options.pause_after_each
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_missing_players() -> None:
@@ -119,6 +123,7 @@ optional_roles:
             load_config_file(config_path)
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_invalid_role() -> None:
@@ -139,10 +144,13 @@ optional_roles:
         config_path = f.name
 
     try:
-        with pytest.raises(ConfigurationError, match="Unknown role type"):
+        with pytest.raises(
+            ConfigurationError, match=r"Unknown role type: invalid_role\. Available: assassin, "
+        ):
             load_config_file(config_path)
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_file_not_found() -> None:
@@ -194,6 +202,7 @@ optional_roles:
         assert setup.registrations[4].player_type is PlayerType.AGENT
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_invalid_player_type() -> None:
@@ -214,6 +223,7 @@ optional_roles: []
             load_config_file(config_path)
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_player_missing_name() -> None:
@@ -233,6 +243,7 @@ optional_roles: []
             load_config_file(config_path)
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_with_player_ids() -> None:
@@ -274,6 +285,7 @@ optional_roles: []
         assert registrations[2].player_type == PlayerType.HUMAN
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
 
 
 def test_load_config_invalid_player_id_type() -> None:
@@ -294,3 +306,87 @@ optional_roles: []
             load_config_file(config_path)
     finally:
         Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
+
+
+def test_load_config_with_rate_limits() -> None:
+    """Parse the optional LLM rate limit section."""
+    yaml_content = """
+players: [a, b, c, d, e]
+
+rate_limits:
+  max_requests_per_minute: 30
+  max_concurrent: 2
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(yaml_content)
+        config_path = f.name
+
+    try:
+        setup = load_config_file(config_path)
+        assert setup.rate_limits is not None
+        assert setup.rate_limits.max_requests_per_minute == 30
+        assert setup.rate_limits.max_concurrent == 2
+        assert setup.rate_limits.max_tokens_per_minute == 150_000
+    finally:
+        Path(config_path).unlink()
+        Path(config_path + ".cache.json").unlink(missing_ok=True)
+
+
+def test_load_config_invalid_rate_limit() -> None:
+    """Reject non-positive or unknown rate limit options."""
+    for section in ("max_concurrent: 0", "burst: 3"):
+        yaml_content = f"""
+players: [a, b, c, d, e]
+
+rate_limits:
+  {section}
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(yaml_content)
+            config_path = f.name
+
+        try:
+            with pytest.raises(ConfigurationError):
+                load_config_file(config_path)
+        finally:
+            Path(config_path).unlink()
+            Path(config_path + ".cache.json").unlink(missing_ok=True)
+
+
+def test_load_config_reuses_json_cache_until_yaml_changes(tmp_path: Path) -> None:
+    """A fresh JSON cache is read instead of the YAML; edits invalidate it."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("players: [a, b, c, d, e]\nrandom_seed: 1\n")
+    cache_path = tmp_path / "config.yaml.cache.json"
+
+    assert load_config_file(config_path).game_config.random_seed == 1
+    assert cache_path.exists()
+
+    cached = json.loads(cache_path.read_text())
+    cached["data"]["random_seed"] = 7
+    cache_path.write_text(json.dumps(cached))
+    assert load_config_file(config_path).game_config.random_seed == 7
+
+    config_path.write_text("players: [a, b, c, d, e]\nrandom_seed: 2\n")
+    os.utime(config_path, ns=(cached["mtime_ns"] + 1, cached["mtime_ns"] + 1))
+    assert load_config_file(config_path).game_config.random_seed == 2
+
+
+def test_config_loader_prefers_libyaml_parser() -> None:
+    import yaml
+
+    from avalon import config_loader
+
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert config_loader.SafeLoader is expected
+
+
+def test_load_config_normalizes_role_names(tmp_path: Path) -> None:
+    """Role names are matched case-insensitively, ignoring surrounding whitespace."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("players: [a, b, c, d, e]\noptional_roles: ['  Mordred ']\n")
+
+    roles = load_config_file(config_path).game_config.roles
+
+    assert roles.count(RoleType.MORDRED) == 1
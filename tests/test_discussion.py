@@ -225,6 +225,38 @@ def test_discussion_round_has_spoken() -> None:
     assert not round_discussion.has_spoken("player2")
 
 
+def test_discussion_round_indexes_initial_statements() -> None:
+    """Statements passed at construction are indexed by speaker."""
+    stmt = DiscussionStatement(
+        speaker_id="player1",
+        message="Restored",
+        round_number=1,
+        attempt_number=1,
+        phase=DiscussionPhase.PRE_VOTE,
+    )
+    round_discussion = DiscussionRound(
+        round_number=1,
+        attempt_number=1,
+        phase=DiscussionPhase.PRE_VOTE,
+        statements=[stmt],
+    )
+
+    assert round_discussion.has_spoken("player1")
+    assert round_discussion.get_statements_by_player("player1") == [stmt]
+
+
+def test_discussion_round_is_slotted() -> None:
+    """Rounds are created per phase in long simulations, so they carry no __dict__."""
+    round_discussion = DiscussionRound(
+        round_number=1,
+        attempt_number=1,
+        phase=DiscussionPhase.PRE_VOTE,
+    )
+
+    assert not hasattr(round_discussion, "__dict__")
+    assert "by_speaker" in DiscussionRound.__slots__
+
+
 def test_discussion_round_to_tuple() -> None:
     """Test converting discussion round to immutable tuple."""
     round_discussion = DiscussionRound(
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from types import MappingProxyType
 
+import pytest
+
+from avalon import json_codec
 from avalon.enums import Alignment
 from avalon.events import (
     EventLog,
@@ -58,3 +62,124 @@ def test_player_and_alignment_filters_include_authorised_private_events() -> Non
     assert public_event in log.events_for_player("p1")
     assert private_player_event not in log.public_events()
     assert private_alignment_event not in log.public_events()
+
+
+def test_events_normalise_containers_once_and_hand_out_copies() -> None:
+    event = GameEvent(
+        timestamp=datetime.now(timezone.utc),
+        type=GameEventType.TEAM_PROPOSED,
+        payload=MappingProxyType({"leader_id": "p1"}),
+        audience=[player_audience_tag("p1")],  # type: ignore[arg-type]
+    )
+
+    assert type(event.payload) is dict
+    assert event.audience == (player_audience_tag("p1"),)
+    encoded = event.to_json()
+    data = event.to_dict()
+    assert data["audience"] == [player_audience_tag("p1")]
+    data["payload"]["leader_id"] = "mutated"
+    data["audience"].append("someone")
+    assert event.payload == {"leader_id": "p1"}
+    assert event.audience == (player_audience_tag("p1"),)
+    assert event.to_json() == encoded == json_codec.dumps_compact(event.to_dict())
+    log = EventLog([event])
+    assert EventLog.from_jsonl(log.to_jsonl()).events == (event,)
+
+
+def test_from_dict_decodes_enum_values_and_members() -> None:
+    event = GameEvent(
+        timestamp=datetime.now(timezone.utc),
+        type=GameEventType.GAME_COMPLETED,
+        visibility=EventVisibility.PRIVATE,
+        audience=(player_audience_tag("p1"),),
+    )
+    data = event.to_dict()
+
+    assert data["type"] == "game_completed"
+    assert data["visibility"] == "private"
+    assert GameEvent.from_dict(data) == event
+    as_members = {**data, "type": event.type, "visibility": event.visibility}
+    assert GameEvent.from_dict(as_members) == event
+    with pytest.raises(ValueError):
+        GameEvent.from_dict({**data, "type": "not_an_event"})
+
+
+def test_indexed_queries_keep_append_order_across_buckets() -> None:
+    p1, p2 = player_audience_tag("p1"), player_audience_tag("p2")
+    minions = alignment_audience_tag(Alignment.MINION)
+    log = EventLog()
+    first = log.record(GameEventType.TEAM_PROPOSED)
+    secret = log.record(
+        GameEventType.TEAM_VOTE_RECORDED,
+        visibility=EventVisibility.PRIVATE,
+        audience=[p1, minions],
+    )
+    tagged_public = log.record(GameEventType.MISSION_RESOLVED, audience=[p2])
+    other = log.record(
+        GameEventType.PHASE_CHANGED, visibility=EventVisibility.PRIVATE, audience=[p2]
+    )
+
+    assert log.events_for_player("p1", extra_tags=[minions]) == (first, secret, tagged_public)
+    assert log.query(audience_tags=[p2], include_public=False) == (tagged_public, other)
+    assert log.query(audience_tags=["unknown"], include_public=False) == ()
+    assert log.query(include_private=True) == log.events
+
+    rebuilt = EventLog.from_jsonl(log.to_jsonl())
+    assert rebuilt.events_for_alignment(Alignment.MINION) == (first, secret, tagged_public)
+
+
+def test_to_jsonl_reuses_each_events_encoded_line() -> None:
+    log = EventLog()
+    event = log.record(GameEventType.TEAM_PROPOSED, {"leader_id": "p1", "team": ["p1", "p2"]})
+    first = log.to_jsonl()
+
+    assert event.to_json() is event.to_json()
+    assert log.to_jsonl() == first
+    log.record(GameEventType.PHASE_CHANGED, {"phase": "team_vote"})
+    lines = log.to_jsonl().split("\n")
+    assert lines[0] == first
+    assert EventLog.from_jsonl("\n".join(lines)).events == log.events
+
+
+def test_events_tuple_is_shared_until_the_log_grows() -> None:
+    log = EventLog()
+    log.record(GameEventType.TEAM_PROPOSED)
+    snapshot = log.events
+
+    assert log.events is snapshot
+    assert log.query(include_private=True) is snapshot
+    log.record(GameEventType.PHASE_CHANGED)
+    assert len(log.events) == 2
+    assert log.events[0] is snapshot[0]
+
+
+def test_from_jsonl_skips_blank_lines_and_keeps_unicode_separators() -> None:
+    log = EventLog()
+    log.record(GameEventType.DISCUSSION_STATEMENT, {"message": "line\u2028break"})
+    log.record(GameEventType.PHASE_CHANGED, {"phase": "team_vote"})
+    lines = log.to_jsonl().split("\n")
+    raw = "\n" + lines[0] + "\r\n  \n" + lines[1]
+
+    assert EventLog.from_jsonl(raw).events == log.events
+    assert EventLog.from_jsonl("").events == ()
+
+
+def test_audience_tags_are_shared_strings() -> None:
+    player_id = "".join(["p", "42"])
+    assert player_audience_tag(player_id) is player_audience_tag("p42")
+    assert alignment_audience_tag(Alignment.MINION) is alignment_audience_tag("minion")
+    assert alignment_audience_tag(Alignment.RESISTANCE) == "alignment:resistance"
+
+
+def test_from_dict_copies_the_callers_payload() -> None:
+    data = GameEvent(
+        timestamp=datetime.now(timezone.utc),
+        type=GameEventType.TEAM_PROPOSED,
+        payload={"team": ["p1"]},
+    ).to_dict()
+    payload = dict(data["payload"])
+    data["payload"] = payload
+
+    event = GameEvent.from_dict(data)
+    assert event.payload == payload
+    assert event.payload is not payload
@@ -0,0 +1,106 @@
+"""Tests for the rule-based bitmask agents."""
+
+from __future__ import annotations
+
+import pytest
+
+from avalon.agent_manager import AgentManager
+from avalon.config import GameConfig
+from avalon.enums import Alignment, PlayerType, RoleType
+from avalon.fast_agents import (
+    approve_team,
+    guess_merlin,
+    iter_seats,
+    pick_team,
+    play_success,
+    simulate_game,
+    simulate_setups,
+    vote_passes,
+)
+from avalon.game_state import GamePhase, GameState, MissionDecision
+from avalon.mock_llm_client import MockLLMClient
+from avalon.setup import PlayerRegistration, perform_setup
+
+
+def test_iter_seats_lists_set_bits_in_order() -> None:
+    assert list(iter_seats(0b10110)) == [1, 2, 4]
+    assert list(iter_seats(0)) == []
+
+
+def test_pick_team_includes_leader_and_skips_avoided_seats() -> None:
+    assert pick_team(self_seat=3, team_size=3, player_count=5, avoid_mask=0b00011) == 0b11100
+    # Falls back to avoided seats when too few others remain
+    assert pick_team(self_seat=0, team_size=3, player_count=5, avoid_mask=0b11110) == 0b00111
+
+
+def test_approve_team_rules() -> None:
+    # Fifth proposal is always approved
+    assert approve_team(0b11, 4, False, 0, 0b11, consecutive_rejections=4)
+    # Resistance rejects teams with suspects other than themselves
+    assert not approve_team(0b00011, 4, False, 0, 0b00001, 0)
+    assert approve_team(0b10010, 4, False, 0, 0b10000, 0)
+    # Minions approve teams carrying a known minion
+    assert approve_team(0b00101, 4, True, 0b00100, 0, 0)
+    assert not approve_team(0b00011, 4, True, 0b00100, 0, 0)
+
+
+def test_vote_passes_needs_a_strict_majority() -> None:
+    assert vote_passes(0b00111, 5)
+    assert not vote_passes(0b000111, 6)
+    assert vote_passes(0b1110001, 7)
+
+
+def test_mission_and_assassination_choices() -> None:
+    assert play_success(is_minion=False)
+    assert not play_success(is_minion=True)
+    assert guess_merlin(player_count=5, self_seat=0, known_minion_mask=0b00010) == 2
+
+
+def _play_fast_game(state: GameState, manager: AgentManager) -> Alignment | None:
+    while state.phase is not GamePhase.GAME_OVER:
+        if state.phase is GamePhase.TEAM_PROPOSAL:
+            leader_id = state.current_leader.player_id
+            state.propose_team(leader_id, manager.propose_team(leader_id, state).team)
+        elif state.phase is GamePhase.TEAM_VOTE:
+            state.vote_on_team(
+                {pid: manager.vote_on_team(pid, state).approve for pid in state.all_player_ids}
+            )
+        elif state.phase is GamePhase.MISSION:
+            state.submit_mission(
+                {
+                    pid: MissionDecision.SUCCESS
+                    if manager.execute_mission(pid, state).success
+                    else MissionDecision.FAIL
+                    for pid in state.current_team or ()
+                }
+            )
+        else:
+            assassin = next(p for p in state.players if p.role is RoleType.ASSASSIN)
+            target = manager.guess_merlin(assassin.player_id, state).target_id
+            state.perform_assassination(assassin.player_id, target)
+    return state.final_winner
+
+
+@pytest.mark.parametrize("player_count", [5, 7, 10])
+def test_simulate_setups_matches_game_state_rollouts(player_count: int) -> None:
+    config = GameConfig.default(player_count)
+    registrations = [
+        PlayerRegistration(f"Agent {i}", player_type=PlayerType.AGENT)
+        for i in range(1, player_count + 1)
+    ]
+    setups = [perform_setup(config, registrations, seed=seed) for seed in range(8)]
+
+    expected = []
+    for setup in setups:
+        state = GameState.from_setup(setup)
+        manager = AgentManager.from_setup(setup, MockLLMClient(), fast_mode=True)
+        expected.append(_play_fast_game(state, manager) is Alignment.RESISTANCE)
+    assert simulate_setups(setups) == expected
+
+
+def test_simulate_game_resolves_the_assassination() -> None:
+    # Nobody knows anything and everyone is resistance: three clean missions
+    assert simulate_game((2, 3, 2, 3, 3), (1,) * 5, 0, [0] * 5)
+    # Knowing nobody, the assassin (seat 4) guesses seat 0
+    assert not simulate_game((2, 3, 2, 3, 3), (1,) * 5, 0, [0] * 5, merlin_seat=0, assassin_seat=4)
+    assert simulate_game((2, 3, 2, 3, 3), (1,) * 5, 0, [0] * 5, merlin_seat=1, assassin_seat=4)
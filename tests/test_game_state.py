@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from avalon.config import GameConfig
-from avalon.enums import Alignment, RoleType
+from avalon.enums import Alignment, PlayerType, RoleType
 from avalon.events import EventLog, GameEventType
 from avalon.exceptions import InvalidActionError
 from avalon.game_state import (
@@ -151,6 +153,8 @@ def test_initial_state_configuration_matches_setup() -> None:
     assert state.current_leader.player_id == state.players[0].player_id
     assert state.resistance_score == 0
     assert state.minion_score == 0
+    assert state.all_player_ids == tuple(player.player_id for player in state.players)
+    assert state.all_player_names == tuple(player.display_name for player in state.players)
 
 
 def test_propose_team_happy_path_transitions_to_vote() -> None:
@@ -162,6 +166,17 @@ def test_propose_team_happy_path_transitions_to_vote() -> None:
     assert state.phase is GamePhase.TEAM_VOTE
 
 
+def test_propose_team_keeps_tuple_and_copies_other_sequences() -> None:
+    state = _default_state(5)
+    team = tuple(_team_members(state, state.required_team_size))
+    assert state.propose_team(state.current_leader.player_id, team) is team
+
+    state = _default_state(5)
+    proposal = state.propose_team(state.current_leader.player_id, list(team))
+    assert isinstance(proposal, tuple)
+    assert state.current_team == team
+
+
 def test_propose_team_rejects_wrong_leader() -> None:
     state = _default_state(5)
     team_size = state.config.mission_config.team_sizes[state.round_number - 1]
@@ -199,6 +214,25 @@ def test_vote_requires_all_players() -> None:
         state.vote_on_team(votes)
 
 
+def test_vote_rejects_extra_voters_and_non_boolean_votes() -> None:
+    state = _default_state(5)
+    team_size = state.config.mission_config.team_sizes[state.round_number - 1]
+    team = _team_members(state, team_size)
+    state.propose_team(state.current_leader.player_id, team)
+    votes = {player.player_id: True for player in state.players}
+    with pytest.raises(InvalidActionError, match="every registered player"):
+        state.vote_on_team({**votes, "intruder": True})
+    for not_a_bool in (1, 0, None):
+        with pytest.raises(InvalidActionError, match="boolean"):
+            state.vote_on_team({**votes, team[0]: not_a_bool})  # type: ignore[dict-item]
+    assert state.vote_history == []
+
+    votes[team[0]] = False
+    record = state.vote_on_team(votes)
+    assert record.rejections == (team[0],)
+    assert record.approvals == tuple(pid for pid in state.all_player_ids if pid != team[0])
+
+
 def test_vote_rejection_rotates_leader_and_increments_attempt() -> None:
     state = _default_state(5)
     team_size = state.config.mission_config.team_sizes[state.round_number - 1]
@@ -271,6 +305,7 @@ def test_mission_failure_increments_minion_score() -> None:
     record = _run_mission(state, team, decisions)
     assert record.result is MissionResult.FAILURE
     assert state.minion_score == 1
+    assert record.successful_actors == frozenset(team) - {failing_minion}
     assert state.phase is GamePhase.TEAM_PROPOSAL
 
 
@@ -397,8 +432,10 @@ def test_actions_blocked_once_game_over() -> None:
     state.perform_assassination(assassin_id, merlin_id)
     team_size = state.config.mission_config.team_sizes[0]
     team = _team_members(state, team_size)
-    with pytest.raises(InvalidActionError):
+    with pytest.raises(InvalidActionError, match="already over"):
         state.propose_team(state.current_leader.player_id, team)
+    with pytest.raises(InvalidActionError, match="already over"):
+        state.submit_mission({})
 
 
 def test_team_proposal_emits_events_when_log_attached() -> None:
@@ -416,6 +453,42 @@ def test_team_proposal_emits_events_when_log_attached() -> None:
     assert event_types[1] is GameEventType.TEAM_PROPOSED
 
 
+def test_auto_fail_events_follow_the_phase_change() -> None:
+    state = _default_state(5)
+    log = EventLog()
+    state.event_log = log
+    for _ in range(5):
+        state.propose_team(
+            state.current_leader.player_id, _team_members(state, state.required_team_size)
+        )
+        state.vote_on_team({player.player_id: False for player in state.players})
+
+    tail = log.events[-3:]
+    assert [event.type for event in tail] == [
+        GameEventType.PHASE_CHANGED,
+        GameEventType.MISSION_AUTO_FAILED,
+        GameEventType.GAME_COMPLETED,
+    ]
+    assert tail[0].payload == {"phase": "game_over"}
+    assert tail[2].payload == {"winner": "minion", "reason": "five_consecutive_rejections"}
+
+
+def test_vote_event_payload_matches_the_record() -> None:
+    state = _default_state(5)
+    log = EventLog()
+    state.event_log = log
+    state.propose_team(
+        state.current_leader.player_id, _team_members(state, state.required_team_size)
+    )
+    record = state.vote_on_team_mask(0b00111)
+
+    payload = log.events[-2].payload
+    assert log.events[-2].type is GameEventType.TEAM_VOTE_RECORDED
+    assert payload["approvals"] == list(record.approvals) == list(state.all_player_ids[:3])
+    assert payload["rejections"] == list(record.rejections) == list(state.all_player_ids[3:])
+    assert payload["approved"] is True
+
+
 def test_mission_four_requires_two_fail_cards() -> None:
     state = _reach_round_four_state()
     team_size = state.config.mission_config.team_sizes[state.round_number - 1]
@@ -472,8 +545,12 @@ def test_resistance_player_cannot_submit_fail_decision() -> None:
     _approve_team(state, team)
     decisions = {pid: MissionDecision.SUCCESS for pid in team}
     decisions[team[0]] = MissionDecision.FAIL
-    with pytest.raises(InvalidActionError):
+    with pytest.raises(InvalidActionError, match="may not fail"):
         state.submit_mission(decisions)
+    decisions[team[0]] = "fail"  # type: ignore[assignment]
+    with pytest.raises(InvalidActionError, match="SUCCESS or FAIL"):
+        state.submit_mission(decisions)
+    assert state.mission_history == []
 
 
 def test_invalid_phase_actions_raise_errors() -> None:
@@ -485,7 +562,9 @@ def test_invalid_phase_actions_raise_errors() -> None:
     team_size = state.config.mission_config.team_sizes[state.round_number - 1]
     team = _team_members(state, team_size)
     state.propose_team(state.current_leader.player_id, team)
-    with pytest.raises(InvalidActionError):
+    with pytest.raises(
+        InvalidActionError, match="requires phase mission, current phase is team_vote"
+    ):
         state.submit_mission({pid: MissionDecision.SUCCESS for pid in team})
 
 
@@ -521,6 +600,58 @@ def test_private_actions_are_obfuscated_but_deterministic() -> None:
     assert sorted(seq_one) == sorted(team)
 
 
+def test_mission_decisions_must_match_the_team_exactly() -> None:
+    state = _default_state(5)
+    team_size = state.config.mission_config.team_sizes[state.round_number - 1]
+    team = _team_members(state, team_size)
+    outsider = state.all_player_ids[team_size]
+    _approve_team(state, team)
+    decisions = {pid: MissionDecision.SUCCESS for pid in team}
+    for bad in (
+        {**decisions, outsider: MissionDecision.SUCCESS},
+        {**{pid: decisions[pid] for pid in team[1:]}, outsider: MissionDecision.SUCCESS},
+        {pid: decisions[pid] for pid in team[1:]},
+    ):
+        with pytest.raises(InvalidActionError, match="mission team only"):
+            state.submit_mission(bad)
+    assert state.submit_mission(decisions).team == team
+
+
+def test_obfuscation_permutes_cards_differently_per_seed_and_attempt() -> None:
+    state = _default_state(5)
+    actions = [
+        MissionAction(player_id=pid, decision=MissionDecision.SUCCESS)
+        for pid in state.all_player_ids
+    ]
+    orders = set()
+    for seed in range(40):
+        state.seed = seed
+        for attempt in (1, 2):
+            shuffled = state._obfuscate_actions(
+                list(actions), round_number=1, attempt_number=attempt
+            )
+            assert sorted(shuffled, key=lambda a: a.player_id) == actions
+            orders.add(tuple(action.player_id for action in shuffled))
+    assert len(orders) > 20
+
+
+def test_obfuscation_order_is_pinned_across_processes() -> None:
+    # No salted hash() or RNG state is involved, so saved games replay the same order
+    state = _default_state(5, seed=17)
+    actions = [
+        MissionAction(player_id=pid, decision=MissionDecision.SUCCESS)
+        for pid in state.all_player_ids
+    ]
+    shuffled = state._obfuscate_actions(actions, round_number=2, attempt_number=3)
+    assert [action.player_id for action in shuffled] == [
+        "player_4",
+        "player_2",
+        "player_5",
+        "player_1",
+        "player_3",
+    ]
+
+
 def test_auto_fail_summary_flagged_publicly() -> None:
     state = _default_state(5)
     record = None
@@ -535,3 +666,249 @@ def test_auto_fail_summary_flagged_publicly() -> None:
     summary = state.public_missions[-1]
     assert summary.auto_fail
     assert summary.fail_count == 0
+
+
+def test_seat_bitsets_track_agents_and_alignment() -> None:
+    registrations = [
+        PlayerRegistration("Agent", player_type=PlayerType.AGENT),
+        PlayerRegistration("B"),
+        PlayerRegistration("C"),
+        PlayerRegistration("D"),
+        PlayerRegistration("E"),
+    ]
+    setup = perform_setup(GameConfig.default(5), registrations, seed=5)
+    state = GameState.from_setup(setup)
+
+    agent_id = next(player.player_id for player in state.players if player.is_agent)
+    assert state.is_agent(agent_id)
+    assert not any(state.is_agent(p.player_id) for p in state.players if p.player_id != agent_id)
+    assert not state.is_agent("missing")
+
+    for player in state.players:
+        assert state.is_minion(player.player_id) is (player.alignment is Alignment.MINION)
+    assert state.minion_mask | state.resistance_mask == 0b11111
+    assert state.minion_mask & state.resistance_mask == 0
+
+
+def test_public_history_snapshots_are_shared_until_history_grows() -> None:
+    state = _default_state(5)
+    team = _team_members(state, state.config.mission_config.team_sizes[0])
+
+    empty = state.public_missions
+    _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+
+    assert len(state.public_missions) == 1 and empty == ()
+    assert state.public_missions is state.public_missions
+    assert state.votes is state.votes
+    assert state.missions is state.missions
+    assert state.missions == tuple(state.mission_history)
+    assert state.votes == tuple(state.vote_history)
+
+
+def test_mission_actions_of_extends_per_player_view() -> None:
+    state = _default_state(5)
+    team_size = state.config.mission_config.team_sizes[0]
+    team = _team_with_minion(state, team_size)
+    minion = next(pid for pid in team if state.players_by_id[pid].alignment is Alignment.MINION)
+    decisions = {pid: MissionDecision.SUCCESS for pid in team}
+    decisions[minion] = MissionDecision.FAIL
+    _run_mission(state, team, decisions)
+
+    first = state.mission_actions_of(minion)
+    assert first == ((1, 1, False),)
+    assert state.mission_actions_of(minion) is first
+
+    next_team = _team_members(state, state.config.mission_config.team_sizes[1])
+    _run_mission(state, next_team, {pid: MissionDecision.SUCCESS for pid in next_team})
+
+    assert state.mission_actions_of(minion) == ((1, 1, False), (2, 1, minion in next_team))
+
+
+def test_players_by_id_is_a_shared_read_only_view() -> None:
+    state = _default_state(5)
+    view = state.players_by_id
+
+    assert state.players_by_id is view
+    assert list(view) == list(state.all_player_ids)
+    with pytest.raises(TypeError):
+        view["intruder"] = state.players[0]  # type: ignore[index]
+
+
+def test_unlogged_actions_still_advance_the_version() -> None:
+    state = _default_state(5)
+    assert state.event_log is None
+    team_size = state.config.mission_config.team_sizes[state.round_number - 1]
+    team = _team_members(state, team_size)
+
+    before = state.version
+    state.propose_team(state.current_leader.player_id, team)
+    proposed = state.version
+    state.vote_on_team({pid: True for pid in state.all_player_ids})
+    assert before < proposed < state.version
+
+    state.event_log = EventLog()
+    state.submit_mission({pid: MissionDecision.SUCCESS for pid in team})
+    assert [event.type for event in state.event_log.events][:2] == [
+        GameEventType.MISSION_RESOLVED,
+        GameEventType.PHASE_CHANGED,
+    ]
+    assert state.event_log.events[0].payload["team"] == list(team)
+
+
+def test_team_proposal_tracks_seat_mask_and_rejects_bad_members() -> None:
+    state = _default_state(5)
+    leader = state.current_leader.player_id
+    team_size = state.config.mission_config.team_sizes[state.round_number - 1]
+    ids = state.all_player_ids
+    assert state.current_team_mask == 0
+
+    with pytest.raises(InvalidActionError, match="duplicate"):
+        state.propose_team(leader, (ids[1],) * team_size)
+    with pytest.raises(InvalidActionError, match="Unknown player id in team proposal: ghost"):
+        state.propose_team(leader, (ids[0], "ghost")[:team_size])
+    state.propose_team(leader, (ids[2], ids[0], ids[4])[:team_size])
+    assert state.current_team_mask == sum(1 << seat for seat in (2, 0, 4)[:team_size])
+
+    # Assigning the team directly (as loading a save does) is still picked up
+    state.current_team = (ids[3],)
+    assert state.current_team_mask == 1 << 3
+    state.current_team = None
+    assert state.current_team_mask == 0
+
+
+def test_mission_record_derives_successful_actors_once() -> None:
+    state = _default_state(5)
+    team = _team_members(state, state.required_team_size)
+    _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    record = state.mission_history[0]
+    assert record.successful_actors == frozenset(team)
+    assert record.successful_actors is record.successful_actors
+
+
+def test_public_missions_extend_with_shared_summaries() -> None:
+    state = _default_state(5)
+    team = _team_members(state, state.config.mission_config.team_sizes[0])
+    _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    first = state.public_missions
+    assert first[0] is state.mission_history[0].to_public_summary()
+
+    team = _team_members(state, state.config.mission_config.team_sizes[1])
+    _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    second = state.public_missions
+    assert len(second) == 2
+    assert second[0] is first[0]
+
+    state.mission_history = state.mission_history[1:]
+    assert state.public_missions == (second[1],)
+
+
+def test_phase_change_events_get_their_own_payloads() -> None:
+    state = _default_state(5)
+    state.event_log = EventLog()
+    team = _team_members(state, state.config.mission_config.team_sizes[0])
+    state.propose_team(state.current_leader.player_id, team)
+    state.vote_on_team({pid: False for pid in state.all_player_ids})
+
+    phase_events = [
+        event for event in state.event_log.events if event.type is GameEventType.PHASE_CHANGED
+    ]
+    assert [event.payload for event in phase_events] == [
+        {"phase": "team_vote"},
+        {"phase": "team_proposal"},
+    ]
+    assert phase_events[0].payload is not phase_events[1].payload
+    edited = replace(phase_events[0], payload={"phase": "edited"})
+    assert edited.payload == {"phase": "edited"}
+    assert phase_events[0].payload == {"phase": "team_vote"}
+    state.propose_team(state.current_leader.player_id, team)
+    repeated = state.event_log.events[-2]
+    assert repeated.payload == {"phase": "team_vote"}
+    assert repeated.payload is not phase_events[0].payload
+
+
+def test_history_snapshots_follow_reassigned_lists() -> None:
+    state = _default_state(5)
+    team = _team_members(state, state.config.mission_config.team_sizes[0])
+    _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    votes, missions, summaries = state.votes, state.missions, state.public_missions
+    assert state.votes is votes and state.missions is missions
+    assert state.public_missions is summaries
+
+    other = _default_state(5)
+    other_team = _team_members(other, other.config.mission_config.team_sizes[0])
+    _run_mission(other, other_team, {pid: MissionDecision.SUCCESS for pid in other_team})
+    state.vote_history = list(other.vote_history)
+    state.mission_history = list(other.mission_history)
+    assert state.votes[0] is other.vote_history[0]
+    assert state.missions[0] is other.mission_history[0]
+    assert state.public_missions[0] is other.mission_history[0].to_public_summary()
+
+
+def test_history_snapshots_follow_same_length_same_tail_reassignment() -> None:
+    state = _default_state(5)
+    for _ in range(2):
+        team = _team_members(state, state.config.mission_config.team_sizes[0])
+        state.propose_team(state.current_leader.player_id, team)
+        state.vote_on_team({player.player_id: False for player in state.players})
+    first, second = state.vote_history
+    assert state.votes == (first, second)
+
+    replacement = replace(first)
+    state.vote_history = [replacement, second]
+    assert state.votes[0] is replacement
+
+
+def test_turn_records_are_hashable_by_value() -> None:
+    actions = (MissionAction(player_id="p1", decision=MissionDecision.SUCCESS),)
+    first = MissionRecord(1, 1, ("p1",), 0, 1, MissionResult.SUCCESS, actions=actions)
+    second = MissionRecord(1, 1, ("p1",), 0, 1, MissionResult.SUCCESS, actions=actions)
+    second.to_public_summary()
+
+    assert first == second
+    assert len({first, second, first.to_public_summary(), second.to_public_summary()}) == 2
+    assert first.successful_actors == frozenset({"p1"})
+
+
+def test_vote_on_team_mask_matches_mapping_votes() -> None:
+    by_mask, by_mapping = _default_state(5), _default_state(5)
+    team = _team_members(by_mask, by_mask.config.mission_config.team_sizes[0])
+    for state in (by_mask, by_mapping):
+        state.propose_team(state.current_leader.player_id, team)
+
+    with pytest.raises(InvalidActionError, match="outside the table"):
+        by_mask.vote_on_team_mask(1 << 5)
+    record = by_mask.vote_on_team_mask(0b10110)
+    ids = by_mapping.all_player_ids
+    expected = by_mapping.vote_on_team({pid: seat in (1, 2, 4) for seat, pid in enumerate(ids)})
+    assert record == expected
+    assert by_mask.phase is by_mapping.phase is GamePhase.MISSION
+
+
+def test_required_team_size_and_fail_count_follow_the_round() -> None:
+    state = _default_state(7)
+    mission_config = state.config.mission_config
+    for round_number in range(1, 6):
+        state.round_number = round_number
+        assert state.required_team_size == mission_config.team_sizes[round_number - 1]
+        assert state.required_fail_count == mission_config.required_fail_counts[round_number - 1]
+    state.round_number = 4
+    assert state.required_fail_count == 2
+
+
+def test_reset_returns_to_the_opening_position() -> None:
+    state = _default_state(5)
+    state.event_log = EventLog()
+    team = _team_members(state, state.required_team_size)
+    first = _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    old_history = state.mission_history
+    version = state.version
+
+    state.reset()
+
+    assert state == _default_state(5)
+    assert state.event_log is None
+    assert state.version > version
+    assert state.missions == () and state.public_missions == ()
+    assert old_history == [first]
+    replay = _run_mission(state, team, {pid: MissionDecision.SUCCESS for pid in team})
+    assert replay == first
@@ -224,10 +224,12 @@ def test_all_discussion_statements_property(game_state: GameState) -> None:
         phase=DiscussionPhase.PRE_PROPOSAL,
     )
     game_state.add_discussion_statement(stmt1)
+    assert game_state.all_discussion_statements == (stmt1,)
     game_state.end_discussion()
 
     # Second discussion
     game_state.start_discussion(DiscussionPhase.PRE_VOTE)
+    assert game_state.all_discussion_statements == (stmt1,)
     stmt2 = DiscussionStatement(
         speaker_id=player_id,
         message="Second",
@@ -243,6 +245,7 @@ def test_all_discussion_statements_property(game_state: GameState) -> None:
     assert len(all_statements) == 2
     assert stmt1 in all_statements
     assert stmt2 in all_statements
+    assert game_state.all_discussion_statements is all_statements
 
 
 def test_all_discussion_statements_empty(game_state: GameState) -> None:
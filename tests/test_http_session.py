@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("requests")
+
+from avalon.http_session import close_sessions, thread_session  # noqa: E402
+
+
+def test_each_thread_reuses_its_own_session() -> None:
+    session = thread_session()
+    assert thread_session() is session
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker_session = pool.submit(thread_session).result()
+        assert pool.submit(thread_session).result() is worker_session
+    assert worker_session is not session
+
+
+def test_close_sessions_hands_out_fresh_sessions_afterwards() -> None:
+    session = thread_session()
+
+    close_sessions()
+
+    assert thread_session() is not session
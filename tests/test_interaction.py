@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
+
+import pytest
 
 from avalon.config import GameConfig
 from avalon.discussion import DiscussionConfig
-from avalon.enums import Alignment
+from avalon.enums import Alignment, RoleType
+from avalon.events import EventVisibility, alignment_audience_tag, player_audience_tag
 from avalon.game_state import GamePhase
 from avalon.interaction import (
     BriefingDeliveryMode,
     BriefingOptions,
+    CLIInteraction,
     InteractionEventType,
     InteractionIO,
+    InteractionLogEntry,
     InteractionResult,
     run_interactive_game,
 )
-from avalon.roles import ROLE_DEFINITIONS, RoleTag
+from avalon.roles import ROLE_DEFINITIONS, RoleTag, build_role_list
 from avalon.setup import PlayerRegistration, perform_setup
 
 
@@ -44,10 +49,24 @@ class ScriptedIO(InteractionIO):
         return self.responses.pop(0)
 
 
+class BlockIO(ScriptedIO):
+    def __init__(self, responses: Iterable[str]):
+        super().__init__(responses)
+        self.blocks: List[List[str]] = []
+
+    def write_lines(self, messages: Sequence[str]) -> None:
+        self.blocks.append(list(messages))
+        self.writes.extend(messages)
+
+
 def _play_resistance_victory(
     seed: int = 19,
     *,
     briefing_options: BriefingOptions | None = None,
+    io_type: type[ScriptedIO] = ScriptedIO,
+    approve: str = "y",
+    succeed: str = "success",
+    separator: str = " ",
 ) -> tuple[InteractionResult, ScriptedIO, str]:
     # Disable discussions for scripted tests
     discussion_config = DiscussionConfig(enabled=False)
@@ -76,9 +95,9 @@ def _play_resistance_victory(
         if RoleTag.ASSASSIN in ROLE_DEFINITIONS[player.role].tags
     )
 
-    team_one = " ".join(resistance_ids[:2])
-    team_two = " ".join(resistance_ids[:3])
-    team_three = " ".join(resistance_ids[:2])
+    team_one = separator.join(resistance_ids[:2])
+    team_two = separator.join(resistance_ids[:3])
+    team_three = separator.join(resistance_ids[:2])
     wrong_target = next(pid for pid in resistance_ids if pid != merlin_id)
 
     acknowledgement_responses: list[str] = []
@@ -90,18 +109,18 @@ def _play_resistance_victory(
     responses = [
         *acknowledgement_responses,
         team_one,
-        *["y"] * config.player_count,
-        *["success"] * 2,
+        *[approve] * config.player_count,
+        *[succeed] * 2,
         team_two,
-        *["y"] * config.player_count,
-        *["success"] * 3,
+        *[approve] * config.player_count,
+        *[succeed] * 3,
         team_three,
-        *["y"] * config.player_count,
-        *["success"] * 2,
+        *[approve] * config.player_count,
+        *[succeed] * 2,
         wrong_target,
     ]
 
-    scripted = ScriptedIO(responses)
+    scripted = io_type(responses)
     result = run_interactive_game(
         config,
         io=scripted,
@@ -136,6 +155,23 @@ def test_scripted_session_runs_full_resistance_victory() -> None:
     )
 
 
+@pytest.mark.parametrize(("approve", "succeed"), [("approve", "s"), ("A", "SUCCESS"), ("yes", "s")])
+def test_vote_and_mission_aliases_are_accepted(approve: str, succeed: str) -> None:
+    result, scripted, _ = _play_resistance_victory(approve=approve, succeed=succeed)
+
+    assert result.state.resistance_score == 3
+    assert not scripted.responses
+    assert "Please respond with y/n." not in scripted.writes
+
+
+@pytest.mark.parametrize("separator", [",", ", ", "  ", "\t", " ,\t"])
+def test_team_entries_accept_commas_and_any_whitespace(separator: str) -> None:
+    result, scripted, _ = _play_resistance_victory(separator=separator)
+
+    assert result.state.resistance_score == 3
+    assert not scripted.responses
+
+
 def test_transcript_filters_surface_only_visible_entries() -> None:
     result, _, assassin_id = _play_resistance_victory(seed=19)
     assert result.state.assassination is not None
@@ -161,6 +197,130 @@ def test_transcript_filters_surface_only_visible_entries() -> None:
     assert len(minion_alignment_entries) >= len(res_alignment_entries)
 
 
+def test_transcript_entries_stay_hashable() -> None:
+    result, _, _ = _play_resistance_victory(seed=19)
+
+    entry = result.transcript[0]
+    twin = InteractionLogEntry(
+        event=entry.event,
+        message=entry.message,
+        response=entry.response,
+        visibility=entry.visibility,
+        audience=entry.audience,
+    )
+    assert twin == entry
+    assert len({entry, twin}) == 1
+
+
+def test_indexed_transcript_queries_match_a_full_scan() -> None:
+    result, _, _ = _play_resistance_victory(seed=19)
+
+    def scan(tags: set[str]) -> tuple[InteractionLogEntry, ...]:
+        return tuple(
+            entry
+            for entry in result.transcript
+            if entry.visibility is EventVisibility.PUBLIC or tags & set(entry.audience)
+        )
+
+    for player in result.state.players:
+        tag = player_audience_tag(player.player_id)
+        assert result.transcript_for_player(player.player_id) == scan({tag})
+        extra = alignment_audience_tag(Alignment.MINION)
+        assert result.transcript_for_player(player.player_id, extra_tags=[extra]) == scan(
+            {tag, extra}
+        )
+    assert result.public_transcript() == scan(set())
+    assert result.transcript_for_player("player_1", include_private=True) == result.transcript
+
+
+def test_transcript_entries_share_audience_tuples() -> None:
+    result, _, _ = _play_resistance_victory(seed=19)
+
+    by_audience: dict[tuple[str, ...], set[int]] = {}
+    for entry in result.transcript:
+        by_audience.setdefault(entry.audience, set()).add(id(entry.audience))
+    assert len(by_audience) > 1
+    assert all(len(ids) == 1 for ids in by_audience.values())
+
+
+def test_line_blocks_reach_the_backend_in_one_call(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    result, blocked, _ = _play_resistance_victory(seed=19, io_type=BlockIO)
+    baseline, scripted, _ = _play_resistance_victory(seed=19)
+
+    assert isinstance(blocked, BlockIO)
+    roster = blocked.blocks[0]
+    assert roster[0] == "\nRoster:"
+    assert len(roster) == 1 + len(result.state.players)
+    assert blocked.blocks[-1][-1].startswith("Game over")
+    assert blocked.writes == scripted.writes
+    assert result.transcript == baseline.transcript
+    # Blocks are written together but still logged one line per entry
+    messages = [entry.message for entry in result.transcript]
+    start = messages.index("\nRoster:")
+    assert messages[start : start + len(roster)] == roster
+
+    CLIInteraction().write_lines(["first", "second"])
+    assert capsys.readouterr().out == "first\nsecond\n"
+
+
+def test_public_and_addressed_output_keep_their_metadata() -> None:
+    result, _, _ = _play_resistance_victory(seed=19)
+
+    outputs = [entry for entry in result.transcript if entry.event is InteractionEventType.OUTPUT]
+    public = [entry for entry in outputs if entry.visibility is EventVisibility.PUBLIC]
+    private = [entry for entry in outputs if entry.visibility is EventVisibility.PRIVATE]
+    assert public and private
+    assert all(entry == InteractionLogEntry(entry.event, entry.message) for entry in public)
+    assert all(entry.audience for entry in private)
+
+
+def test_briefings_describe_known_and_ambiguous_players() -> None:
+    config = GameConfig(
+        player_count=7,
+        roles=build_role_list(7, optional_roles=[RoleType.PERCIVAL, RoleType.MORGANA]),
+        discussion_config=DiscussionConfig(enabled=False),
+    )
+    registrations = [PlayerRegistration(f"P{index}") for index in range(7)]
+    scripted = ScriptedIO([])
+    with pytest.raises(AssertionError, match="No scripted response"):
+        run_interactive_game(config, io=scripted, seed=3, registrations=registrations)
+
+    players = {
+        player.role: player for player in perform_setup(config, registrations, seed=3).players
+    }
+    percival = players[RoleType.PERCIVAL]
+    briefing = next(
+        message
+        for message in scripted.writes
+        if message.startswith("Private briefing for " + percival.display_name)
+    )
+    assert f"({percival.player_id})\nRole: Percival\nAlignment: Resistance\n" in briefing
+    assert "Ambiguous intel: [" in briefing
+    assert briefing.endswith("each could be: Merlin or Morgana")
+
+    morgana = players[RoleType.MORGANA]
+    assassin = players[RoleType.ASSASSIN]
+    briefing = next(
+        message
+        for message in scripted.writes
+        if message.startswith("Private briefing for " + assassin.display_name)
+    )
+    assert f"{morgana.display_name} ({morgana.player_id}) - Morgana [Minion]" in briefing
+
+
+def test_optional_role_selection_drops_repeats_and_invalid_tokens() -> None:
+    from avalon.interaction import _prompt_optional_roles
+
+    scripted = ScriptedIO(["3, 1 3 9 1"])
+    log: list[InteractionLogEntry] = []
+
+    assert _prompt_optional_roles(scripted, log) == [RoleType.MORDRED, RoleType.PERCIVAL]
+    assert "  Warning: ignoring invalid selection '9'" in scripted.writes
+    assert scripted.writes[-1] == "Selected: Mordred, Percival"
+
+
 def test_briefings_can_require_acknowledgements() -> None:
     options = BriefingOptions(pause_before_each=True, pause_after_each=True)
     result, scripted, _ = _play_resistance_victory(seed=22, briefing_options=options)
@@ -0,0 +1,63 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from avalon import json_codec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    payload = {"speaker": "player_1", "approve": True, "team": ["a", "b"], "score": 2}
+
+    encoded = json_codec.dumps_compact(payload)
+
+    assert " " not in encoded
+    assert json_codec.loads(encoded) == payload
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("{not json")
+
+
+def test_non_string_keys_fall_back_to_stdlib() -> None:
+    assert json_codec.loads(json_codec.dumps_compact({1: "one"})) == {"1": "one"}
+
+
+def test_scanner_detects_object_end_across_chunks() -> None:
+    scanner = json_codec.JsonObjectScanner()
+    chunks = [
+        'Sure! {"approve": tr',
+        'ue, "public_reasoning": "a } in \\"quotes\\" {"',
+        "}",
+        " done",
+    ]
+
+    completed_at = [scanner.feed(chunk) for chunk in chunks]
+
+    assert completed_at == [False, False, True, True]
+
+
+def test_scanner_handles_nested_objects() -> None:
+    scanner = json_codec.JsonObjectScanner()
+    assert not scanner.feed('{"votes": [{"player_id": "p1"}')
+    assert scanner.feed("]}")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_lines_matches_per_object_encoding(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    records = [{"type": "phase_changed", "audience": ("player:a",)}, {1: "non-string key"}]
+
+    encoded = json_codec.dumps_lines(records)
+
+    assert encoded.split("\n") == [json_codec.dumps_compact(record) for record in records]
+    assert json_codec.dumps_lines([]) == ""
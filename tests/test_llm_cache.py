@@ -0,0 +1,112 @@
+"""Tests for persistent LLM response caching."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from avalon.agent_manager import AgentManager
+from avalon.agents import AgentObservation, VoteDecision
+from avalon.config import GameConfig
+from avalon.discussion import DiscussionPhase
+from avalon.enums import PlayerType
+from avalon.game_state import GameState
+from avalon.llm_cache import DiskCachedClient, decision_key
+from avalon.mock_llm_client import MockLLMClient
+from avalon.roles import build_role_list
+from avalon.setup import PlayerRegistration, perform_setup
+
+
+def _leader_observation() -> tuple[AgentManager, GameState, str]:
+    registrations = [
+        PlayerRegistration(f"Agent{i}", player_type=PlayerType.AGENT) for i in range(5)
+    ]
+    setup = perform_setup(
+        GameConfig(player_count=5, roles=build_role_list(5)), registrations, seed=42
+    )
+    state = GameState.from_setup(setup)
+    manager = AgentManager.from_setup(setup, MockLLMClient())
+    return manager, state, state.current_leader.player_id
+
+
+def test_decision_key_is_stable_and_scoped_to_method_and_model() -> None:
+    """Keys depend on the method, observation and model, not the process."""
+    manager, state, leader_id = _leader_observation()
+    observation = manager._build_observation(leader_id, state)
+
+    key = decision_key("vote_on_team", observation, "model-a")
+    assert key == decision_key("vote_on_team", observation, "model-a")
+    assert key != decision_key("propose_team", observation, "model-a")
+    assert key != decision_key("vote_on_team", observation, "model-b")
+
+
+def test_disk_cached_client_replays_from_disk(tmp_path: Path) -> None:
+    """A second cache over the same database answers without calling the client."""
+    manager, state, leader_id = _leader_observation()
+    observation = manager._build_observation(leader_id, state)
+    db_path = tmp_path / "cache.db"
+
+    recording = DiskCachedClient(MockLLMClient(), path=db_path)
+    proposal = recording.propose_team(observation)
+    statement = recording.make_statement(observation, DiscussionPhase.PRE_PROPOSAL)
+    assert recording.misses == 2
+    assert recording.propose_team(observation) == proposal
+    assert recording.hits == 1
+    recording.close()
+
+    def fail(*_: object) -> None:
+        raise AssertionError("client should not be called on a cache hit")
+
+    replay = DiskCachedClient(
+        MockLLMClient(propose_team_fn=fail),  # type: ignore[arg-type]
+        path=db_path,
+    )
+    assert replay.propose_team(observation) == proposal
+    assert replay.make_statement(observation, DiscussionPhase.PRE_PROPOSAL) == statement
+    assert replay.misses == 0
+    replay.close()
+
+
+def test_disk_cached_client_replays_and_slices_batches(tmp_path: Path) -> None:
+    """Decisions persist in SQLite and cached voters are served from a batch."""
+    manager, state, _ = _leader_observation()
+    observations = [manager._build_observation(p.player_id, state) for p in state.players]
+    db_path = tmp_path / "cache.db"
+    batch_sizes: list[int] = []
+
+    class BatchClient(MockLLMClient):
+        def vote_on_team_batch(self, pending: list[AgentObservation]) -> list[VoteDecision]:
+            batch_sizes.append(len(pending))
+            return [VoteDecision(approve=True, public_reasoning=o.player_id) for o in pending]
+
+    recording = DiskCachedClient(BatchClient(), path=db_path)
+    first = recording.vote_on_team_batch(observations[:3])
+    recording.close()
+
+    replay = DiskCachedClient(BatchClient(), path=db_path)
+    assert replay.vote_on_team_batch(observations[:2]) == first[:2]
+    assert batch_sizes == [3]
+
+    mixed = replay.vote_on_team_batch(observations)
+    assert mixed[:3] == first
+    assert [d.public_reasoning for d in mixed[3:]] == [o.player_id for o in observations[3:]]
+    assert batch_sizes == [3, 2]
+
+    proposal = replay.propose_team(observations[0])
+    assert asyncio.run(replay.apropose_team(observations[0])) == proposal
+    replay.close()
+
+
+def test_disk_cached_client_enabled_by_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Only AVALON_LLM_CACHE=1 wraps the client."""
+    client = MockLLMClient()
+    monkeypatch.delenv("AVALON_LLM_CACHE", raising=False)
+    assert DiskCachedClient.wrap_from_env(client) is client
+
+    monkeypatch.setenv("AVALON_LLM_CACHE", "1")
+    wrapped = DiskCachedClient.wrap_from_env(client, path=tmp_path / "cache.db")
+    assert isinstance(wrapped, DiskCachedClient)
+    assert wrapped.client is client
+    wrapped.close()
@@ -0,0 +1,23 @@
+"""Tests for the lazily loaded package namespace."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+import avalon
+
+
+def test_all_public_names_resolve() -> None:
+    """Every name in ``__all__`` resolves to the submodule's object."""
+    for name in avalon.__all__:
+        module = importlib.import_module(f"avalon.{avalon._LAZY[name]}")
+        assert getattr(avalon, name) is getattr(module, name)
+    assert set(avalon.__all__) <= set(dir(avalon))
+
+
+def test_unknown_attribute_raises() -> None:
+    """Unknown names raise AttributeError like a normal module."""
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        _ = avalon.Missing
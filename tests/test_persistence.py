@@ -84,3 +84,18 @@ def test_snapshot_can_be_saved_and_loaded(tmp_path: Path) -> None:
     assert restored.event_log is not None
     event_types = [event.type for event in restored.event_log.events]
     assert GameEventType.TEAM_VOTE_RECORDED in event_types
+
+
+def test_snapshot_event_entries_are_detached_from_the_live_log() -> None:
+    state = _build_progressed_state()
+    assert state.event_log is not None
+    first = state.event_log.events[0]
+    original = dict(first.payload)
+
+    snapshot = snapshot_game_state(state)
+    entry = snapshot.payload["event_log"][0]
+    entry["payload"]["tampered"] = True
+    entry["audience"].append("someone")
+
+    assert first.payload == original
+    assert "someone" not in first.audience
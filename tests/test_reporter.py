@@ -0,0 +1,46 @@
+"""Tests for launcher reporters."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from avalon.config import GameConfig
+from avalon.game_state import GameState
+from avalon.interaction import InteractionResult
+from avalon.reporter import CLIReporter, NullReporter
+from avalon.setup import PlayerRegistration, perform_setup
+
+
+def _result() -> InteractionResult:
+    config = GameConfig.default(5)
+    registrations = [PlayerRegistration(f"Player {i}") for i in range(1, 6)]
+    state = GameState.from_setup(perform_setup(config, registrations, seed=3))
+    return InteractionResult(state=state, transcript=())
+
+
+def test_cli_reporter_writes_messages_and_summary() -> None:
+    stream = io.StringIO()
+    reporter = CLIReporter(stream=stream)
+
+    reporter.message("hello")
+    reporter.message()
+    reporter.game_end(_result())
+
+    assert stream.getvalue() == (
+        "hello\n\n"
+        "\n=== Game Complete ===\n"
+        "Winner: Unknown\n"
+        "Final Score: Resistance 0 - 0 Minions\n"
+        "Rounds played: 1\n"
+    )
+
+
+def test_null_reporter_is_silent(capsys: pytest.CaptureFixture[str]) -> None:
+    reporter = NullReporter()
+
+    reporter.message("hello")
+    reporter.game_end(_result())
+
+    assert capsys.readouterr().out == ""
@@ -82,3 +82,21 @@ def test_player_type_flows_through_setup() -> None:
     assert result.players[2].player_type is PlayerType.HUMAN
     assert result.players[3].player_type is PlayerType.AGENT
     assert result.players[4].player_type is PlayerType.AGENT
+
+
+def test_setup_lookups_are_shared_read_only_views() -> None:
+    config = GameConfig.default(5)
+    registrations = [PlayerRegistration(f"Player {i}") for i in range(1, 6)]
+    result = perform_setup(config, registrations, seed=3)
+
+    assert result.players_by_id is result.players_by_id
+    assert result.knowledge_by_player is result.knowledge_by_player
+    for player in result.players:
+        assert result.players_by_id[player.player_id] is player
+        assert (
+            result.knowledge_for(player.player_id) is result.knowledge_by_player[player.player_id]
+        )
+    with pytest.raises(KeyError, match="Unknown player id: ghost"):
+        result.knowledge_for("ghost")
+    with pytest.raises(TypeError):
+        result.players_by_id["ghost"] = result.players[0]  # type: ignore[index]